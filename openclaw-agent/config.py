@@ -65,6 +65,7 @@ CONFIRM_ACTIONS: set[str] = {
     "git_commit",
     "install_dependencies",
     "file_write",
+    "append_file",
     "create_directory",
     "git_init",
     "git_add_all",
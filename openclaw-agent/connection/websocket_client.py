@@ -29,8 +29,35 @@ from websockets.asyncio.client import ClientConnection
 import config
 from router.action_router import route
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback.
+    orjson = None
+
 logger = logging.getLogger("chathan.connection")
 
+if orjson is not None:
+    def _encode(message: dict[str, Any]) -> bytes:
+        return orjson.dumps(message, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    _decode = orjson.loads
+else:
+    def _encode(message: dict[str, Any]) -> str:
+        return json.dumps(message, default=str)
+
+    _decode = json.loads
+
+
+async def _send_json(ws: ClientConnection, message: dict[str, Any]) -> None:
+    # ``text=True`` keeps orjson's bytes on the wire as a text frame.
+    await ws.send(_encode(message), text=True)
+
+
+# Control replies never change; encode them once.
+_EMERGENCY_STOP_ACK_FRAME = _encode({"type": "emergency_stop_ack", "status": "stopped"})
+_RESUME_ACK_FRAME = _encode({"type": "resume_ack", "status": "resumed"})
+_PONG_FRAME = _encode({"type": "pong"})
+
 
 async def run_agent() -> None:
     """
@@ -59,6 +86,22 @@ async def run_agent() -> None:
         delay = min(delay * 2, config.MAX_RECONNECT_DELAY_SECONDS)
 
 
+_SSL_CTX: ssl.SSLContext | None = None
+
+
+def _client_ssl_context() -> ssl.SSLContext:
+    """TLS context for the gateway, built once and reused across reconnects."""
+    global _SSL_CTX
+    if _SSL_CTX is None:
+        ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        # Accept self-signed certs from the gateway. In production, replace
+        # with a proper CA-signed cert and remove this override.
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+        _SSL_CTX = ctx
+    return _SSL_CTX
+
+
 async def _connect_and_listen() -> None:
     """Establish one WebSocket session and process messages until it closes."""
     if not config.AUTH_TOKEN:
@@ -73,13 +116,7 @@ async def _connect_and_listen() -> None:
 
     # Only configure TLS for wss:// endpoints. Passing ssl=... to ws://
     # raises ValueError in websockets and breaks reconnect loops.
-    ssl_ctx = None
-    if config.GATEWAY_URL.lower().startswith("wss://"):
-        # Accept self-signed certs from the gateway. In production, replace
-        # with a proper CA-signed cert and remove this override.
-        ssl_ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-        ssl_ctx.check_hostname = False
-        ssl_ctx.verify_mode = ssl.CERT_NONE
+    ssl_ctx = _client_ssl_context() if config.GATEWAY_URL.lower().startswith("wss://") else None
 
     async with websockets.connect(
         config.GATEWAY_URL,
@@ -109,15 +146,15 @@ async def _send_hello(ws: ClientConnection) -> None:
             config.AUTO_ACTIONS | config.CONFIRM_ACTIONS
         ),
     }
-    await ws.send(json.dumps(hello))
+    await _send_json(ws, hello)
     logger.debug("Sent hello: %s", hello)
 
 
 async def _handle_message(ws: ClientConnection, raw: str | bytes) -> None:
     """Parse one inbound frame and dispatch it."""
     try:
-        message: dict[str, Any] = json.loads(raw)
-    except (json.JSONDecodeError, TypeError):
+        message: dict[str, Any] = _decode(raw)
+    except (ValueError, TypeError):
         logger.warning("Received non-JSON frame — ignoring.")
         return
 
@@ -127,30 +164,24 @@ async def _handle_message(ws: ClientConnection, raw: str | bytes) -> None:
     if msg_type == "emergency_stop":
         logger.critical("EMERGENCY STOP received from gateway.")
         config.EMERGENCY_STOP = True
-        await ws.send(json.dumps({
-            "type": "emergency_stop_ack",
-            "status": "stopped",
-        }))
+        await ws.send(_EMERGENCY_STOP_ACK_FRAME, text=True)
         return
 
     if msg_type == "resume":
         logger.info("RESUME received from gateway.")
         config.EMERGENCY_STOP = False
-        await ws.send(json.dumps({
-            "type": "resume_ack",
-            "status": "resumed",
-        }))
+        await ws.send(_RESUME_ACK_FRAME, text=True)
         return
 
     if msg_type == "ping":
-        await ws.send(json.dumps({"type": "pong"}))
+        await ws.send(_PONG_FRAME, text=True)
         return
 
     # ----- Action requests -----
     if msg_type in ("action_request", "action"):
         response = await route(message)
         response["type"] = "action_response"
-        await ws.send(json.dumps(response, default=str))
+        await _send_json(ws, response)
         return
 
     logger.warning("Unknown message type '%s' — ignoring.", msg_type)
@@ -439,6 +439,51 @@ def _write_file_sync(filepath: str, content: str) -> None:
         fh.write(content)
 
 
+async def append_file(params: dict[str, Any]) -> dict[str, Any]:
+    """
+    Append content to a file inside the allowed roots, creating it if needed.
+
+    Lets the gateway grow log-style files (agent memory, registries) without
+    reading them back first.  With ``unless_contains``, nothing is appended
+    if the file already contains that text, which makes registry rows
+    idempotent.
+    """
+    filepath = _require_param(params, "file")
+    content = params.get("content", "")
+    unless_contains = params.get("unless_contains") or ""
+
+    if not isinstance(content, str):
+        return {"returncode": 1, "stdout": "", "stderr": "content must be a string."}
+    if not isinstance(unless_contains, str):
+        return {"returncode": 1, "stdout": "", "stderr": "unless_contains must be a string."}
+
+    if len(content.encode("utf-8")) > 1_048_576:
+        return {"returncode": 1, "stdout": "", "stderr": "Content exceeds 1 MB limit."}
+
+    loop = asyncio.get_running_loop()
+    try:
+        appended = await loop.run_in_executor(
+            None, _append_file_sync, filepath, content, unless_contains,
+        )
+    except OSError as exc:
+        return {"returncode": 1, "stdout": "", "stderr": str(exc)}
+
+    if not appended:
+        return {"returncode": 0, "stdout": f"{filepath} already up to date.", "stderr": ""}
+    return {"returncode": 0, "stdout": f"Appended {len(content)} bytes to {filepath}.", "stderr": ""}
+
+
+def _append_file_sync(filepath: str, content: str, unless_contains: str = "") -> bool:
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    with open(filepath, "a+", encoding="utf-8") as fh:
+        if unless_contains:
+            fh.seek(0)
+            if unless_contains in fh.read():
+                return False
+        fh.write(content)
+    return True
+
+
 async def create_directory(params: dict[str, Any]) -> dict[str, Any]:
     """Create a directory (and any missing parents)."""
     directory = _require_param(params, "directory")
@@ -682,6 +727,7 @@ ACTION_REGISTRY: dict[str, Any] = {
     "git_commit": git_commit,
     "install_dependencies": install_dependencies,
     "file_write": file_write,
+    "append_file": append_file,
     "create_directory": create_directory,
     "git_init": git_init,
     "git_add_all": git_add_all,
@@ -58,7 +58,7 @@ class ArchivistAgent:
         *,
         project: dict[str, Any],
     ) -> int:
-        tasks = await store.get_tasks(self.db, str(project["id"]))
+        tasks = await store.get_tasks(self.db, str(project["id"]), columns=("title", "status"))
         completed = sum(1 for t in tasks if t.get("status") == "completed")
         total = len(tasks)
         artifacts = await store.list_task_artifacts(self.db, project_id=str(project["id"]), limit=500)
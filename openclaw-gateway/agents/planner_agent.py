@@ -6,12 +6,13 @@ Dedicated planner role for decomposing idea context into executable plans.
 
 from __future__ import annotations
 
+import functools
 import json
-import re
 from typing import Any, Callable, Awaitable
 
 from ai.provider_router import ProviderRouter
 from ai.tool_defs import PLANNING_TOOLS
+import json_codec
 
 
 class PlannerAgent:
@@ -35,9 +36,11 @@ class PlannerAgent:
     ) -> tuple[str, list[dict[str, Any]]]:
         """Run planning loop with limited tool use."""
         current = list(messages)
+        first_own = len(current)
         last_response_text = ""
 
         for _ in range(max_rounds):
+            _prune_history(current, first_own)
             response = await self.router.chat(
                 current,
                 tools=PLANNING_TOOLS,
@@ -87,23 +90,98 @@ class PlannerAgent:
 
     @staticmethod
     def parse_plan_json(text: str) -> dict[str, Any] | None:
-        """Extract plan JSON from model output."""
+        """
+        Extract plan JSON from model output.
+
+        Results for identical outputs are cached, so callers must treat
+        the returned dict as read-only.
+        """
+        if len(text) > _PARSE_CACHE_MAX_CHARS:
+            return _parse_plan_json(text)
+        return _parse_plan_json_cached(text)
+
+
+# Characters of tool output (newest first) resent in full each round.
+_HISTORY_RESULT_BUDGET = 12_000
+
+
+def _prune_history(messages: list[dict[str, Any]], first: int) -> None:
+    """
+    Truncate older tool results in place once newer ones fill the budget.
+
+    Only messages from index *first* on are touched, so the caller's
+    prompt is never pruned.  The tool_result blocks themselves stay,
+    keeping every tool_use paired, and the newest results are always
+    kept whole.  Truncation is sticky, so the resent prefix only changes
+    when another result ages out.
+    """
+    used = 0
+    for i in range(len(messages) - 1, first - 1, -1):
+        content = messages[i]["content"]
+        if messages[i]["role"] != "user" or not isinstance(content, list):
+            continue
+        for block in content:
+            if block.get("type") != "tool_result":
+                continue
+            if used > _HISTORY_RESULT_BUDGET:
+                block["content"] = "[truncated]"
+            else:
+                used += len(block["content"])
+
+
+# Model outputs above this size are parsed but not cached.
+_PARSE_CACHE_MAX_CHARS = 64 * 1024
+
+
+def _find_json_object(s: str, start: int = 0) -> tuple[int, int] | None:
+    """
+    Return ``(begin, end)`` of the first balanced ``{...}`` at or after *start*.
+
+    A single forward scan that tracks brace depth and skips braces inside
+    JSON strings (honouring backslash escapes).
+    """
+    begin = s.find("{", start)
+    if begin < 0:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(begin, len(s)):
+        ch = s[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return begin, i + 1
+    return None
+
+
+def _parse_plan_json(text: str) -> dict[str, Any] | None:
+    try:
+        return json_codec.loads(text)
+    except json.JSONDecodeError:
+        pass
+
+    # Prose or a ``` fence around the object: parse the first balanced
+    # object, moving on to the next "{" if that one isn't valid JSON.
+    start = 0
+    while (span := _find_json_object(text, start)) is not None:
+        begin, end = span
         try:
-            return json.loads(text)
+            return json_codec.loads(text[begin:end])
         except json.JSONDecodeError:
-            pass
-
-        match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", text, re.DOTALL)
-        if match:
-            try:
-                return json.loads(match.group(1))
-            except json.JSONDecodeError:
-                pass
-
-        match = re.search(r"\{.*\}", text, re.DOTALL)
-        if match:
-            try:
-                return json.loads(match.group())
-            except json.JSONDecodeError:
-                pass
-        return None
+            start = begin + 1
+    return None
+
+
+_parse_plan_json_cached = functools.lru_cache(maxsize=64)(_parse_plan_json)
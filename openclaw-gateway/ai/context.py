@@ -73,6 +73,7 @@ async def build_messages(
     """
     rows = await store.get_conversation(
         db, project_id, phase=phase, limit=KEEP_RECENT_MESSAGES,
+        columns=("role", "content", "token_count"),
     )
 
     messages = []
@@ -121,7 +122,7 @@ async def build_messages_for_provider(
     """
     # Load all recent messages from DB.
     rows = await store.get_conversation(
-        db, project_id, phase=phase, limit=200,
+        db, project_id, phase=phase, limit=200, columns=("role", "content"),
     )
 
     all_messages = []
@@ -155,16 +156,16 @@ async def build_messages_for_provider(
     # Check if just the recent messages fit. If not, truncate recent too.
     recent_tokens = _messages_token_count(recent)
     if recent_tokens > budget:
-        # Even recent messages are too large — hard truncate.
-        truncated = []
+        # Even recent messages are too large — keep the newest that fit.
+        start = len(recent)
         running = 0
-        for msg in reversed(recent):
-            msg_tokens = _estimate_tokens(msg.get("content", ""))
+        while start > 0:
+            msg_tokens = _estimate_tokens(recent[start - 1].get("content", ""))
             if running + msg_tokens > budget:
                 break
-            truncated.insert(0, msg)
             running += msg_tokens
-        return truncated
+            start -= 1
+        return recent[start:]
 
     if not older:
         return recent
@@ -297,7 +298,9 @@ async def save_messages(
     Only saves messages that are not already stored (based on count
     comparison).  Call this after each AI conversation turn.
     """
-    existing = await store.get_conversation(db, project_id, phase=phase, limit=1000)
+    existing = await store.get_conversation(
+        db, project_id, phase=phase, limit=1000, columns=("id",),
+    )
     existing_count = len(existing)
 
     for msg in messages[existing_count:]:
@@ -186,8 +186,7 @@ class ProviderRouter:
                 )
                 # Success — record usage and clear errors.
                 provider.record_usage(response.input_tokens + response.output_tokens)
-                await store.record_provider_usage(
-                    self.db,
+                store.buffer_provider_usage(
                     provider.name,
                     requests=1,
                     tokens=response.input_tokens + response.output_tokens,
@@ -215,8 +214,8 @@ class ProviderRouter:
                             provider.name,
                         )
 
-                await store.record_provider_usage(
-                    self.db, provider.name, requests=0, tokens=0, error=True,
+                store.buffer_provider_usage(
+                    provider.name, requests=0, tokens=0, error=True,
                 )
                 last_error = exc
                 continue
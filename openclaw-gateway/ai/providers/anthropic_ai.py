@@ -16,14 +16,52 @@ from .base import BaseProvider, ProviderResponse, ToolCall
 logger = logging.getLogger("skynet.ai.anthropic")
 
 
+# Prompt-cache breakpoint.  The API caches the request prefix up to each
+# marked block (tools -> system -> messages), so static system prompts and
+# tool schemas, and the history of multi-round tool loops, are re-read from
+# cache on the next call.  Prefixes below the model's minimum are simply
+# not cached.
+_EPHEMERAL = {"type": "ephemeral"}
+
+
 def _convert_tools(tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    """Anthropic uses the same tool format natively."""
-    return tools
+    """Anthropic uses the same tool format natively; the last tool closes the cached prefix."""
+    return [*tools[:-1], {**tools[-1], "cache_control": _EPHEMERAL}]
+
+
+def _convert_system(system: str) -> list[dict[str, Any]]:
+    return [{"type": "text", "text": system, "cache_control": _EPHEMERAL}]
 
 
 def _convert_messages(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    """Anthropic messages are already in the right format."""
-    return messages
+    """Anthropic messages are already in the right format; the last one is marked for caching."""
+    if not messages:
+        return messages
+    last = messages[-1]
+    content = last.get("content")
+    if isinstance(content, str) and content:
+        blocks = [{"type": "text", "text": content}]
+    elif isinstance(content, list) and content and isinstance(content[-1], dict):
+        blocks = list(content)
+    else:
+        return messages
+    blocks[-1] = {**blocks[-1], "cache_control": _EPHEMERAL}
+    return [*messages[:-1], {**last, "content": blocks}]
+
+
+def _input_tokens(usage: Any) -> int:
+    """
+    All prompt tokens of a call.  With cache breakpoints set, ``input_tokens``
+    counts only the uncached tail; cache reads and writes are reported
+    separately but still count against quota and cost.
+    """
+    if usage is None:
+        return 0
+    return (
+        usage.input_tokens
+        + (getattr(usage, "cache_read_input_tokens", None) or 0)
+        + (getattr(usage, "cache_creation_input_tokens", None) or 0)
+    )
 
 
 class AnthropicProvider(BaseProvider):
@@ -58,7 +96,7 @@ class AnthropicProvider(BaseProvider):
             "messages": _convert_messages(messages),
         }
         if system:
-            kwargs["system"] = system
+            kwargs["system"] = _convert_system(system)
         if tools:
             kwargs["tools"] = _convert_tools(tools)
 
@@ -77,8 +115,9 @@ class AnthropicProvider(BaseProvider):
                 ))
 
         stop_reason = "tool_use" if tool_calls else "end_turn"
-        input_tokens = response.usage.input_tokens if response.usage else 0
-        output_tokens = response.usage.output_tokens if response.usage else 0
+        usage = response.usage
+        input_tokens = _input_tokens(usage)
+        output_tokens = usage.output_tokens if usage else 0
 
         return ProviderResponse(
             text="".join(text_parts),
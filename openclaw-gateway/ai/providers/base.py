@@ -11,10 +11,24 @@ from __future__ import annotations
 import dataclasses
 import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Any
 
 
+# (UTC day number, "YYYY-MM-DD") of the most recent ``_utc_today()`` call.
+_TODAY_CACHE: tuple[int, str] = (-1, "")
+
+
+def _utc_today() -> str:
+    """Current UTC date; formatted once per day rather than per quota check."""
+    global _TODAY_CACHE
+    day = int(time.time() // 86400)
+    cached = _TODAY_CACHE
+    if cached[0] != day:
+        cached = _TODAY_CACHE = (day, time.strftime("%Y-%m-%d", time.gmtime(day * 86400)))
+    return cached[1]
+
+
 @dataclasses.dataclass
 class ToolCall:
     """A single tool invocation requested by the model."""
@@ -96,7 +110,7 @@ class BaseProvider(ABC):
     # ------------------------------------------------------------------
 
     def remaining_quota(self) -> QuotaInfo:
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        today = _utc_today()
         if self._daily_date != today:
             self._daily_used = 0
             self._daily_date = today
@@ -111,7 +125,7 @@ class BaseProvider(ABC):
 
     def record_usage(self, tokens: int = 0) -> None:
         """Called by the router after a successful request."""
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        today = _utc_today()
         if self._daily_date != today:
             self._daily_used = 0
             self._daily_date = today
@@ -136,7 +150,7 @@ class BaseProvider(ABC):
 
     def load_usage_from_db(self, requests_used: int, date: str) -> None:
         """Restore usage counters from the database after a restart."""
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        today = _utc_today()
         if date == today:
             self._daily_used = requests_used
             self._daily_date = today
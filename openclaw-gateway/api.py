@@ -29,6 +29,7 @@ from aiohttp import web
 
 import bot_config
 import gateway_config as cfg
+from db.schema import connect as connect_db
 from gateway import (
     is_agent_connected,
     send_action,
@@ -104,6 +105,62 @@ async def _store_cached_result(
     await db.commit()
 
 
+async def _route_action(
+    action: str,
+    params: dict[str, Any] | None,
+    *,
+    confirmed: bool,
+    task_id: str | None = None,
+    idempotency_key: str | None = None,
+) -> tuple[dict[str, Any], bool]:
+    """
+    Run *action* on the connected worker, or over the SSH fallback.
+
+    Returns ``(result, via_ssh)``.  Raises ``RuntimeError`` if neither is
+    available and ``asyncio.TimeoutError`` if the worker doesn't reply in time.
+    """
+    ssh_exec = get_ssh_executor()
+    ssh_configured = ssh_exec.is_configured()
+    force_ssh = _force_ssh_mode(ssh_configured)
+    if force_ssh or not is_agent_connected():
+        if ssh_configured:
+            result = await ssh_exec.execute_action(action, params, confirmed=confirmed)
+            return result, True
+        if force_ssh:
+            raise RuntimeError("SSH tunnel mode is enabled but SSH executor is not configured.")
+        raise RuntimeError("No agent connected and SSH fallback is not configured.")
+
+    result = await send_action(
+        action,
+        params,
+        confirmed=confirmed,
+        task_id=task_id,
+        idempotency_key=idempotency_key,
+    )
+    return result, False
+
+
+async def dispatch_action(
+    action: str,
+    params: dict[str, Any] | None = None,
+    *,
+    confirmed: bool = True,
+) -> dict[str, Any]:
+    """
+    In-process equivalent of ``POST /action`` for gateway components.
+
+    Returns the worker's result dict; failures are reported as
+    ``{"status": "error", "error": ...}`` rather than raised.
+    """
+    try:
+        result, _ = await _route_action(action, params, confirmed=confirmed)
+        return result
+    except asyncio.TimeoutError:
+        return {"status": "error", "error": "Agent did not respond in time."}
+    except RuntimeError as exc:
+        return {"status": "error", "error": str(exc)}
+
+
 # ---------------------------------------------------------------------------
 # Handlers
 # ---------------------------------------------------------------------------
@@ -193,40 +250,7 @@ async def handle_action(request: web.Request) -> web.Response:
             return web.json_response(replay)
 
     try:
-        ssh_exec = get_ssh_executor()
-        ssh_configured = ssh_exec.is_configured()
-        force_ssh = _force_ssh_mode(ssh_configured)
-        if force_ssh or not is_agent_connected():
-            if ssh_configured:
-                result = await ssh_exec.execute_action(action, params, confirmed=confirmed)
-                if action_key and db is not None:
-                    await _store_cached_result(
-                        db,
-                        task_id=str(task_id),
-                        idempotency_key=str(idempotency_key),
-                        result=result,
-                    )
-                if is_owner and inflight_future is not None and not inflight_future.done():
-                    inflight_future.set_result(result)
-                if result.get("status") == "error":
-                    return web.json_response(result, status=503)
-                return web.json_response(result)
-            if force_ssh:
-                if is_owner and inflight_future is not None and not inflight_future.done():
-                    inflight_future.set_exception(
-                        RuntimeError("SSH mode enabled without configured executor")
-                    )
-                return web.json_response(
-                    {"error": "SSH tunnel mode is enabled but SSH executor is not configured."},
-                    status=503,
-                )
-            if is_owner and inflight_future is not None and not inflight_future.done():
-                inflight_future.set_exception(RuntimeError("No connected agent and no SSH fallback"))
-            return web.json_response(
-                {"error": "No agent connected and SSH fallback is not configured."}, status=503,
-            )
-
-        result = await send_action(
+        result, via_ssh = await _route_action(
             action,
             params,
             confirmed=confirmed,
@@ -242,6 +266,8 @@ async def handle_action(request: web.Request) -> web.Response:
             )
         if is_owner and inflight_future is not None and not inflight_future.done():
             inflight_future.set_result(result)
+        if via_ssh and result.get("status") == "error":
+            return web.json_response(result, status=503)
         return web.json_response(result)
     except asyncio.TimeoutError:
         if is_owner and inflight_future is not None and not inflight_future.done():
@@ -431,8 +457,7 @@ def create_app(*, idempotency_db: aiosqlite.Connection | None = None) -> web.App
 
 async def start_http_api() -> web.AppRunner:
     """Start the HTTP API server and return the runner."""
-    idempotency_db = await aiosqlite.connect(bot_config.DB_PATH)
-    idempotency_db.row_factory = aiosqlite.Row
+    idempotency_db = await connect_db(bot_config.DB_PATH)
     await _ensure_idempotency_schema(idempotency_db)
 
     app = create_app(idempotency_db=idempotency_db)
@@ -41,12 +41,21 @@ def _int_env(name: str, default: int) -> int:
 # API-only deployments (DISABLE_TELEGRAM_BOT=1) can import bot_config freely.
 TELEGRAM_BOT_TOKEN: str = os.environ.get("TELEGRAM_BOT_TOKEN", "").strip()
 
+# Run without the Telegram bot (HTTP/WebSocket API only).
+DISABLE_TELEGRAM_BOT: bool = os.environ.get(
+    "DISABLE_TELEGRAM_BOT", "0",
+).strip().lower() in {"1", "true", "yes", "on"}
+
 # Only this Telegram user ID can issue commands.
 ALLOWED_USER_ID: int = _int_env("TELEGRAM_ALLOWED_USER_ID", 0)
 
 # Gateway HTTP API (runs on the same machine; override with GATEWAY_API_URL).
 GATEWAY_API_URL: str = _str_env("GATEWAY_API_URL", "http://127.0.0.1:8766")
 
+# Where agent memory files live: "agent" (laptop, via the worker) or
+# "local" (the gateway's filesystem, for single-host deployments).
+MEMORY_BACKEND: str = _str_env("SKYNET_MEMORY_BACKEND", "agent")
+
 # Default working directory for worker actions.
 # Can be overridden with SKYNET_DEFAULT_WORKING_DIR / OPENCLAW_DEFAULT_WORKING_DIR.
 if os.name == "nt":
@@ -205,9 +205,7 @@ CREATE TABLE IF NOT EXISTS memory_audit_log (
 
 -- Indexes
 CREATE INDEX IF NOT EXISTS idx_ideas_project ON ideas(project_id);
-CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks(project_id);
 CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
-CREATE INDEX IF NOT EXISTS idx_conversations_project ON conversations(project_id);
 CREATE INDEX IF NOT EXISTS idx_events_project ON project_events(project_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_provider_usage_lookup ON provider_usage(provider_name, date);
 CREATE INDEX IF NOT EXISTS idx_agents_project ON agents(project_id);
@@ -221,6 +219,16 @@ CREATE INDEX IF NOT EXISTS idx_users_telegram ON users(telegram_user_id);
 CREATE INDEX IF NOT EXISTS idx_user_facts_user ON user_profile_facts(user_id, is_active, fact_key);
 CREATE INDEX IF NOT EXISTS idx_user_conversations_user ON user_conversations(user_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_memory_audit_user ON memory_audit_log(user_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_conversations_project_phase ON conversations(project_id, phase, id);
+CREATE INDEX IF NOT EXISTS idx_agent_runs_project_id ON agent_runs(project_id, id);
+CREATE INDEX IF NOT EXISTS idx_task_artifacts_project_id ON task_artifacts(project_id, id);
+CREATE INDEX IF NOT EXISTS idx_task_artifacts_project_task_id ON task_artifacts(project_id, task_id, id);
+CREATE INDEX IF NOT EXISTS idx_user_conversations_user_id ON user_conversations(user_id, id);
+CREATE INDEX IF NOT EXISTS idx_user_facts_lookup ON user_profile_facts(user_id, fact_key, fact_value);
+CREATE INDEX IF NOT EXISTS idx_projects_status_created ON projects(status, created_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_project_order ON tasks(project_id, order_index);
+CREATE INDEX IF NOT EXISTS idx_tasks_project_plan_order ON tasks(project_id, plan_id, order_index);
+CREATE INDEX IF NOT EXISTS idx_plans_project_active ON plans(project_id, is_active, id);
 """
 
 
@@ -229,11 +237,54 @@ _MIGRATIONS = [
     "ALTER TABLE tasks ADD COLUMN assigned_agent_role TEXT DEFAULT 'backend'",
 ]
 
+# Indexes superseded by a wider one with the same leading column(s); each
+# extra b-tree is one more write on every insert/update of its table.
+_DROPPED_INDEXES = (
+    "idx_tasks_project",           # idx_tasks_project_order / _plan_order
+    "idx_conversations_project",   # idx_conversations_project_phase
+)
+
+
+# Per-connection tuning applied right after connect.  WAL lets readers run
+# alongside the single writer and turns each commit into an append to the
+# -wal file instead of a rollback-journal rewrite.  synchronous=NORMAL only
+# fsyncs at checkpoints: a power loss may drop the last few commits, but the
+# database itself stays consistent.  Writers still serialize: a second
+# connection (e.g. the HTTP API's) waits up to busy_timeout for the write
+# lock instead of failing with "database is locked".
+_TUNING_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+# Size of sqlite3's per-connection prepared-statement cache (default 100).
+# store.py keeps every statement text canonical, so distinct SQL strings
+# are bounded; this keeps all of them compiled on the long-lived connection.
+_CACHED_STATEMENTS = 512
+
+
+async def tune(db: aiosqlite.Connection) -> None:
+    """Apply the connection-level PRAGMAs above.  Safe to call repeatedly."""
+    for pragma in _TUNING_PRAGMAS:
+        await db.execute(pragma)
+
+
+async def connect(db_path: str) -> aiosqlite.Connection:
+    """Open a tuned connection with ``aiosqlite.Row`` rows."""
+    db = await aiosqlite.connect(db_path, cached_statements=_CACHED_STATEMENTS)
+    db.row_factory = aiosqlite.Row
+    await tune(db)
+    return db
+
 
 async def init_db(db_path: str) -> aiosqlite.Connection:
     """Open (or create) the database and ensure all tables exist."""
-    db = await aiosqlite.connect(db_path)
-    db.row_factory = aiosqlite.Row
+    db = await connect(db_path)
     await db.executescript(SCHEMA_SQL)
     await db.commit()
 
@@ -245,4 +296,11 @@ async def init_db(db_path: str) -> aiosqlite.Connection:
         except Exception:
             pass  # Column/table already exists — ignore.
 
+    for index in _DROPPED_INDEXES:
+        await db.execute(f"DROP INDEX IF EXISTS {index}")
+    await db.commit()
+
+    # Refresh planner statistics where they are missing or stale (cheap
+    # no-op otherwise) so new indexes are picked up on existing databases.
+    await db.execute("PRAGMA optimize")
     return db
@@ -7,20 +7,211 @@ an ``aiosqlite.Connection`` and returns plain dicts / lists.
 
 from __future__ import annotations
 
-import json
-import uuid
-from datetime import datetime, timezone
-from typing import Any
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+import weakref
+from typing import Any, AsyncIterator, Callable, Iterable, TypeVar
 
 import aiosqlite
 
+import json_codec
+
+logger = logging.getLogger("skynet.db.store")
+
+_T = TypeVar("_T")
+
+# (epoch second, formatted timestamp) of the most recent ``_now()`` call.
+_NOW_CACHE: tuple[int, str] = (-1, "")
+
 
 def _now() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    """UTC timestamp with second resolution, formatted once per second."""
+    global _NOW_CACHE
+    sec = int(time.time())
+    cached = _NOW_CACHE
+    if cached[0] == sec:
+        return cached[1]
+    t = time.gmtime(sec)
+    stamp = (
+        f"{t.tm_year:04}-{t.tm_mon:02}-{t.tm_mday:02}"
+        f"T{t.tm_hour:02}:{t.tm_min:02}:{t.tm_sec:02}"
+    )
+    _NOW_CACHE = (sec, stamp)
+    return stamp
+
+
+def _today() -> str:
+    return _now()[:10]
+
+
+# Random bytes drawn from the OS in blocks; each id consumes six of them.
+# Only the event loop thread generates ids, so no lock is taken.
+_ID_POOL = bytearray()
+_ID_POOL_REFILL = 4096
 
 
 def _uuid() -> str:
-    return uuid.uuid4().hex[:12]
+    """12 hex chars (48 random bits), same shape as ``uuid4().hex[:12]``."""
+    if len(_ID_POOL) < 6:
+        _ID_POOL.extend(os.urandom(_ID_POOL_REFILL))
+    chunk = _ID_POOL[-6:]
+    del _ID_POOL[-6:]
+    return chunk.hex()
+
+
+def _rows_to_dicts(rows: list[aiosqlite.Row]) -> list[dict[str, Any]]:
+    """Materialize a result set, reading the column names once per query."""
+    if not rows:
+        return []
+    keys = tuple(rows[0].keys())
+    return [dict(zip(keys, row)) for row in rows]
+
+
+async def _run_sync(
+    db: aiosqlite.Connection,
+    fn: Callable[..., _T],
+    *args: Any,
+) -> _T:
+    """
+    Run ``fn(conn, *args)`` on the connection's worker thread in one hop.
+
+    aiosqlite ships every execute/fetch/commit to its thread separately;
+    helpers that issue several statements per call use this instead.
+    """
+    return await db._execute(fn, db._conn, *args)
+
+
+async def _fetch_one(
+    db: aiosqlite.Connection,
+    sql: str,
+    params: tuple[Any, ...] = (),
+) -> dict[str, Any] | None:
+    """First row of ``sql`` as a dict; execute and fetch share one hop."""
+    rows = await db.execute_fetchall(sql, params)
+    return dict(rows[0]) if rows else None
+
+
+async def _insert(db: aiosqlite.Connection, sql: str, params: tuple[Any, ...]) -> int:
+    """Run an INSERT and return its rowid in one hop."""
+    return int((await db.execute_insert(sql, params))[0])
+
+
+def _decode_metadata(raw: str | None) -> dict[str, Any]:
+    # Every writer stores metadata via json_codec.dumps(), so no decode guard is needed.
+    return json_codec.loads(raw) if raw else {}
+
+
+def _rows_with_metadata(rows: list[aiosqlite.Row]) -> list[dict[str, Any]]:
+    """``_rows_to_dicts`` that also decodes the JSON ``metadata`` column in one pass."""
+    if not rows:
+        return []
+    keys = tuple(rows[0].keys())
+    out = []
+    for row in rows:
+        item = dict(zip(keys, row))
+        item["metadata"] = _decode_metadata(item["metadata"])
+        out.append(item)
+    return out
+
+
+# ------------------------------------------------------------------
+# Commit coalescing
+# ------------------------------------------------------------------
+
+# High-frequency, low-value writes (heartbeats, usage counters, audit and
+# conversation logs) do not commit inline.  They mark the connection dirty
+# and one commit is issued after ``_COMMIT_DELAY`` for every write that
+# landed in between.  Reads on the same connection see the uncommitted rows
+# immediately; a crash can lose at most the last window of these writes.
+# Helpers whose callers need durability still ``await db.commit()``.
+_COMMIT_DELAY = 0.01
+
+
+class _CommitCoalescer:
+    """Collapse bursts of writes on one connection into a single commit."""
+
+    __slots__ = ("_task",)
+
+    def __init__(self) -> None:
+        self._task: asyncio.Task | None = None
+
+    def schedule(self, db: aiosqlite.Connection) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._commit_soon(db))
+
+    def cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _commit_soon(self, db: aiosqlite.Connection) -> None:
+        await asyncio.sleep(_COMMIT_DELAY)
+        # Writes queued after this point schedule their own commit.
+        self._task = None
+        try:
+            await db.commit()
+        except ValueError:
+            pass  # Connection already closed.
+        except Exception:
+            logger.exception("Coalesced commit failed.")
+
+
+_COALESCERS: weakref.WeakKeyDictionary[aiosqlite.Connection, _CommitCoalescer] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _commit_later(db: aiosqlite.Connection) -> None:
+    coalescer = _COALESCERS.get(db)
+    if coalescer is None:
+        coalescer = _COALESCERS[db] = _CommitCoalescer()
+    coalescer.schedule(db)
+
+
+async def flush(db: aiosqlite.Connection) -> None:
+    """Commit any coalesced or buffered writes on ``db`` now (e.g. before closing it)."""
+    coalescer = _COALESCERS.get(db)
+    if coalescer is not None:
+        coalescer.cancel()
+    await flush_provider_usage(db)
+    await db.commit()
+
+
+def _projection(
+    allowed: frozenset[str],
+    columns: tuple[str, ...] | None,
+    caller: str,
+) -> str:
+    """Validated SELECT list for ``columns``; ``id`` is always included."""
+    if columns is None:
+        return "*"
+    invalid = set(columns) - allowed
+    if invalid:
+        raise ValueError(f"{caller}: unknown column(s): {sorted(invalid)}")
+    return ", ".join(dict.fromkeys(("id", *columns)))
+
+
+# Rows pulled from the cursor per thread hop by the ``iter_*`` helpers.
+_ITER_BATCH_SIZE = 64
+
+
+async def _iter_rows(
+    db: aiosqlite.Connection,
+    sql: str,
+    params: tuple[Any, ...] = (),
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield rows as dicts without materializing the whole result set."""
+    async with db.execute(sql, params) as cur:
+        keys = tuple(col[0] for col in cur.description)
+        while True:
+            rows = await cur.fetchmany(_ITER_BATCH_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(zip(keys, row))
 
 
 # ------------------------------------------------------------------
@@ -33,30 +224,66 @@ async def create_project(
     display_name: str,
     local_path: str,
 ) -> dict[str, Any]:
-    project_id = _uuid()
-    await db.execute(
-        "INSERT INTO projects (id, name, display_name, local_path) VALUES (?, ?, ?, ?)",
-        (project_id, name, display_name, local_path),
+    rows = await db.execute_fetchall(
+        "INSERT INTO projects (id, name, display_name, local_path) VALUES (?, ?, ?, ?) "
+        "RETURNING *",
+        (_uuid(), name, display_name, local_path),
     )
     await db.commit()
-    return await get_project(db, project_id)
+    return dict(rows[0])
 
 
 async def get_project(db: aiosqlite.Connection, project_id: str) -> dict[str, Any] | None:
-    async with db.execute("SELECT * FROM projects WHERE id = ?", (project_id,)) as cur:
-        row = await cur.fetchone()
-        return dict(row) if row else None
+    return await _fetch_one(db, "SELECT * FROM projects WHERE id = ?", (project_id,))
 
 
 async def get_project_by_name(db: aiosqlite.Connection, name: str) -> dict[str, Any] | None:
-    async with db.execute("SELECT * FROM projects WHERE name = ?", (name,)) as cur:
-        row = await cur.fetchone()
-        return dict(row) if row else None
+    return await _fetch_one(db, "SELECT * FROM projects WHERE name = ?", (name,))
 
 
 async def list_projects(db: aiosqlite.Connection) -> list[dict[str, Any]]:
-    async with db.execute("SELECT * FROM projects ORDER BY created_at DESC") as cur:
-        return [dict(row) for row in await cur.fetchall()]
+    rows = await db.execute_fetchall("SELECT * FROM projects ORDER BY created_at DESC")
+    return _rows_to_dicts(rows)
+
+
+async def get_projects_by_ids(
+    db: aiosqlite.Connection,
+    project_ids: Iterable[str],
+) -> dict[str, dict[str, Any]]:
+    """Fetch several projects in one query, keyed by id; unknown ids are omitted."""
+    ids = list(dict.fromkeys(project_ids))
+    if not ids:
+        return {}
+    marks = ", ".join("?" * len(ids))
+    rows = await db.execute_fetchall(f"SELECT * FROM projects WHERE id IN ({marks})", ids)
+    return {row["id"]: row for row in _rows_to_dicts(rows)}
+
+
+def iter_projects(db: aiosqlite.Connection) -> AsyncIterator[dict[str, Any]]:
+    """Stream projects newest first; use for long-running per-project sweeps."""
+    return _iter_rows(db, "SELECT * FROM projects ORDER BY created_at DESC")
+
+
+# (table, column set) -> (UPDATE statement, column order of its placeholders).
+_UPDATE_SQL_CACHE: dict[tuple[str, frozenset[str]], tuple[str, tuple[str, ...]]] = {}
+
+
+def _update_sql(table: str, columns: Iterable[str]) -> tuple[str, tuple[str, ...]]:
+    """
+    Return a canonical ``UPDATE <table> SET ... WHERE id = ?`` statement.
+
+    Columns are sorted so every caller updating the same set of columns
+    shares one SQL string (and one entry in sqlite3's statement cache).
+    Callers must validate ``columns`` against a whitelist first.
+    """
+    key = (table, frozenset(columns))
+    cached = _UPDATE_SQL_CACHE.get(key)
+    if cached is None:
+        cols = tuple(sorted(key[1]))
+        sets = ", ".join(f"{c} = ?" for c in cols)
+        cached = (f"UPDATE {table} SET {sets} WHERE id = ?", cols)
+        _UPDATE_SQL_CACHE[key] = cached
+    return cached
 
 
 _PROJECTS_UPDATABLE_COLUMNS: frozenset[str] = frozenset({
@@ -82,12 +309,94 @@ async def update_project(
     if invalid:
         raise ValueError(f"update_project: unknown column(s): {sorted(invalid)}")
     fields["updated_at"] = _now()
-    sets = ", ".join(f"{k} = ?" for k in fields)
-    vals = list(fields.values()) + [project_id]
-    await db.execute(f"UPDATE projects SET {sets} WHERE id = ?", vals)
+    sql, cols = _update_sql("projects", fields)
+    vals = [fields[c] for c in cols]
+    vals.append(project_id)
+    await db.execute(sql, vals)
     await db.commit()
 
 
+def _update_project_with_event_sync(
+    conn: sqlite3.Connection,
+    sql: str,
+    vals: list[Any],
+    event: tuple[Any, ...],
+) -> int:
+    conn.execute(sql, vals)
+    cur = conn.execute(
+        "INSERT INTO project_events (project_id, event_type, summary, detail) "
+        "VALUES (?, ?, ?, ?)",
+        event,
+    )
+    conn.commit()
+    return int(cur.lastrowid)
+
+
+async def update_project_with_event(
+    db: aiosqlite.Connection,
+    project_id: str,
+    event_type: str,
+    summary: str,
+    detail: str = "",
+    **fields: Any,
+) -> int:
+    """``update_project`` + ``add_event`` in one transaction; returns the event id."""
+    invalid = set(fields) - _PROJECTS_UPDATABLE_COLUMNS
+    if invalid:
+        raise ValueError(f"update_project_with_event: unknown column(s): {sorted(invalid)}")
+    fields["updated_at"] = _now()
+    sql, cols = _update_sql("projects", fields)
+    vals = [fields[c] for c in cols]
+    vals.append(project_id)
+    return await _run_sync(
+        db,
+        _update_project_with_event_sync,
+        sql,
+        vals,
+        (project_id, event_type, summary, detail),
+    )
+
+
+def _delete_project_sync(conn: sqlite3.Connection, project_id: str) -> bool:
+    cur = conn.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+    conn.commit()
+    return int(cur.rowcount or 0) > 0
+
+
+async def delete_project(db: aiosqlite.Connection, project_id: str) -> bool:
+    """
+    Delete just the project row (DELETE + commit in one hop).
+
+    For rolling back a project that never got child records; use
+    ``remove_project_cascade`` for anything else.
+    """
+    return await _run_sync(db, _delete_project_sync, project_id)
+
+
+# Project-scoped tables, children first, cleared by remove_project_cascade.
+_PROJECT_CHILD_TABLES = (
+    "ideas",
+    "tasks",
+    "plans",
+    "agents",
+    "conversations",
+    "project_events",
+    "agent_runs",
+    "task_artifacts",
+)
+_CASCADE_DELETE_SQL: tuple[str, ...] = tuple(
+    f"DELETE FROM {table} WHERE project_id = ?" for table in _PROJECT_CHILD_TABLES
+)
+
+
+def _remove_project_cascade_sync(conn: sqlite3.Connection, project_id: str) -> bool:
+    for sql in _CASCADE_DELETE_SQL:
+        conn.execute(sql, (project_id,))
+    cur = conn.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+    conn.commit()
+    return int(cur.rowcount or 0) > 0
+
+
 async def remove_project_cascade(
     db: aiosqlite.Connection,
     project_id: str,
@@ -95,34 +404,21 @@ async def remove_project_cascade(
     """
     Permanently remove a project and all project-scoped records.
 
-    Returns True when a project row was deleted.
+    All nine DELETEs and the commit run in a single trip to the
+    connection thread.  Returns True when a project row was deleted.
     """
-    tables = (
-        "ideas",
-        "tasks",
-        "plans",
-        "agents",
-        "conversations",
-        "project_events",
-        "agent_runs",
-        "task_artifacts",
-    )
-    for table in tables:
-        await db.execute(f"DELETE FROM {table} WHERE project_id = ?", (project_id,))
-    cur = await db.execute("DELETE FROM projects WHERE id = ?", (project_id,))
-    await db.commit()
-    return int(cur.rowcount or 0) > 0
+    return await _run_sync(db, _remove_project_cascade_sync, project_id)
 
 
 async def get_projects_by_status(
     db: aiosqlite.Connection,
     status: str,
 ) -> list[dict[str, Any]]:
-    async with db.execute(
+    rows = await db.execute_fetchall(
         "SELECT * FROM projects WHERE status = ? ORDER BY created_at DESC",
         (status,),
-    ) as cur:
-        return [dict(row) for row in await cur.fetchall()]
+    )
+    return _rows_to_dicts(rows)
 
 
 # ------------------------------------------------------------------
@@ -134,27 +430,87 @@ async def add_idea(
     project_id: str,
     message_text: str,
 ) -> int:
-    async with db.execute(
+    idea_id = await _insert(
+        db,
         "INSERT INTO ideas (project_id, message_text) VALUES (?, ?)",
         (project_id, message_text),
-    ) as cur:
-        idea_id = cur.lastrowid
+    )
     await db.commit()
     return idea_id
 
 
+def _add_idea_and_count_sync(conn: sqlite3.Connection, project_id: str, message_text: str) -> int:
+    conn.execute(
+        "INSERT INTO ideas (project_id, message_text) VALUES (?, ?)",
+        (project_id, message_text),
+    )
+    count = conn.execute(
+        "SELECT COUNT(*) FROM ideas WHERE project_id = ?", (project_id,),
+    ).fetchone()[0]
+    conn.commit()
+    return int(count)
+
+
+async def add_idea_and_count(
+    db: aiosqlite.Connection,
+    project_id: str,
+    message_text: str,
+) -> int:
+    """``add_idea`` plus a count in one hop; returns the project's new idea count."""
+    return await _run_sync(db, _add_idea_and_count_sync, project_id, message_text)
+
+
 async def get_ideas(db: aiosqlite.Connection, project_id: str) -> list[dict[str, Any]]:
-    async with db.execute(
+    rows = await db.execute_fetchall(
         "SELECT * FROM ideas WHERE project_id = ? ORDER BY created_at",
         (project_id,),
-    ) as cur:
-        return [dict(row) for row in await cur.fetchall()]
+    )
+    return _rows_to_dicts(rows)
 
 
 # ------------------------------------------------------------------
 # Plans
 # ------------------------------------------------------------------
 
+def _insert_plan(conn: sqlite3.Connection, row: tuple[Any, ...]) -> dict[str, Any]:
+    """Insert the new active plan and return its stored row (JSON columns encoded)."""
+    # Deactivate any previous active plans.
+    conn.execute(
+        "UPDATE plans SET is_active = 0 WHERE project_id = ? AND is_active = 1",
+        (row[0],),
+    )
+    cur = conn.execute(
+        "INSERT INTO plans (project_id, summary, timeline, milestones) VALUES (?, ?, ?, ?) "
+        "RETURNING *",
+        row,
+    )
+    keys = tuple(col[0] for col in cur.description)
+    return dict(zip(keys, cur.fetchone()))
+
+
+def _decode_plan(plan: dict[str, Any]) -> dict[str, Any]:
+    plan["timeline"] = json_codec.loads(plan["timeline"])
+    plan["milestones"] = json_codec.loads(plan["milestones"])
+    return plan
+
+
+def _create_plan_sync(conn: sqlite3.Connection, row: tuple[Any, ...]) -> int:
+    plan = _insert_plan(conn, row)
+    conn.commit()
+    return int(plan["id"])
+
+
+def _create_plan_with_tasks_sync(
+    conn: sqlite3.Connection,
+    row: tuple[Any, ...],
+    tasks: list[dict[str, str]],
+) -> tuple[dict[str, Any], list[int]]:
+    plan = _insert_plan(conn, row)
+    task_ids = _insert_tasks(conn, _task_rows(row[0], plan["id"], tasks))
+    conn.commit()
+    return plan, task_ids
+
+
 async def create_plan(
     db: aiosqlite.Connection,
     project_id: str,
@@ -162,70 +518,163 @@ async def create_plan(
     timeline: list[dict],
     milestones: list[dict],
 ) -> int:
-    # Deactivate any previous active plans.
-    await db.execute(
-        "UPDATE plans SET is_active = 0 WHERE project_id = ? AND is_active = 1",
-        (project_id,),
+    return await _run_sync(
+        db,
+        _create_plan_sync,
+        (project_id, summary, json_codec.dumps(timeline), json_codec.dumps(milestones)),
     )
-    async with db.execute(
-        "INSERT INTO plans (project_id, summary, timeline, milestones) VALUES (?, ?, ?, ?)",
-        (project_id, summary, json.dumps(timeline), json.dumps(milestones)),
-    ) as cur:
-        plan_id = cur.lastrowid
-    await db.commit()
-    return plan_id
+
+
+async def create_active_plan(
+    db: aiosqlite.Connection,
+    project_id: str,
+    summary: str,
+    timeline: list[dict],
+    milestones: list[dict],
+    tasks: list[dict[str, str]],
+) -> tuple[dict[str, Any], list[int]]:
+    """
+    ``create_plan`` + ``create_tasks`` in one transaction; returns (plan, task_ids).
+
+    The plan comes back from ``INSERT ... RETURNING`` in the same shape as
+    ``get_active_plan``, so callers need not read it back.
+    """
+    plan, task_ids = await _run_sync(
+        db,
+        _create_plan_with_tasks_sync,
+        (project_id, summary, json_codec.dumps(timeline), json_codec.dumps(milestones)),
+        tasks,
+    )
+    return _decode_plan(plan), task_ids
 
 
 async def get_active_plan(db: aiosqlite.Connection, project_id: str) -> dict[str, Any] | None:
-    async with db.execute(
+    plan = await _fetch_one(
+        db,
         "SELECT * FROM plans WHERE project_id = ? AND is_active = 1 ORDER BY id DESC LIMIT 1",
         (project_id,),
-    ) as cur:
-        row = await cur.fetchone()
-        if not row:
-            return None
-        plan = dict(row)
-        plan["timeline"] = json.loads(plan["timeline"])
-        plan["milestones"] = json.loads(plan["milestones"])
-        return plan
+    )
+    if plan is None:
+        return None
+    return _decode_plan(plan)
 
 
 # ------------------------------------------------------------------
 # Tasks
 # ------------------------------------------------------------------
 
+def _task_rows(
+    project_id: str,
+    plan_id: int,
+    tasks: list[dict[str, str]],
+) -> list[tuple[Any, ...]]:
+    return [
+        (project_id, plan_id, task.get("milestone", ""),
+         task["title"], task.get("description", ""), i)
+        for i, task in enumerate(tasks)
+    ]
+
+
+def _insert_tasks(conn: sqlite3.Connection, rows: list[tuple[Any, ...]]) -> list[int]:
+    if not rows:
+        return []
+    conn.executemany(
+        "INSERT INTO tasks (project_id, plan_id, milestone, title, description, order_index) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    # One statement inside our open write transaction: the AUTOINCREMENT
+    # rowids it assigned are contiguous and end at last_insert_rowid().
+    last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+    return list(range(last_id - len(rows) + 1, last_id + 1))
+
+
+def _create_tasks_sync(conn: sqlite3.Connection, rows: list[tuple[Any, ...]]) -> list[int]:
+    ids = _insert_tasks(conn, rows)
+    conn.commit()
+    return ids
+
+
 async def create_tasks(
     db: aiosqlite.Connection,
     project_id: str,
     plan_id: int,
     tasks: list[dict[str, str]],
 ) -> list[int]:
-    ids = []
-    for i, task in enumerate(tasks):
-        async with db.execute(
-            "INSERT INTO tasks (project_id, plan_id, milestone, title, description, order_index) "
-            "VALUES (?, ?, ?, ?, ?, ?)",
-            (project_id, plan_id, task.get("milestone", ""),
-             task["title"], task.get("description", ""), i),
-        ) as cur:
-            ids.append(cur.lastrowid)
-    await db.commit()
-    return ids
+    return await _run_sync(db, _create_tasks_sync, _task_rows(project_id, plan_id, tasks))
+
+
+_TASK_COLUMNS: frozenset[str] = frozenset({
+    "id",
+    "project_id",
+    "plan_id",
+    "milestone",
+    "title",
+    "description",
+    "status",
+    "order_index",
+    "assigned_agent_role",
+    "result_summary",
+    "error_message",
+    "started_at",
+    "completed_at",
+    "created_at",
+})
+# (filtered by plan, projection) -> SELECT statement.
+_TASKS_SQL: dict[tuple[bool, tuple[str, ...] | None], str] = {}
 
 
 async def get_tasks(
     db: aiosqlite.Connection,
     project_id: str,
     plan_id: int | None = None,
+    columns: tuple[str, ...] | None = None,
 ) -> list[dict[str, Any]]:
-    if plan_id:
-        sql = "SELECT * FROM tasks WHERE project_id = ? AND plan_id = ? ORDER BY order_index"
-        params = (project_id, plan_id)
-    else:
-        sql = "SELECT * FROM tasks WHERE project_id = ? ORDER BY order_index"
-        params = (project_id,)
-    async with db.execute(sql, params) as cur:
-        return [dict(row) for row in await cur.fetchall()]
+    """
+    Return tasks in plan order.
+
+    ``columns`` narrows the projection (``id`` is always included); the
+    default returns every column.
+    """
+    key = (bool(plan_id), columns)
+    sql = _TASKS_SQL.get(key)
+    if sql is None:
+        proj = _projection(_TASK_COLUMNS, columns, "get_tasks")
+        where = "project_id = ? AND plan_id = ?" if plan_id else "project_id = ?"
+        sql = _TASKS_SQL[key] = f"SELECT {proj} FROM tasks WHERE {where} ORDER BY order_index"
+    params = (project_id, plan_id) if plan_id else (project_id,)
+    rows = await db.execute_fetchall(sql, params)
+    return _rows_to_dicts(rows)
+
+
+async def get_task_progress(
+    db: aiosqlite.Connection,
+    project_id: str,
+) -> tuple[int, int, str | None]:
+    """Return (completed, total, title of the first in-progress task) in one query."""
+    rows = await db.execute_fetchall(
+        "SELECT COALESCE(SUM(status = 'completed'), 0), COUNT(*), "
+        "(SELECT title FROM tasks WHERE project_id = ? AND status = 'in_progress' "
+        "ORDER BY order_index LIMIT 1) "
+        "FROM tasks WHERE project_id = ?",
+        (project_id, project_id),
+    )
+    completed, total, current = rows[0]
+    return int(completed), int(total), current
+
+
+_TASKS_UPDATABLE_COLUMNS: frozenset[str] = frozenset({
+    "milestone",
+    "title",
+    "description",
+    "status",
+    "order_index",
+    "assigned_agent_role",
+    "result_summary",
+    "error_message",
+    "started_at",
+    "completed_at",
+})
 
 
 async def update_task(
@@ -233,12 +682,47 @@ async def update_task(
     task_id: int,
     **fields: Any,
 ) -> None:
-    sets = ", ".join(f"{k} = ?" for k in fields)
-    vals = list(fields.values()) + [task_id]
-    await db.execute(f"UPDATE tasks SET {sets} WHERE id = ?", vals)
+    invalid = set(fields) - _TASKS_UPDATABLE_COLUMNS
+    if invalid:
+        raise ValueError(f"update_task: unknown column(s): {sorted(invalid)}")
+    sql, cols = _update_sql("tasks", fields)
+    vals = [fields[c] for c in cols]
+    vals.append(task_id)
+    await db.execute(sql, vals)
     await db.commit()
 
 
+def _update_project_and_task_roles_sync(
+    conn: sqlite3.Connection,
+    sql: str,
+    vals: list[Any],
+    rows: list[tuple[str, Any]],
+) -> None:
+    conn.executemany("UPDATE tasks SET assigned_agent_role = ? WHERE id = ?", rows)
+    conn.execute(sql, vals)
+    conn.commit()
+
+
+async def update_project_and_task_roles(
+    db: aiosqlite.Connection,
+    project_id: str,
+    rows: Iterable[tuple[str, Any]],
+    **fields: Any,
+) -> None:
+    """
+    Set ``assigned_agent_role`` for many tasks and update the project, in one
+    transaction; *rows* are ``(role, task_id)``.
+    """
+    invalid = set(fields) - _PROJECTS_UPDATABLE_COLUMNS
+    if invalid:
+        raise ValueError(f"update_project_and_task_roles: unknown column(s): {sorted(invalid)}")
+    fields["updated_at"] = _now()
+    sql, cols = _update_sql("projects", fields)
+    vals = [fields[c] for c in cols]
+    vals.append(project_id)
+    await _run_sync(db, _update_project_and_task_roles_sync, sql, vals, list(rows))
+
+
 # ------------------------------------------------------------------
 # Conversations
 # ------------------------------------------------------------------
@@ -251,66 +735,171 @@ async def add_conversation_message(
     token_count: int = 0,
     phase: str = "coding",
 ) -> int:
-    content_json = json.dumps(content, default=str) if not isinstance(content, str) else content
-    async with db.execute(
+    content_json = json_codec.dumps(content)
+    msg_id = await _insert(
+        db,
         "INSERT INTO conversations (project_id, role, content, token_count, phase) "
         "VALUES (?, ?, ?, ?, ?)",
         (project_id, role, content_json, token_count, phase),
-    ) as cur:
-        msg_id = cur.lastrowid
-    await db.commit()
+    )
+    _commit_later(db)
     return msg_id
 
 
+_CONVERSATION_COLUMNS: frozenset[str] = frozenset({
+    "id",
+    "project_id",
+    "role",
+    "content",
+    "token_count",
+    "phase",
+    "created_at",
+})
+# (filtered by phase, projection) -> SELECT statement.
+_CONVERSATION_SQL: dict[tuple[bool, tuple[str, ...] | None], str] = {}
+
+
+def _conversation_sql(by_phase: bool, columns: tuple[str, ...] | None) -> str:
+    key = (by_phase, columns)
+    sql = _CONVERSATION_SQL.get(key)
+    if sql is None:
+        proj = _projection(_CONVERSATION_COLUMNS, columns, "get_conversation")
+        where = "project_id = ? AND phase = ?" if by_phase else "project_id = ?"
+        sql = _CONVERSATION_SQL[key] = (
+            f"SELECT * FROM (SELECT {proj} FROM conversations WHERE {where} "
+            "ORDER BY id DESC LIMIT ?) ORDER BY id"
+        )
+    return sql
+
+
+def _loads_content(raw: str) -> Any:
+    """
+    Decode one ``content`` value, keeping legacy plain text as-is.
+
+    Rows are decoded one at a time on purpose: a batched parse of
+    concatenated rows can be fooled by plain-text fragments that only
+    form valid JSON together.
+    """
+    try:
+        return json_codec.loads(raw)
+    except ValueError:
+        return raw  # Plain-text row written before content was always JSON-encoded.
+
+
 async def get_conversation(
     db: aiosqlite.Connection,
     project_id: str,
     phase: str | None = None,
     limit: int = 100,
+    columns: tuple[str, ...] | None = None,
 ) -> list[dict[str, Any]]:
-    if phase:
-        sql = ("SELECT * FROM conversations WHERE project_id = ? AND phase = ? "
-               "ORDER BY id DESC LIMIT ?")
-        params = (project_id, phase, limit)
-    else:
-        sql = "SELECT * FROM conversations WHERE project_id = ? ORDER BY id DESC LIMIT ?"
-        params = (project_id, limit)
-    async with db.execute(sql, params) as cur:
-        rows = [dict(row) for row in await cur.fetchall()]
-    rows.reverse()  # oldest first
+    """
+    Return the newest ``limit`` messages, oldest first.
+
+    ``columns`` narrows the projection (``id`` is always included); the
+    default returns every column.
+    """
+    sql = _conversation_sql(bool(phase), columns)
+    params = (project_id, phase, limit) if phase else (project_id, limit)
+    rows = _rows_to_dicts(await db.execute_fetchall(sql, params))
+    if columns is not None and "content" not in columns:
+        return rows
     for row in rows:
-        try:
-            row["content"] = json.loads(row["content"])
-        except (json.JSONDecodeError, TypeError):
-            pass
+        row["content"] = _loads_content(row["content"])
     return rows
 
 
+async def count_conversations_by_project(
+    db: aiosqlite.Connection,
+    more_than: int = 0,
+) -> dict[str, int]:
+    """Message count per project, for projects with more than ``more_than`` messages."""
+    rows = await db.execute_fetchall(
+        "SELECT project_id, COUNT(*) FROM conversations "
+        "GROUP BY project_id HAVING COUNT(*) > ?",
+        (more_than,),
+    )
+    return {project_id: count for project_id, count in rows}
+
+
 # ------------------------------------------------------------------
 # Provider Usage
 # ------------------------------------------------------------------
 
+_UPSERT_PROVIDER_USAGE_SQL = """
+    INSERT INTO provider_usage (provider_name, date, requests_used, tokens_used, errors, last_request_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(provider_name, date) DO UPDATE SET
+        requests_used = requests_used + excluded.requests_used,
+        tokens_used = tokens_used + excluded.tokens_used,
+        errors = errors + excluded.errors,
+        last_request_at = excluded.last_request_at
+"""
+_UPSERT_PROVIDER_USAGE_RETURNING_SQL = _UPSERT_PROVIDER_USAGE_SQL + "RETURNING *"
+
+# (provider_name, date) -> [requests, tokens, errors, last_request_at] not yet
+# written; drained by ``flush_provider_usage``.
+_USAGE_BUFFER: dict[tuple[str, str], list[Any]] = {}
+
+
 async def record_provider_usage(
     db: aiosqlite.Connection,
     provider_name: str,
     requests: int = 1,
     tokens: int = 0,
     error: bool = False,
-) -> None:
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+) -> dict[str, Any]:
+    """Add to today's counters for ``provider_name`` and return the updated row."""
     now = _now()
-    await db.execute(
-        """INSERT INTO provider_usage (provider_name, date, requests_used, tokens_used, errors, last_request_at)
-           VALUES (?, ?, ?, ?, ?, ?)
-           ON CONFLICT(provider_name, date) DO UPDATE SET
-               requests_used = requests_used + ?,
-               tokens_used = tokens_used + ?,
-               errors = errors + ?,
-               last_request_at = ?""",
-        (provider_name, today, requests, tokens, int(error), now,
-         requests, tokens, int(error), now),
+    rows = await db.execute_fetchall(
+        _UPSERT_PROVIDER_USAGE_RETURNING_SQL,
+        (provider_name, now[:10], requests, tokens, int(error), now),
     )
-    await db.commit()
+    _commit_later(db)
+    return dict(rows[0])
+
+
+def buffer_provider_usage(
+    provider_name: str,
+    requests: int = 1,
+    tokens: int = 0,
+    error: bool = False,
+) -> None:
+    """
+    Accumulate usage in memory; ``flush_provider_usage`` persists it.
+
+    For the per-request hot path.  Counters read back from the database
+    lag by up to one flush interval.
+    """
+    now = _now()
+    entry = _USAGE_BUFFER.get((provider_name, now[:10]))
+    if entry is None:
+        _USAGE_BUFFER[(provider_name, now[:10])] = [requests, tokens, int(error), now]
+        return
+    entry[0] += requests
+    entry[1] += tokens
+    entry[2] += int(error)
+    entry[3] = now
+
+
+async def flush_provider_usage(db: aiosqlite.Connection) -> int:
+    """Write buffered usage with one batched upsert; returns the rows written."""
+    if not _USAGE_BUFFER:
+        return 0
+    rows = [(name, date, *counters) for (name, date), counters in _USAGE_BUFFER.items()]
+    _USAGE_BUFFER.clear()
+    try:
+        await db.executemany(_UPSERT_PROVIDER_USAGE_SQL, rows)
+        await db.commit()
+    except Exception:
+        # Put the deltas back so the next flush retries them.
+        for name, date, requests, tokens, errors, last_at in rows:
+            entry = _USAGE_BUFFER.setdefault((name, date), [0, 0, 0, last_at])
+            entry[0] += requests
+            entry[1] += tokens
+            entry[2] += errors
+        raise
+    return len(rows)
 
 
 async def get_provider_usage(
@@ -319,24 +908,23 @@ async def get_provider_usage(
     date: str | None = None,
 ) -> dict[str, Any] | None:
     if date is None:
-        date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    async with db.execute(
+        date = _today()
+    return await _fetch_one(
+        db,
         "SELECT * FROM provider_usage WHERE provider_name = ? AND date = ?",
         (provider_name, date),
-    ) as cur:
-        row = await cur.fetchone()
-        return dict(row) if row else None
+    )
 
 
 async def get_all_provider_usage_today(
     db: aiosqlite.Connection,
 ) -> list[dict[str, Any]]:
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    async with db.execute(
+    today = _today()
+    rows = await db.execute_fetchall(
         "SELECT * FROM provider_usage WHERE date = ? ORDER BY provider_name",
         (today,),
-    ) as cur:
-        return [dict(row) for row in await cur.fetchall()]
+    )
+    return _rows_to_dicts(rows)
 
 
 # ------------------------------------------------------------------
@@ -350,13 +938,13 @@ async def add_event(
     summary: str,
     detail: str = "",
 ) -> int:
-    async with db.execute(
+    event_id = await _insert(
+        db,
         "INSERT INTO project_events (project_id, event_type, summary, detail) "
         "VALUES (?, ?, ?, ?)",
         (project_id, event_type, summary, detail),
-    ) as cur:
-        event_id = cur.lastrowid
-    await db.commit()
+    )
+    _commit_later(db)
     return event_id
 
 
@@ -365,11 +953,11 @@ async def get_events(
     project_id: str,
     limit: int = 20,
 ) -> list[dict[str, Any]]:
-    async with db.execute(
+    rows = await db.execute_fetchall(
         "SELECT * FROM project_events WHERE project_id = ? ORDER BY created_at DESC LIMIT ?",
         (project_id, limit),
-    ) as cur:
-        return [dict(row) for row in await cur.fetchall()]
+    )
+    return _rows_to_dicts(rows)
 
 
 # ------------------------------------------------------------------
@@ -391,9 +979,7 @@ async def create_agent(
 
 
 async def get_agent(db: aiosqlite.Connection, agent_id: str) -> dict[str, Any] | None:
-    async with db.execute("SELECT * FROM agents WHERE id = ?", (agent_id,)) as cur:
-        row = await cur.fetchone()
-        return dict(row) if row else None
+    return await _fetch_one(db, "SELECT * FROM agents WHERE id = ?", (agent_id,))
 
 
 async def get_agent_by_project_role(
@@ -401,12 +987,11 @@ async def get_agent_by_project_role(
     project_id: str,
     role: str,
 ) -> dict[str, Any] | None:
-    async with db.execute(
+    return await _fetch_one(
+        db,
         "SELECT * FROM agents WHERE project_id = ? AND role = ?",
         (project_id, role),
-    ) as cur:
-        row = await cur.fetchone()
-        return dict(row) if row else None
+    )
 
 
 async def list_agents(
@@ -419,8 +1004,12 @@ async def list_agents(
     else:
         sql = "SELECT * FROM agents ORDER BY project_id, role"
         params = ()
-    async with db.execute(sql, params) as cur:
-        return [dict(row) for row in await cur.fetchall()]
+    rows = await db.execute_fetchall(sql, params)
+    return _rows_to_dicts(rows)
+
+
+# SET-clause combination -> UPDATE statement (at most 15 entries).
+_UPDATE_AGENT_SQL: dict[tuple[str, ...], str] = {}
 
 
 async def update_agent(
@@ -449,7 +1038,11 @@ async def update_agent(
     if not parts:
         return
     vals.append(agent_id)
-    await db.execute(f"UPDATE agents SET {', '.join(parts)} WHERE id = ?", vals)
+    key = tuple(parts)
+    sql = _UPDATE_AGENT_SQL.get(key)
+    if sql is None:
+        sql = _UPDATE_AGENT_SQL[key] = f"UPDATE agents SET {', '.join(parts)} WHERE id = ?"
+    await db.execute(sql, vals)
     await db.commit()
 
 
@@ -467,7 +1060,8 @@ async def create_agent_run(
     metadata: dict[str, Any] | None = None,
 ) -> int:
     now = _now()
-    async with db.execute(
+    run_id = await _insert(
+        db,
         """
         INSERT INTO agent_runs (
             project_id, task_id, agent_id, agent_role, status,
@@ -481,14 +1075,27 @@ async def create_agent_run(
             agent_role,
             now,
             now,
-            json.dumps(metadata or {}),
+            json_codec.dumps(metadata or {}),
         ),
-    ) as cur:
-        run_id = int(cur.lastrowid)
+    )
     await db.commit()
     return run_id
 
 
+def _update_run_with_metadata_sync(
+    conn: sqlite3.Connection,
+    sql: str,
+    params: tuple[Any, ...],
+    run_id: int,
+    metadata_patch: dict[str, Any],
+) -> None:
+    """Read-merge-write an agent run's metadata; ``sql`` ends in ``metadata = ? WHERE id = ?``."""
+    row = conn.execute("SELECT metadata FROM agent_runs WHERE id = ?", (run_id,)).fetchone()
+    existing = _decode_metadata(row[0] if row else None)
+    existing.update(metadata_patch)
+    conn.execute(sql, (*params, json_codec.dumps(existing), run_id))
+
+
 async def heartbeat_agent_run(
     db: aiosqlite.Connection,
     *,
@@ -496,28 +1103,20 @@ async def heartbeat_agent_run(
     metadata_patch: dict[str, Any] | None = None,
 ) -> None:
     if metadata_patch:
-        async with db.execute(
-            "SELECT metadata FROM agent_runs WHERE id = ?",
-            (int(run_id),),
-        ) as cur:
-            row = await cur.fetchone()
-        existing = {}
-        if row and row[0]:
-            try:
-                existing = json.loads(row[0])
-            except Exception:
-                existing = {}
-        existing.update(metadata_patch)
-        await db.execute(
+        await _run_sync(
+            db,
+            _update_run_with_metadata_sync,
             "UPDATE agent_runs SET heartbeat_at = ?, metadata = ? WHERE id = ?",
-            (_now(), json.dumps(existing), int(run_id)),
+            (_now(),),
+            int(run_id),
+            metadata_patch,
         )
     else:
         await db.execute(
             "UPDATE agent_runs SET heartbeat_at = ? WHERE id = ?",
             (_now(), int(run_id)),
         )
-    await db.commit()
+    _commit_later(db)
 
 
 async def finish_agent_run(
@@ -531,32 +1130,17 @@ async def finish_agent_run(
     status_norm = (status or "").strip().lower() or "unknown"
     now = _now()
     if metadata_patch:
-        async with db.execute(
-            "SELECT metadata FROM agent_runs WHERE id = ?",
-            (int(run_id),),
-        ) as cur:
-            row = await cur.fetchone()
-        existing = {}
-        if row and row[0]:
-            try:
-                existing = json.loads(row[0])
-            except Exception:
-                existing = {}
-        existing.update(metadata_patch)
-        await db.execute(
+        await _run_sync(
+            db,
+            _update_run_with_metadata_sync,
             """
             UPDATE agent_runs
             SET status = ?, finished_at = ?, heartbeat_at = ?, error_message = ?, metadata = ?
             WHERE id = ?
             """,
-            (
-                status_norm,
-                now,
-                now,
-                (error_message or "")[:2000],
-                json.dumps(existing),
-                int(run_id),
-            ),
+            (status_norm, now, now, (error_message or "")[:2000]),
+            int(run_id),
+            metadata_patch,
         )
     else:
         await db.execute(
@@ -570,30 +1154,46 @@ async def finish_agent_run(
     await db.commit()
 
 
+_AGENT_RUN_COLUMNS: frozenset[str] = frozenset({
+    "id",
+    "project_id",
+    "task_id",
+    "agent_id",
+    "agent_role",
+    "status",
+    "started_at",
+    "heartbeat_at",
+    "finished_at",
+    "error_message",
+    "metadata",
+})
+_AGENT_RUNS_SQL: dict[tuple[str, ...] | None, str] = {}
+
+
 async def list_agent_runs(
     db: aiosqlite.Connection,
     *,
     project_id: str,
     limit: int = 100,
+    columns: tuple[str, ...] | None = None,
 ) -> list[dict[str, Any]]:
-    async with db.execute(
+    sql = _AGENT_RUNS_SQL.get(columns)
+    if sql is None:
+        proj = _projection(_AGENT_RUN_COLUMNS, columns, "list_agent_runs")
+        sql = _AGENT_RUNS_SQL[columns] = f"""
+        SELECT * FROM (
+            SELECT {proj}
+            FROM agent_runs
+            WHERE project_id = ?
+            ORDER BY id DESC
+            LIMIT ?
+        )
+        ORDER BY id
         """
-        SELECT *
-        FROM agent_runs
-        WHERE project_id = ?
-        ORDER BY id DESC
-        LIMIT ?
-        """,
-        (project_id, int(limit)),
-    ) as cur:
-        rows = [dict(row) for row in await cur.fetchall()]
-    rows.reverse()
-    for row in rows:
-        try:
-            row["metadata"] = json.loads(row.get("metadata", "{}"))
-        except Exception:
-            row["metadata"] = {}
-    return rows
+    rows = await db.execute_fetchall(sql, (project_id, int(limit)))
+    if columns is not None and "metadata" not in columns:
+        return _rows_to_dicts(rows)
+    return _rows_with_metadata(rows)
 
 
 async def add_task_artifact(
@@ -608,7 +1208,8 @@ async def add_task_artifact(
     url: str = "",
     metadata: dict[str, Any] | None = None,
 ) -> int:
-    async with db.execute(
+    artifact_id = await _insert(
+        db,
         """
         INSERT INTO task_artifacts (
             project_id, task_id, artifact_type, title,
@@ -623,11 +1224,10 @@ async def add_task_artifact(
             content,
             file_path,
             url,
-            json.dumps(metadata or {}),
+            json_codec.dumps(metadata or {}),
             _now(),
         ),
-    ) as cur:
-        artifact_id = int(cur.lastrowid)
+    )
     await db.commit()
     return artifact_id
 
@@ -641,26 +1241,19 @@ async def list_task_artifacts(
 ) -> list[dict[str, Any]]:
     if task_id is None:
         sql = (
-            "SELECT * FROM task_artifacts WHERE project_id = ? "
-            "ORDER BY id DESC LIMIT ?"
+            "SELECT * FROM (SELECT * FROM task_artifacts WHERE project_id = ? "
+            "ORDER BY id DESC LIMIT ?) ORDER BY id"
         )
         params: tuple[Any, ...] = (project_id, int(limit))
     else:
         sql = (
-            "SELECT * FROM task_artifacts WHERE project_id = ? AND task_id = ? "
-            "ORDER BY id DESC LIMIT ?"
+            "SELECT * FROM (SELECT * FROM task_artifacts WHERE project_id = ? AND task_id = ? "
+            "ORDER BY id DESC LIMIT ?) ORDER BY id"
         )
         params = (project_id, int(task_id), int(limit))
 
-    async with db.execute(sql, params) as cur:
-        rows = [dict(row) for row in await cur.fetchall()]
-    rows.reverse()
-    for row in rows:
-        try:
-            row["metadata"] = json.loads(row.get("metadata", "{}"))
-        except Exception:
-            row["metadata"] = {}
-    return rows
+    rows = await db.execute_fetchall(sql, params)
+    return _rows_with_metadata(rows)
 
 
 # ------------------------------------------------------------------
@@ -676,7 +1269,7 @@ async def ensure_user(
     last_name: str = "",
 ) -> dict[str, Any]:
     now = _now()
-    await db.execute(
+    rows = await db.execute_fetchall(
         """
         INSERT INTO users (
             telegram_user_id, username, first_name, last_name, created_at, updated_at, last_seen_at
@@ -687,32 +1280,29 @@ async def ensure_user(
             last_name = excluded.last_name,
             updated_at = excluded.updated_at,
             last_seen_at = excluded.last_seen_at
+        RETURNING *
         """,
         (int(telegram_user_id), username, first_name, last_name, now, now, now),
     )
     await db.commit()
-    user = await get_user_by_telegram_id(db, telegram_user_id)
-    if not user:
+    if not rows:
         raise ValueError("Failed to load ensured user.")
-    return user
+    return dict(rows[0])
 
 
 async def get_user_by_telegram_id(
     db: aiosqlite.Connection,
     telegram_user_id: int,
 ) -> dict[str, Any] | None:
-    async with db.execute(
+    return await _fetch_one(
+        db,
         "SELECT * FROM users WHERE telegram_user_id = ?",
         (int(telegram_user_id),),
-    ) as cur:
-        row = await cur.fetchone()
-    return dict(row) if row else None
+    )
 
 
 async def get_user_by_id(db: aiosqlite.Connection, user_id: int) -> dict[str, Any] | None:
-    async with db.execute("SELECT * FROM users WHERE id = ?", (int(user_id),)) as cur:
-        row = await cur.fetchone()
-    return dict(row) if row else None
+    return await _fetch_one(db, "SELECT * FROM users WHERE id = ?", (int(user_id),))
 
 
 async def set_user_memory_enabled(
@@ -743,9 +1333,10 @@ async def update_user_core_fields(
     if not fields:
         return
     fields["updated_at"] = _now()
-    sets = ", ".join(f"{k} = ?" for k in fields)
-    vals = list(fields.values()) + [int(user_id)]
-    await db.execute(f"UPDATE users SET {sets} WHERE id = ?", vals)
+    sql, cols = _update_sql("users", fields)
+    vals = [fields[c] for c in cols]
+    vals.append(int(user_id))
+    await db.execute(sql, vals)
     await db.commit()
 
 
@@ -776,7 +1367,7 @@ async def get_user_preferences(
     *,
     user_id: int,
 ) -> list[dict[str, Any]]:
-    async with db.execute(
+    rows = await db.execute_fetchall(
         """
         SELECT user_id, pref_key, pref_value, source, updated_at
         FROM user_preferences
@@ -784,8 +1375,8 @@ async def get_user_preferences(
         ORDER BY pref_key
         """,
         (int(user_id),),
-    ) as cur:
-        return [dict(row) for row in await cur.fetchall()]
+    )
+    return _rows_to_dicts(rows)
 
 
 async def get_provider_usage_summary(
@@ -798,8 +1389,8 @@ async def get_provider_usage_summary(
     This is a compatibility helper used by heartbeat snapshot tasks.
     """
     if date is None:
-        date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    async with db.execute(
+        date = _today()
+    rows = await db.execute_fetchall(
         """
         SELECT
             provider_name,
@@ -813,40 +1404,34 @@ async def get_provider_usage_summary(
         ORDER BY provider_name
         """,
         (date,),
-    ) as cur:
-        return [dict(row) for row in await cur.fetchall()]
+    )
+    return _rows_to_dicts(rows)
 
 
-async def add_or_update_profile_fact(
-    db: aiosqlite.Connection,
-    *,
+def _upsert_profile_fact_sync(
+    conn: sqlite3.Connection,
     user_id: int,
-    fact_key: str,
-    fact_value: str,
-    source: str = "chat",
-    confidence: float = 0.6,
+    key: str,
+    value: str,
+    source: str,
+    conf: float,
+    now: str,
 ) -> dict[str, Any]:
-    now = _now()
-    key = fact_key.strip().lower()
-    value = fact_value.strip()
-    conf = max(0.0, min(float(confidence), 1.0))
-
-    async with db.execute(
+    row = conn.execute(
         """
         SELECT id, confidence
         FROM user_profile_facts
         WHERE user_id = ? AND fact_key = ? AND fact_value = ?
         ORDER BY id DESC LIMIT 1
         """,
-        (int(user_id), key, value),
-    ) as cur:
-        row = await cur.fetchone()
+        (user_id, key, value),
+    ).fetchone()
 
     if row:
         fact_id = int(row[0])
         prior_conf = float(row[1] or 0.0)
         merged_conf = max(prior_conf, conf)
-        await db.execute(
+        conn.execute(
             """
             UPDATE user_profile_facts
             SET is_active = 1, source = ?, confidence = ?, updated_at = ?
@@ -855,44 +1440,62 @@ async def add_or_update_profile_fact(
             (source, merged_conf, now, fact_id),
         )
     else:
-        await db.execute(
+        fact_id = conn.execute(
             """
             INSERT INTO user_profile_facts (
                 user_id, fact_key, fact_value, source, confidence, is_active, created_at, updated_at
             ) VALUES (?, ?, ?, ?, ?, 1, ?, ?)
             """,
-            (int(user_id), key, value, source, conf, now, now),
-        )
-    await db.commit()
+            (user_id, key, value, source, conf, now, now),
+        ).lastrowid
+    conn.commit()
 
-    async with db.execute(
-        """
-        SELECT *
-        FROM user_profile_facts
-        WHERE user_id = ? AND fact_key = ? AND fact_value = ?
-        ORDER BY id DESC LIMIT 1
-        """,
-        (int(user_id), key, value),
-    ) as cur:
-        saved = await cur.fetchone()
+    saved = conn.execute(
+        "SELECT * FROM user_profile_facts WHERE id = ?", (fact_id,)
+    ).fetchone()
     if not saved:
         raise ValueError("Unable to load saved fact.")
     return dict(saved)
 
 
+async def add_or_update_profile_fact(
+    db: aiosqlite.Connection,
+    *,
+    user_id: int,
+    fact_key: str,
+    fact_value: str,
+    source: str = "chat",
+    confidence: float = 0.6,
+) -> dict[str, Any]:
+    now = _now()
+    key = fact_key.strip().lower()
+    value = fact_value.strip()
+    conf = max(0.0, min(float(confidence), 1.0))
+
+    return await _run_sync(
+        db, _upsert_profile_fact_sync, int(user_id), key, value, source, conf, now,
+    )
+
+
+_SELECT_ACTIVE_PROFILE_FACTS = (
+    "SELECT * FROM user_profile_facts WHERE user_id = ? AND is_active = 1 "
+    "ORDER BY updated_at DESC, id DESC"
+)
+_SELECT_ALL_PROFILE_FACTS = (
+    "SELECT * FROM user_profile_facts WHERE user_id = ? "
+    "ORDER BY updated_at DESC, id DESC"
+)
+
+
 async def list_profile_facts(
     db: aiosqlite.Connection,
     *,
     user_id: int,
     active_only: bool = True,
 ) -> list[dict[str, Any]]:
-    sql = (
-        "SELECT * FROM user_profile_facts WHERE user_id = ? "
-        + ("AND is_active = 1 " if active_only else "")
-        + "ORDER BY updated_at DESC, id DESC"
-    )
-    async with db.execute(sql, (int(user_id),)) as cur:
-        return [dict(row) for row in await cur.fetchall()]
+    sql = _SELECT_ACTIVE_PROFILE_FACTS if active_only else _SELECT_ALL_PROFILE_FACTS
+    rows = await db.execute_fetchall(sql, (int(user_id),))
+    return _rows_to_dicts(rows)
 
 
 async def forget_profile_facts(
@@ -905,14 +1508,18 @@ async def forget_profile_facts(
     if not needle:
         return 0
 
+    # fact_key is stored lowercased, so it is compared directly.  instr()
+    # is a plain substring test: unlike LIKE it needs no pattern compile and
+    # does not treat "%" or "_" in the needle as wildcards.  The scan is
+    # bounded to the user's active facts by idx_user_facts_user.
     cur = await db.execute(
         """
         UPDATE user_profile_facts
         SET is_active = 0, updated_at = ?
         WHERE user_id = ? AND is_active = 1
-          AND (lower(fact_key) = ? OR lower(fact_value) LIKE ?)
+          AND (fact_key = ? OR instr(lower(fact_value), ?) > 0)
         """,
-        (_now(), int(user_id), needle, f"%{needle}%"),
+        (_now(), int(user_id), needle, needle),
     )
     await db.commit()
     return int(cur.rowcount or 0)
@@ -928,7 +1535,8 @@ async def add_user_conversation(
     telegram_message_id: str = "",
     metadata: dict[str, Any] | None = None,
 ) -> int:
-    async with db.execute(
+    cid = await _insert(
+        db,
         """
         INSERT INTO user_conversations (
             user_id, role, content, chat_id, telegram_message_id, metadata, created_at
@@ -940,12 +1548,11 @@ async def add_user_conversation(
             content,
             chat_id,
             telegram_message_id,
-            json.dumps(metadata or {}),
+            json_codec.dumps(metadata or {}),
             _now(),
         ),
-    ) as cur:
-        cid = int(cur.lastrowid)
-    await db.commit()
+    )
+    _commit_later(db)
     return cid
 
 
@@ -955,24 +1562,20 @@ async def list_user_conversations(
     user_id: int,
     limit: int = 50,
 ) -> list[dict[str, Any]]:
-    async with db.execute(
+    rows = await db.execute_fetchall(
         """
-        SELECT *
-        FROM user_conversations
-        WHERE user_id = ?
-        ORDER BY id DESC
-        LIMIT ?
+        SELECT * FROM (
+            SELECT *
+            FROM user_conversations
+            WHERE user_id = ?
+            ORDER BY id DESC
+            LIMIT ?
+        )
+        ORDER BY id
         """,
         (int(user_id), int(limit)),
-    ) as cur:
-        rows = [dict(row) for row in await cur.fetchall()]
-    rows.reverse()
-    for row in rows:
-        try:
-            row["metadata"] = json.loads(row.get("metadata", "{}"))
-        except Exception:
-            row["metadata"] = {}
-    return rows
+    )
+    return _rows_with_metadata(rows)
 
 
 async def add_memory_audit_log(
@@ -984,14 +1587,14 @@ async def add_memory_audit_log(
     target_key: str = "",
     detail: str = "",
 ) -> int:
-    async with db.execute(
+    audit_id = await _insert(
+        db,
         """
         INSERT INTO memory_audit_log (
             user_id, action, target_type, target_key, detail, created_at
         ) VALUES (?, ?, ?, ?, ?, ?)
         """,
         (int(user_id), action, target_type, target_key, detail, _now()),
-    ) as cur:
-        audit_id = int(cur.lastrowid)
-    await db.commit()
+    )
+    _commit_later(db)
     return audit_id
@@ -13,31 +13,43 @@ are rejected immediately.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import ssl
 import os
 import uuid
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 import websockets
 from websockets.asyncio.server import ServerConnection
 
 import gateway_config as cfg
+import json_codec
 
 logger = logging.getLogger("skynet.gateway")
 
+
+async def _send_json(ws: ServerConnection, message: dict[str, Any]) -> None:
+    # ``text=True`` sends the encoded bytes as a text frame.
+    await ws.send(json_codec.dumpb(message), text=True)
+
+
+# Control frames never change; encode them once.
+_EMERGENCY_STOP_FRAME = json_codec.dumpb({"type": "emergency_stop"})
+_RESUME_FRAME = json_codec.dumpb({"type": "resume"})
+
 # ---------------------------------------------------------------------------
 # Agent connection state
 # ---------------------------------------------------------------------------
 
-# The single connected agent (or None).
+# The single connected agent (or None).  Read and assigned only on the
+# event loop thread; keep every check-and-assign free of ``await`` so no
+# other connection can interleave between them.
 _agent_ws: ServerConnection | None = None
-_agent_lock = asyncio.Lock()
 
 # Maps request_id → Future that resolves with the agent's response.
+# Only touched from the event loop thread and never across an ``await``,
+# so plain dict operations need no lock.
 _pending: dict[str, asyncio.Future[dict[str, Any]]] = {}
-_pending_lock = asyncio.Lock()
 
 # Event that signals at least one agent is connected.
 agent_connected = asyncio.Event()
@@ -84,11 +96,10 @@ async def send_action(
     loop = asyncio.get_running_loop()
     future: asyncio.Future[dict[str, Any]] = loop.create_future()
 
-    async with _pending_lock:
-        _pending[request_id] = future
+    _pending[request_id] = future
 
     try:
-        await _agent_ws.send(json.dumps(message))
+        await _send_json(_agent_ws, message)
         logger.info("Sent action '%s' (req=%s) to agent.", action, request_id)
 
         result = await asyncio.wait_for(future, timeout=timeout)
@@ -99,15 +110,14 @@ async def send_action(
         raise
 
     finally:
-        async with _pending_lock:
-            _pending.pop(request_id, None)
+        _pending.pop(request_id, None)
 
 
 async def send_emergency_stop() -> None:
     """Send the emergency stop control message to the agent."""
     if _agent_ws is None:
         raise RuntimeError("No agent connected.")
-    await _agent_ws.send(json.dumps({"type": "emergency_stop"}))
+    await _agent_ws.send(_EMERGENCY_STOP_FRAME, text=True)
     logger.critical("Emergency stop sent to agent.")
 
 
@@ -115,7 +125,7 @@ async def send_resume() -> None:
     """Send the resume control message to the agent."""
     if _agent_ws is None:
         raise RuntimeError("No agent connected.")
-    await _agent_ws.send(json.dumps({"type": "resume"}))
+    await _agent_ws.send(_RESUME_FRAME, text=True)
     logger.info("Resume sent to agent.")
 
 
@@ -140,13 +150,12 @@ async def _handler(ws: ServerConnection) -> None:
         return
 
     # ---- Accept (single agent at a time) ----
-    async with _agent_lock:
-        if _agent_ws is not None:
-            logger.warning("Rejected connection: another agent already connected.")
-            await ws.close(4002, "Another agent is already connected")
-            return
-        _agent_ws = ws
-        agent_connected.set()
+    if _agent_ws is not None:
+        logger.warning("Rejected connection: another agent already connected.")
+        await ws.close(4002, "Another agent is already connected")
+        return
+    _agent_ws = ws
+    agent_connected.set()
 
     remote = ws.remote_address
     logger.info("Agent connected from %s", remote)
@@ -157,15 +166,14 @@ async def _handler(ws: ServerConnection) -> None:
     except websockets.exceptions.ConnectionClosed as exc:
         logger.info("Agent disconnected (%s).", exc)
     finally:
-        async with _agent_lock:
-            _agent_ws = None
-            agent_connected.clear()
+        _agent_ws = None
+        agent_connected.clear()
         # Cancel any pending futures so callers don't hang.
-        async with _pending_lock:
-            for rid, fut in _pending.items():
-                if not fut.done():
-                    fut.set_exception(RuntimeError("Agent disconnected."))
-            _pending.clear()
+        pending = list(_pending.values())
+        _pending.clear()
+        for fut in pending:
+            if not fut.done():
+                fut.set_exception(RuntimeError("Agent disconnected."))
         logger.info("Agent connection cleaned up.")
 
 
@@ -180,51 +188,74 @@ def _extract_token(ws: ServerConnection) -> str:
     return ""
 
 
+async def _on_agent_hello(msg: dict[str, Any]) -> None:
+    caps = msg.get("capabilities", [])
+    logger.info("Agent hello received. Capabilities: %s", caps)
+
+
+async def _on_action_response(msg: dict[str, Any]) -> None:
+    request_id = msg.get("request_id", "")
+    future = _pending.get(request_id)
+    if future and not future.done():
+        future.set_result(msg)
+    else:
+        logger.warning("Response for unknown/expired request_id=%s", request_id)
+
+
+async def _on_control_ack(msg: dict[str, Any]) -> None:
+    logger.info("Agent acknowledged: %s", msg.get("type"))
+
+
+async def _on_pong(msg: dict[str, Any]) -> None:
+    return
+
+
+# Inbound message type → handler; one dict lookup per frame.
+_MESSAGE_HANDLERS: dict[str, Callable[[dict[str, Any]], Awaitable[None]]] = {
+    "agent_hello": _on_agent_hello,
+    "action_response": _on_action_response,
+    "emergency_stop_ack": _on_control_ack,
+    "resume_ack": _on_control_ack,
+    "pong": _on_pong,
+}
+
+
 async def _on_message(raw: str | bytes) -> None:
     """Route an inbound message from the agent."""
     try:
-        msg: dict[str, Any] = json.loads(raw)
-    except (json.JSONDecodeError, TypeError):
+        msg: dict[str, Any] = json_codec.loads(raw)
+    except (ValueError, TypeError):
         logger.warning("Non-JSON frame from agent — ignoring.")
         return
 
     msg_type = msg.get("type", "")
-
-    if msg_type == "agent_hello":
-        caps = msg.get("capabilities", [])
-        logger.info("Agent hello received. Capabilities: %s", caps)
-        return
-
-    if msg_type == "action_response":
-        request_id = msg.get("request_id", "")
-        async with _pending_lock:
-            future = _pending.get(request_id)
-        if future and not future.done():
-            future.set_result(msg)
-        else:
-            logger.warning("Response for unknown/expired request_id=%s", request_id)
-        return
-
-    if msg_type in ("emergency_stop_ack", "resume_ack"):
-        logger.info("Agent acknowledged: %s", msg_type)
-        return
-
-    if msg_type == "pong":
+    handler = _MESSAGE_HANDLERS.get(msg_type) if isinstance(msg_type, str) else None
+    if handler is None:
+        logger.debug("Unhandled agent message type: %s", msg_type)
         return
-
-    logger.debug("Unhandled agent message type: %s", msg_type)
+    await handler(msg)
 
 
 # ---------------------------------------------------------------------------
 # Server lifecycle
 # ---------------------------------------------------------------------------
 
+_SSL_CTX: ssl.SSLContext | None = None
+
+
 def _build_ssl_context() -> ssl.SSLContext | None:
     """Load TLS cert/key if they exist, otherwise run without TLS."""
+    global _SSL_CTX
+    if _SSL_CTX is not None:
+        return _SSL_CTX
     if os.path.isfile(cfg.TLS_CERT) and os.path.isfile(cfg.TLS_KEY):
         ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        # TLS 1.3 only: 1-RTT handshakes, and the agent is ours to upgrade.
+        ctx.minimum_version = ssl.TLSVersion.TLSv1_3
+        ctx.options |= ssl.OP_NO_COMPRESSION
         ctx.load_cert_chain(cfg.TLS_CERT, cfg.TLS_KEY)
         logger.info("TLS enabled (cert=%s).", cfg.TLS_CERT)
+        _SSL_CTX = ctx
         return ctx
     logger.info(
         "TLS cert/key not found (%s, %s). Running WITHOUT TLS — "
@@ -1,5 +1,5 @@
 """SKYNET Heartbeat — Autonomous periodic task scheduler."""
 
-from .scheduler import HeartbeatScheduler, HeartbeatTask
+from .scheduler import HeartbeatContext, HeartbeatScheduler, HeartbeatTask
 
-__all__ = ["HeartbeatScheduler", "HeartbeatTask"]
+__all__ = ["HeartbeatContext", "HeartbeatScheduler", "HeartbeatTask"]
@@ -12,15 +12,16 @@ should complete quickly (< 30s) to avoid blocking other tasks.
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import Any, Callable, Awaitable
+from typing import Any, Awaitable, Callable, Iterator
 
 logger = logging.getLogger("skynet.heartbeat")
 
 
-@dataclass
+@dataclass(slots=True)
 class HeartbeatTask:
     """Definition of a periodic background task."""
 
@@ -29,18 +30,33 @@ class HeartbeatTask:
     interval_seconds: int
     handler: Callable[..., Awaitable[None]]
     enabled: bool = True
-    last_run: float = 0.0
+    last_run: float = 0.0        # time.monotonic() when the last run started
     run_count: int = 0
     last_error: str = ""
     context: Any = None          # arbitrary context passed to handler
 
 
+@dataclass(slots=True)
+class HeartbeatContext:
+    """Shared dependencies handed to the default heartbeat task handlers."""
+
+    sentinel: Any
+    alert_dispatcher: Any
+    memory_manager: Any
+    s3: Any
+    db: Any
+    gateway_api_url: str
+    active_project_ids: list[str] = field(default_factory=list)
+
+
 class HeartbeatScheduler:
     """
     Manages periodic autonomous tasks.
 
     Start the scheduler with ``await start()`` — it runs forever in a
-    background asyncio task, checking every tick which tasks are due.
+    background asyncio task, sleeping until the earliest task is due.
+    Due times live in a min-heap; ``tick_interval`` only caps how long the
+    loop sleeps between checks.
     """
 
     def __init__(self, tick_interval: int = 60):
@@ -48,10 +64,15 @@ class HeartbeatScheduler:
         self._running = False
         self._task: asyncio.Task | None = None
         self._tick_interval = tick_interval
+        # (due time, task name); entries that no longer match ``_due`` are stale.
+        self._heap: list[tuple[float, str]] = []
+        self._due: dict[str, float] = {}
+        self._wakeup = asyncio.Event()
 
     def register(self, task: HeartbeatTask) -> None:
         """Register a periodic task."""
         self._tasks[task.name] = task
+        self._schedule(task)
         logger.info(
             "Heartbeat task registered: %s (every %ds)",
             task.name, task.interval_seconds,
@@ -59,6 +80,7 @@ class HeartbeatScheduler:
 
     def unregister(self, name: str) -> bool:
         """Remove a task by name."""
+        self._due.pop(name, None)
         return self._tasks.pop(name, None) is not None
 
     async def start(self) -> None:
@@ -95,28 +117,34 @@ class HeartbeatScheduler:
         task = self._tasks.get(name)
         if task:
             task.enabled = True
+            if name not in self._due:
+                self._schedule(task)
             logger.info("Heartbeat task resumed: %s", name)
             return True
         return False
 
-    def get_status(self) -> list[dict[str, Any]]:
-        """Return status of all registered tasks."""
-        return [
-            {
+    def iter_status(self) -> Iterator[dict[str, Any]]:
+        """Yield the status of each registered task."""
+        now = time.monotonic()
+        wall_offset = time.time() - now
+        for t in self._tasks.values():
+            yield {
                 "name": t.name,
                 "description": t.description,
                 "interval_seconds": t.interval_seconds,
                 "enabled": t.enabled,
-                "last_run": t.last_run,
+                "last_run": t.last_run + wall_offset if t.last_run else 0.0,
                 "run_count": t.run_count,
                 "last_error": t.last_error,
                 "next_run_in": max(
                     0,
-                    t.interval_seconds - (time.time() - t.last_run),
+                    t.interval_seconds - (now - t.last_run),
                 ) if t.last_run else 0,
             }
-            for t in self._tasks.values()
-        ]
+
+    def get_status(self) -> list[dict[str, Any]]:
+        """Return status of all registered tasks."""
+        return list(self.iter_status())
 
     @property
     def is_running(self) -> bool:
@@ -126,43 +154,67 @@ class HeartbeatScheduler:
     def task_count(self) -> int:
         return len(self._tasks)
 
+    def _schedule(self, task: HeartbeatTask) -> None:
+        """Queue ``task`` for ``interval_seconds`` after its last run started."""
+        if task.last_run:
+            due = task.last_run + task.interval_seconds
+        else:
+            due = time.monotonic()  # Never run: due now.
+        self._due[task.name] = due
+        heapq.heappush(self._heap, (due, task.name))
+        if self._heap[0] == (due, task.name):
+            self._wakeup.set()  # New earliest deadline; re-arm the sleep.
+
     async def _loop(self) -> None:
-        """Main heartbeat loop — check and run due tasks each tick."""
+        """Main heartbeat loop — run due tasks, then sleep until the next one."""
         logger.info("Heartbeat loop started with %d tasks", len(self._tasks))
         while self._running:
+            self._wakeup.clear()
             try:
                 await self._tick()
             except asyncio.CancelledError:
                 break
             except Exception:
                 logger.exception("Heartbeat tick error")
-            await asyncio.sleep(self._tick_interval)
+            delay = self._tick_interval
+            if self._heap:
+                delay = min(delay, max(0.0, self._heap[0][0] - time.monotonic()))
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
 
     async def _tick(self) -> None:
-        """One tick — run all tasks that are due."""
-        now = time.time()
-        for task in self._tasks.values():
+        """Pop and run every task whose due time has passed."""
+        now = time.monotonic()
+        while self._heap and self._heap[0][0] <= now:
+            due, name = heapq.heappop(self._heap)
+            task = self._tasks.get(name)
+            if task is None or self._due.get(name) != due:
+                continue  # Unregistered or rescheduled since this entry was pushed.
+            del self._due[name]
             if not task.enabled:
-                continue
-            elapsed = now - task.last_run
-            if elapsed < task.interval_seconds:
-                continue
-
-            # Task is due.
-            try:
-                logger.debug("Running heartbeat task: %s", task.name)
-                await asyncio.wait_for(
-                    task.handler(task.context),
-                    timeout=30.0,
-                )
-                task.last_run = time.time()
-                task.run_count += 1
-                task.last_error = ""
-            except asyncio.TimeoutError:
-                task.last_error = "Timed out (30s limit)"
-                logger.warning("Heartbeat task %s timed out", task.name)
-            except Exception as exc:
-                task.last_error = str(exc)
-                logger.warning("Heartbeat task %s failed: %s", task.name, exc)
-            # Always update last_run to prevent rapid retries on failure.
-            task.last_run = time.time()
+                continue  # Paused; resume_task() queues it again.
+            await self._run(task)
+            self._schedule(task)
+
+    async def _run(self, task: HeartbeatTask) -> None:
+        """Run one task under the 30s limit and record the outcome."""
+        start = time.monotonic()
+        try:
+            logger.debug("Running heartbeat task: %s", task.name)
+            await asyncio.wait_for(
+                task.handler(task.context),
+                timeout=30.0,
+            )
+            task.run_count += 1
+            task.last_error = ""
+        except asyncio.TimeoutError:
+            task.last_error = "Timed out (30s limit)"
+            logger.warning("Heartbeat task %s timed out", task.name)
+        except Exception as exc:
+            task.last_error = str(exc)
+            logger.warning("Heartbeat task %s failed: %s", task.name, exc)
+        # Set on failure too, so a failing task waits a full interval.
+        # Measured from the start, a slow handler does not push back the cadence.
+        task.last_run = start
@@ -13,6 +13,8 @@ import logging
 from datetime import datetime, timezone
 from typing import Any
 
+from .scheduler import HeartbeatTask
+
 logger = logging.getLogger("skynet.heartbeat.tasks")
 
 
@@ -51,13 +53,40 @@ async def memory_sync(ctx: Any) -> None:
         return
 
     project_ids = getattr(ctx, "active_project_ids", [])
+    if not project_ids:
+        return
+
+    from db import store
+    try:
+        projects = await store.get_projects_by_ids(ctx.db, project_ids)
+    except Exception as exc:
+        logger.warning("Memory sync could not load projects: %s", exc)
+        return
     for pid in project_ids:
+        if pid not in projects:
+            continue
         try:
-            await ctx.memory_manager.sync_to_s3(pid)
+            await ctx.memory_manager.sync_to_s3(pid, project=projects[pid])
         except Exception as exc:
             logger.warning("Memory sync failed for project %s: %s", pid, exc)
 
 
+async def flush_provider_usage(ctx: Any) -> None:
+    """
+    Every tick: Persist buffered AI provider usage counters.
+
+    Context requires: db
+    """
+    if not ctx or not hasattr(ctx, "db"):
+        return
+
+    from db import store
+    try:
+        await store.flush_provider_usage(ctx.db)
+    except Exception as exc:
+        logger.warning("Provider usage flush failed: %s", exc)
+
+
 async def provider_usage_snapshot(ctx: Any) -> None:
     """
     Every 6h: Snapshot AI provider usage stats to S3.
@@ -69,6 +98,7 @@ async def provider_usage_snapshot(ctx: Any) -> None:
 
     try:
         from db import store
+        await store.flush_provider_usage(ctx.db)
         usage = await store.get_provider_usage_summary(ctx.db)
         if usage:
             await ctx.s3.snapshot_provider_usage(usage)
@@ -103,30 +133,37 @@ async def daily_backup(ctx: Any) -> None:
         logger.warning("Daily backup failed: %s", exc)
 
 
-# Registry of default heartbeat tasks with their intervals.
-DEFAULT_TASKS = [
-    {
-        "name": "health_check",
-        "description": "Run Sentinel health checks",
-        "interval_seconds": 300,       # 5 minutes
-        "handler": health_check,
-    },
-    {
-        "name": "memory_sync",
-        "description": "Sync project memory to S3",
-        "interval_seconds": 1800,      # 30 minutes
-        "handler": memory_sync,
-    },
-    {
-        "name": "provider_usage_snapshot",
-        "description": "Snapshot AI provider usage to S3",
-        "interval_seconds": 21600,     # 6 hours
-        "handler": provider_usage_snapshot,
-    },
-    {
-        "name": "daily_backup",
-        "description": "Backup active projects to S3",
-        "interval_seconds": 86400,     # 24 hours
-        "handler": daily_backup,
-    },
-]
+# Default heartbeat tasks with their intervals.  These are templates: main()
+# registers a copy of each with the shared context attached.
+DEFAULT_TASK_TEMPLATES: tuple[HeartbeatTask, ...] = (
+    HeartbeatTask(
+        name="health_check",
+        description="Run Sentinel health checks",
+        interval_seconds=300,          # 5 minutes
+        handler=health_check,
+    ),
+    HeartbeatTask(
+        name="memory_sync",
+        description="Sync project memory to S3",
+        interval_seconds=1800,         # 30 minutes
+        handler=memory_sync,
+    ),
+    HeartbeatTask(
+        name="flush_provider_usage",
+        description="Persist buffered AI provider usage",
+        interval_seconds=60,           # 1 minute
+        handler=flush_provider_usage,
+    ),
+    HeartbeatTask(
+        name="provider_usage_snapshot",
+        description="Snapshot AI provider usage to S3",
+        interval_seconds=21600,        # 6 hours
+        handler=provider_usage_snapshot,
+    ),
+    HeartbeatTask(
+        name="daily_backup",
+        description="Backup active projects to S3",
+        interval_seconds=86400,        # 24 hours
+        handler=daily_backup,
+    ),
+)
@@ -0,0 +1,57 @@
+"""
+SKYNET — JSON Codec
+
+The gateway's single JSON entry point.  Uses orjson when it is installed
+and the stdlib ``json`` module otherwise, with matching output: compact,
+UTF-8 (no ASCII escaping), non-string dict keys allowed, and unknown
+types rendered with ``str()``.
+
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+``json.JSONDecodeError`` (or ValueError) whichever backend is active.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback.
+    orjson = None
+
+__all__ = ["dumps", "dumpb", "loads"]
+
+
+if orjson is not None:
+    def dumpb(value: Any) -> bytes:
+        """Encode *value* as compact UTF-8 JSON bytes (wire format)."""
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    def dumps(value: Any, *, indent: bool = False, sort_keys: bool = False) -> str:
+        """Encode *value* as JSON text, optionally indented and key-sorted."""
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(value, default=str, option=option).decode()
+
+    loads = orjson.loads
+else:
+    def dumpb(value: Any) -> bytes:
+        """Encode *value* as compact UTF-8 JSON bytes (wire format)."""
+        return dumps(value).encode()
+
+    def dumps(value: Any, *, indent: bool = False, sort_keys: bool = False) -> str:
+        """Encode *value* as JSON text, optionally indented and key-sorted."""
+        return json.dumps(
+            value,
+            default=str,
+            ensure_ascii=False,
+            indent=2 if indent else None,
+            separators=None if indent else (",", ":"),
+            sort_keys=sort_keys,
+        )
+
+    loads = json.loads
@@ -36,7 +36,7 @@ import sys
 import gateway_config as cfg
 import bot_config
 from gateway import start_ws_server
-from api import start_http_api
+from api import dispatch_action, start_http_api
 
 
 def _configure_logging() -> None:
@@ -61,22 +61,44 @@ def _print_banner() -> None:
   WebSocket : 0.0.0.0:{ws_port}
   HTTP API  : {http_host}:{http_port}
   TLS cert  : {tls}
-  Telegram  : enabled
+  Telegram  : {telegram}
   DB        : {db}
 """.format(
             ws_port=cfg.WS_PORT,
             http_host=cfg.HTTP_HOST,
             http_port=cfg.HTTP_PORT,
             tls=cfg.TLS_CERT if cfg.TLS_CERT else "DISABLED",
+            telegram="DISABLED" if bot_config.DISABLE_TELEGRAM_BOT else "enabled",
             db=bot_config.DB_PATH,
         )
     )
 
 
+async def _log_project_progress(project_id: str, event_type: str, summary: str) -> None:
+    """Orchestrator progress sink used when the Telegram bot is disabled."""
+    logging.getLogger("skynet").info("Project %s: %s — %s", project_id, event_type, summary)
+
+
+async def _deny_worker_approval(project_id: str, action: str, params: dict) -> bool:
+    """Without the bot nobody can approve gated actions, so refuse them."""
+    if bot_config.AUTO_APPROVE_GIT_ACTIONS and action in {"git_push", "gh_create_repo"}:
+        return True
+    logging.getLogger("skynet").warning(
+        "Denied %s for project %s: approval requires the Telegram bot.", action, project_id,
+    )
+    return False
+
+
 async def _main() -> None:
     _configure_logging()
     _print_banner()
 
+    # Python 3.12+: run new tasks eagerly until their first real suspension,
+    # so coroutines that finish synchronously never allocate a scheduled Task.
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
     logger = logging.getLogger("skynet")
 
     # ---- Validate required secrets ----
@@ -88,7 +110,7 @@ async def _main() -> None:
         )
         sys.exit(1)
 
-    if not bot_config.TELEGRAM_BOT_TOKEN:
+    if not bot_config.DISABLE_TELEGRAM_BOT and not bot_config.TELEGRAM_BOT_TOKEN:
         logger.error("TELEGRAM_BOT_TOKEN is not set.")
         sys.exit(1)
 
@@ -98,6 +120,7 @@ async def _main() -> None:
         os.makedirs(db_dir, exist_ok=True)
 
     # ---- Initialize SQLite database ----
+    from db import store
     from db.schema import init_db
 
     db = await init_db(bot_config.DB_PATH)
@@ -140,9 +163,13 @@ async def _main() -> None:
     logger.info("Policy engine online.")
 
     # ---- SKYNET Skill Registry ----
+    from skills.base import close_agent_session
     from skills.registry import build_default_registry
 
-    skill_registry = build_default_registry(
+    # Walks the skills directory and downloads remote SKILL.md files with
+    # blocking I/O, so keep it off the event loop.
+    skill_registry = await asyncio.to_thread(
+        build_default_registry,
         external_skills_dir=bot_config.EXTERNAL_SKILLS_DIR,
         external_skill_urls=bot_config.EXTERNAL_SKILL_URLS,
         always_on_prompt_skills=bot_config.ALWAYS_ON_PROMPT_SKILLS,
@@ -155,6 +182,7 @@ async def _main() -> None:
     )
 
     # ---- SKYNET Memory Manager ----
+    from memory.backends import build_memory_backend
     from memory.manager import MemoryManager
 
     s3_storage = None
@@ -172,6 +200,11 @@ async def _main() -> None:
         db=db,
         gateway_api_url=bot_config.GATEWAY_API_URL,
         s3=s3_storage,
+        backend=build_memory_backend(
+            bot_config.MEMORY_BACKEND,
+            gateway_api_url=bot_config.GATEWAY_API_URL,
+            dispatch=dispatch_action,
+        ),
     )
 
     # ---- CHATHAN Execution Engine ----
@@ -198,44 +231,45 @@ async def _main() -> None:
     logger.info("Sentinel monitor online.")
 
     # ---- SKYNET Heartbeat Scheduler ----
-    from heartbeat.scheduler import HeartbeatScheduler, HeartbeatTask
-    from heartbeat.tasks import DEFAULT_TASKS
+    from dataclasses import replace
+
+    from heartbeat.scheduler import HeartbeatContext, HeartbeatScheduler
+    from heartbeat.tasks import DEFAULT_TASK_TEMPLATES
 
     heartbeat = HeartbeatScheduler(tick_interval=60)
 
-    # Create a simple context namespace for heartbeat tasks.
-    class _HBContext:
-        pass
-    hb_ctx = _HBContext()
-    hb_ctx.sentinel = sentinel
-    hb_ctx.alert_dispatcher = alert_dispatcher
-    hb_ctx.memory_manager = memory_manager
-    hb_ctx.s3 = s3_storage
-    hb_ctx.db = db
-    hb_ctx.gateway_api_url = bot_config.GATEWAY_API_URL
-    hb_ctx.active_project_ids = []
-
-    for task_def in DEFAULT_TASKS:
-        heartbeat.register(HeartbeatTask(
-            name=task_def["name"],
-            description=task_def["description"],
-            interval_seconds=task_def["interval_seconds"],
-            handler=task_def["handler"],
-            context=hb_ctx,
-        ))
+    hb_ctx = HeartbeatContext(
+        sentinel=sentinel,
+        alert_dispatcher=alert_dispatcher,
+        memory_manager=memory_manager,
+        s3=s3_storage,
+        db=db,
+        gateway_api_url=bot_config.GATEWAY_API_URL,
+    )
+
+    for template in DEFAULT_TASK_TEMPLATES:
+        heartbeat.register(replace(template, context=hb_ctx))
 
     # ---- Orchestrator ----
-    import telegram_bot
     from orchestrator.scheduler import Scheduler
     from orchestrator.project_manager import ProjectManager
 
+    # python-telegram-bot is a heavy import; API-only deployments skip it.
+    telegram_bot = None
+    if bot_config.DISABLE_TELEGRAM_BOT:
+        on_progress, request_approval = _log_project_progress, _deny_worker_approval
+    else:
+        import telegram_bot
+        on_progress = telegram_bot.on_project_progress
+        request_approval = telegram_bot.request_worker_approval
+
     scheduler = Scheduler(
         db=db,
         router=router,
         searcher=searcher,
         gateway_api_url=bot_config.GATEWAY_API_URL,
-        on_progress=telegram_bot.on_project_progress,
-        request_approval=telegram_bot.request_worker_approval,
+        on_progress=on_progress,
+        request_approval=request_approval,
         skill_registry=skill_registry,
         memory_manager=memory_manager,
     )
@@ -252,29 +286,44 @@ async def _main() -> None:
     logger.info("Project orchestrator ready (max %d parallel).", scheduler.max_parallel)
 
     # ---- Inject dependencies into Telegram bot ----
-    telegram_bot.set_dependencies(
-        project_manager,
-        router,
-        heartbeat=heartbeat,
-        sentinel=sentinel,
-        searcher=searcher,
-        skill_registry=skill_registry,
-    )
+    bot_app = None
+    if telegram_bot is not None:
+        telegram_bot.set_dependencies(
+            project_manager,
+            router,
+            heartbeat=heartbeat,
+            sentinel=sentinel,
+            searcher=searcher,
+            skill_registry=skill_registry,
+        )
+        bot_app = telegram_bot.build_app()
+
+    async def _start_bot() -> None:
+        # Non-blocking polling; the bot's own steps must stay ordered.
+        await bot_app.initialize()
+        await bot_app.start()
+        await bot_app.updater.start_polling(drop_pending_updates=True)
 
     # ---- Start core servers ----
-    ws_server = await start_ws_server()
-    http_runner = await start_http_api()
+    # The two servers are independent of each other, so bind them concurrently.
+    async with asyncio.TaskGroup() as tg:
+        ws_task = tg.create_task(start_ws_server())
+        http_task = tg.create_task(start_http_api())
+    ws_server = ws_task.result()
+    http_runner = http_task.result()
 
     # ---- Start Heartbeat Scheduler ----
+    # Only once both servers listen: health_check is due immediately and
+    # probes the HTTP API, so an earlier start reports a false outage.
     await heartbeat.start()
     logger.info("Heartbeat scheduler started (%d tasks).", heartbeat.task_count)
 
     # ---- Start Telegram bot (non-blocking polling) ----
-    bot_app = telegram_bot.build_app()
-    await bot_app.initialize()
-    await bot_app.start()
-    await bot_app.updater.start_polling(drop_pending_updates=True)
-    logger.info("Telegram bot polling started.")
+    if bot_app is not None:
+        await _start_bot()
+        logger.info("Telegram bot polling started.")
+    else:
+        logger.info("Telegram bot disabled (API-only mode).")
 
     logger.info("SKYNET initializing...")
     logger.info("Codename: CHATHAN active.")
@@ -295,12 +344,13 @@ async def _main() -> None:
         await heartbeat.stop()
 
         # Stop Telegram bot.
-        try:
-            await bot_app.updater.stop()
-            await bot_app.stop()
-            await bot_app.shutdown()
-        except Exception:
-            logger.exception("Error stopping Telegram bot.")
+        if bot_app is not None:
+            try:
+                await bot_app.updater.stop()
+                await bot_app.stop()
+                await bot_app.shutdown()
+            except Exception:
+                logger.exception("Error stopping Telegram bot.")
 
         # Cancel all running project workers.
         scheduler.cancel_all()
@@ -310,13 +360,31 @@ async def _main() -> None:
         await ws_server.wait_closed()
         await http_runner.cleanup()
 
+        # Close the shared HTTP sessions used for agent actions.
+        await memory_manager.close()
+        await project_manager.close()
+        await close_agent_session()
+
         # Close database.
+        await store.flush(db)
         await db.close()
 
         logger.info("SKYNET shut down.")
 
 
+def _install_uvloop() -> None:
+    """Use uvloop's event loop when it is installed (not available on Windows)."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 if __name__ == "__main__":
+    _install_uvloop()
     try:
         asyncio.run(_main())
     except KeyboardInterrupt:
@@ -0,0 +1,209 @@
+"""
+SKYNET — Memory Backends
+
+Where MemoryManager's .md files physically live.  The default
+AgentMemoryBackend reaches the laptop through the CHATHAN worker
+(file_read / file_write / append_file actions); LocalMemoryBackend
+reads and writes the gateway's own filesystem, for single-host and
+local-test deployments where the project paths are reachable directly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable
+
+import json_codec
+
+logger = logging.getLogger("skynet.archive")
+
+
+class MemoryBackend(ABC):
+    """Storage interface for memory files.  Failures are logged, not raised."""
+
+    name: str = "base"
+
+    @abstractmethod
+    async def read(self, path: str) -> str | None:
+        """Return the file's content, or None if it can't be read."""
+        ...
+
+    @abstractmethod
+    async def write(self, path: str, content: str) -> None:
+        """Create or overwrite *path* (parents are created as needed)."""
+        ...
+
+    @abstractmethod
+    async def append(self, path: str, content: str, *, unless_contains: str = "") -> None:
+        """
+        Append to *path*, creating it if missing.
+
+        With *unless_contains*, skip the append when the file already holds
+        that text; the check happens where the file lives, so a failed read
+        on the gateway side can never cause a duplicate.
+        """
+        ...
+
+    @abstractmethod
+    async def make_dirs(self, path: str) -> None:
+        """Create *path* and any missing parents."""
+        ...
+
+    async def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class AgentMemoryBackend(MemoryBackend):
+    """Memory files on the laptop, via the worker's file actions."""
+
+    name = "agent"
+
+    def __init__(
+        self,
+        gateway_api_url: str,
+        dispatch: Callable[..., Awaitable[dict[str, Any]]] | None = None,
+    ):
+        self.gateway_api_url = gateway_api_url
+        # In-process action dispatcher (api.dispatch_action); when unset,
+        # actions go through the HTTP API at gateway_api_url instead.
+        self._dispatch = dispatch
+        # One session (and connection pool) shared by every agent action;
+        # created lazily because __init__ may run outside the event loop.
+        self._session: Any | None = None
+        self._session_lock = asyncio.Lock()
+
+    async def read(self, path: str) -> str | None:
+        result = await self._action("file_read", {"file": path})
+        if result and not result.startswith("Error"):
+            return result
+        return None
+
+    async def write(self, path: str, content: str) -> None:
+        await self._action("file_write", {"file": path, "content": content})
+
+    async def append(self, path: str, content: str, *, unless_contains: str = "") -> None:
+        params = {"file": path, "content": content}
+        if unless_contains:
+            params["unless_contains"] = unless_contains
+        await self._action("append_file", params)
+
+    async def make_dirs(self, path: str) -> None:
+        await self._action("create_directory", {"directory": path})
+
+    async def close(self) -> None:
+        """Close the shared HTTP session (called on gateway shutdown)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _get_session(self) -> Any:
+        """Return the shared aiohttp session, creating it on first use."""
+        import aiohttp
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                self._session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=30),
+                    timeout=aiohttp.ClientTimeout(total=15),
+                    json_serialize=json_codec.dumps,
+                )
+            return self._session
+
+    async def _action(self, action: str, params: dict) -> str | None:
+        """Send an action to the laptop agent and return its stdout."""
+        try:
+            if self._dispatch is not None:
+                result = await self._dispatch(action, params, confirmed=True)
+            else:
+                session = await self._get_session()
+                async with session.post(
+                    f"{self.gateway_api_url}/action",
+                    json={"action": action, "params": params, "confirmed": True},
+                ) as resp:
+                    result = await resp.json(loads=json_codec.loads)
+        except Exception as exc:
+            logger.warning("Agent action %s error: %s", action, exc)
+            return None
+
+        if result.get("status") != "ok":
+            logger.warning("Agent action %s failed: %s", action, result)
+            return None
+        inner = result.get("result", "")
+        if isinstance(inner, dict):
+            # Executors reply with {"returncode", "stdout", "stderr"}; a
+            # non-zero code is routine here (e.g. reading a missing file).
+            if inner.get("returncode", 0) != 0:
+                logger.debug("Agent action %s returned %s", action, inner)
+                return None
+            return inner.get("stdout", "")
+        return inner
+
+
+class LocalMemoryBackend(MemoryBackend):
+    """Memory files on the gateway host's own filesystem."""
+
+    name = "local"
+
+    async def read(self, path: str) -> str | None:
+        try:
+            return await asyncio.to_thread(_read_text, path)
+        except OSError as exc:
+            logger.debug("Memory read %s failed: %s", path, exc)
+            return None
+
+    async def write(self, path: str, content: str) -> None:
+        await self._run(_write_text, path, content, "w")
+
+    async def append(self, path: str, content: str, *, unless_contains: str = "") -> None:
+        await self._run(_append_text, path, content, unless_contains)
+
+    async def make_dirs(self, path: str) -> None:
+        await self._run(os.makedirs, path, exist_ok=True)
+
+    async def _run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        try:
+            await asyncio.to_thread(fn, *args, **kwargs)
+        except OSError as exc:
+            logger.warning("Memory %s on %s failed: %s", fn.__name__, args[0], exc)
+
+
+def _read_text(path: str) -> str:
+    with open(path, "r", encoding="utf-8", errors="replace") as fh:
+        return fh.read()
+
+
+def _write_text(path: str, content: str, mode: str) -> None:
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    with open(path, mode, encoding="utf-8") as fh:
+        fh.write(content)
+
+
+def _append_text(path: str, content: str, unless_contains: str) -> None:
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    with open(path, "a+", encoding="utf-8") as fh:
+        if unless_contains:
+            fh.seek(0)
+            if unless_contains in fh.read():
+                return
+        fh.write(content)
+
+
+def build_memory_backend(
+    kind: str,
+    *,
+    gateway_api_url: str,
+    dispatch: Callable[..., Awaitable[dict[str, Any]]] | None = None,
+) -> MemoryBackend:
+    """Return the backend named by *kind* (``agent`` or ``local``)."""
+    kind = (kind or "agent").strip().lower()
+    if kind == "local":
+        return LocalMemoryBackend()
+    if kind != "agent":
+        logger.warning("Unknown memory backend %r; using the agent backend.", kind)
+    return AgentMemoryBackend(gateway_api_url, dispatch=dispatch)
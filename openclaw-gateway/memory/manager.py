@@ -2,7 +2,9 @@
 SKYNET — Memory Manager
 
 Persistent per-agent memory stored as .md files on the laptop
-(via the agent's file_write/file_read actions) and backed up to S3.
+(via the agent's file_write/file_read actions, or the gateway's own
+disk with the "local" backend — see memory/backends.py) and backed
+up to S3.
 
 Memory file structure on the laptop:
     {project_path}/.openclaw/
@@ -16,15 +18,95 @@ Memory file structure on the laptop:
 
 from __future__ import annotations
 
-import json
+import asyncio
+import io
 import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 import aiosqlite
 
+import json_codec
+from .backends import AgentMemoryBackend, MemoryBackend
+
 logger = logging.getLogger("skynet.archive")
 
+# Max concurrent file_read actions issued by sync_to_s3.
+_SYNC_READ_CONCURRENCY = 8
+
+# get_context_for_agent cache: entries live this long, at most this many kept.
+_CONTEXT_TTL = 5.0
+_CONTEXT_CACHE_SIZE = 256
+
+# Agent/project lookup cache: hits (including the locally advanced
+# tasks_completed count) are reused this long, misses more briefly; at most
+# _LOCATION_CACHE_SIZE entries are kept.
+_LOCATION_HIT_TTL = 300.0
+_LOCATION_MISS_TTL = 30.0
+_LOCATION_CACHE_SIZE = 256
+
+
+# Static Markdown templates (filled with str.format).
+_IDENTITY_TMPL = (
+    "# {display_name}\n\n"
+    "**Role**: {role}\n"
+    "**Agent ID**: {agent_id}\n"
+    "**Project**: {project}\n\n"
+    "## Description\n{description}\n\n"
+    "## Skills\n{skills}\n\n"
+    "## Preferred Providers\n{providers}\n"
+)
+_AGENT_MEMORY_HDR_TMPL = (
+    "# {display_name} Memory\n\n"
+    "_Task history and observations for {project}_\n\n"
+    "---\n\n"
+)
+_HEARTBEAT_TMPL = (
+    "# Heartbeat\n\n"
+    "**Status**: idle\n"
+    "**Last active**: {now}\n"
+    "**Tasks completed**: {tasks_completed}\n"
+)
+_PROJECT_MEMORY_HDR_TMPL = (
+    "# Project Memory — {project}\n\n"
+    "_Shared notes and decisions across all agents._\n\n---\n\n"
+)
+_AGENTS_MD_HDR_TMPL = (
+    "# Agent Registry — {project}\n\n"
+    "| Role | Agent ID | Status |\n"
+    "|------|----------|--------|\n"
+)
+_AGENTS_MD_ROW_TMPL = "| {role} | {agent_id} | idle |\n"
+_TASK_ENTRY_TMPL = (
+    "## [{now}] {title}\n\n"
+    "**Milestone**: {milestone}\n"
+    "**Result**: {result}\n\n---\n\n"
+)
+
+_MEMORY_FILES = ("identity.md", "memory.md", "heartbeat.md")
+
+
+def _p(base: str, *parts: str) -> str:
+    """Join *parts* onto a worker path using the separator *base* already uses."""
+    sep = "\\" if ("\\" in base or ":" in base) else "/"
+    return sep.join((base.rstrip("\\/"), *parts))
+
+
+def _bullets(items: list[str]) -> str:
+    return "\n".join([f"- {item}" for item in items])
+
+
+@dataclass(slots=True)
+class _AgentLocation:
+    """Where an agent's memory lives, plus its running task count."""
+
+    role: str
+    local_path: str
+    tasks_completed: int
+
 
 class MemoryManager:
     """Manages persistent agent memory files and S3 sync."""
@@ -34,10 +116,22 @@ class MemoryManager:
         db: aiosqlite.Connection,
         gateway_api_url: str,
         s3: Any | None = None,
+        dispatch: Callable[..., Awaitable[dict[str, Any]]] | None = None,
+        backend: MemoryBackend | None = None,
     ):
         self.db = db
         self.gateway_api_url = gateway_api_url
         self.s3 = s3
+        # Where the .md files live; defaults to the laptop via the worker.
+        self.backend = backend or AgentMemoryBackend(gateway_api_url, dispatch=dispatch)
+        # Serialises the agents.md read-modify-write per project base dir.
+        self._agents_md_locks: dict[str, asyncio.Lock] = {}
+        # (agent_id, project_id) -> (monotonic timestamp, context), LRU order.
+        self._ctx_cache: OrderedDict[tuple[str, str], tuple[float, str]] = OrderedDict()
+        # (agent_id, project_id) -> (expires_at, location or None), LRU order.
+        self._location_cache: OrderedDict[
+            tuple[str, str], tuple[float, _AgentLocation | None]
+        ] = OrderedDict()
 
     async def initialize_agent_memory(
         self,
@@ -48,66 +142,64 @@ class MemoryManager:
     ) -> None:
         """Create initial memory files for an agent on the laptop."""
         project_path = project["local_path"]
-        base = f"{project_path}\\.openclaw"
-        agent_dir = f"{base}\\agents\\{role}"
-
-        # Create directories.
-        await self._agent_action("create_directory", {"directory": base})
-        await self._agent_action("create_directory", {"directory": f"{base}\\agents"})
-        await self._agent_action("create_directory", {"directory": agent_dir})
-
-        # identity.md — agent persona.
-        identity = (
-            f"# {config.get('display_name', role.title() + ' Agent')}\n\n"
-            f"**Role**: {role}\n"
-            f"**Agent ID**: {agent_id}\n"
-            f"**Project**: {project['display_name']}\n\n"
-            f"## Description\n{config.get('description', '')}\n\n"
-            f"## Skills\n"
-            + "\n".join(f"- {s}" for s in config.get("skills", []))
-            + "\n\n"
-            f"## Preferred Providers\n"
-            + "\n".join(f"- {p}" for p in config.get("preferred_providers", []))
-            + "\n"
+        base = _p(project_path, ".openclaw")
+        agents_dir = _p(base, "agents")
+        agent_dir = _p(agents_dir, role)
+
+        # Create directories (the agent uses makedirs, so order is irrelevant).
+        await asyncio.gather(*(
+            self.backend.make_dirs(d) for d in (base, agents_dir, agent_dir)
+        ))
+
+        display_name = project["display_name"]
+        identity = _IDENTITY_TMPL.format(
+            display_name=config.get("display_name", role.title() + " Agent"),
+            role=role,
+            agent_id=agent_id,
+            project=display_name,
+            description=config.get("description", ""),
+            skills=_bullets(config.get("skills", [])),
+            providers=_bullets(config.get("preferred_providers", [])),
         )
-        await self._write_if_missing(f"{agent_dir}\\identity.md", identity)
-
-        # memory.md — starts empty.
-        await self._write_if_missing(
-            f"{agent_dir}\\memory.md",
-            f"# {config.get('display_name', role)} Memory\n\n"
-            f"_Task history and observations for {project['display_name']}_\n\n"
-            "---\n\n",
-        )
-
-        # heartbeat.md — initial status.
+        # identity.md, memory.md (starts empty) and heartbeat.md are independent.
         now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
-        await self._write_file(
-            f"{agent_dir}\\heartbeat.md",
-            f"# Heartbeat\n\n"
-            f"**Status**: idle\n"
-            f"**Last active**: {now}\n"
-            f"**Tasks completed**: 0\n",
-        )
-
-        # Shared project-level files (only first agent writes them).
-        await self._write_if_missing(
-            f"{base}\\memory.md",
-            f"# Project Memory — {project['display_name']}\n\n"
-            f"_Shared notes and decisions across all agents._\n\n---\n\n",
-        )
-        await self._write_if_missing(
-            f"{base}\\agents.md",
-            f"# Agent Registry — {project['display_name']}\n\n"
-            f"| Role | Agent ID | Status |\n"
-            f"|------|----------|--------|\n",
+        await asyncio.gather(
+            self._write_if_missing(_p(agent_dir, "identity.md"), identity),
+            self._write_if_missing(
+                _p(agent_dir, "memory.md"),
+                _AGENT_MEMORY_HDR_TMPL.format(
+                    display_name=config.get("display_name", role), project=display_name,
+                ),
+            ),
+            self._write_file(
+                _p(agent_dir, "heartbeat.md"),
+                _HEARTBEAT_TMPL.format(now=now, tasks_completed=0),
+            ),
         )
 
-        # Append this agent to agents.md.
-        agents_md = await self._read_file(f"{base}\\agents.md")
-        if agents_md and agent_id not in agents_md:
-            agents_md += f"| {role} | {agent_id} | idle |\n"
-            await self._write_file(f"{base}\\agents.md", agents_md)
+        # Shared project-level files (only first agent writes them).  Agents of
+        # the same project may initialise concurrently, so the agents.md
+        # update below is serialised per base directory.
+        agents_md = _p(base, "agents.md")
+        lock = self._agents_md_locks.setdefault(base, asyncio.Lock())
+        async with lock:
+            await asyncio.gather(
+                self._write_if_missing(
+                    _p(base, "memory.md"),
+                    _PROJECT_MEMORY_HDR_TMPL.format(project=display_name),
+                ),
+                self._write_if_missing(
+                    agents_md, _AGENTS_MD_HDR_TMPL.format(project=display_name),
+                ),
+            )
+
+            # Append this agent to agents.md unless its ID is already listed.
+            # The check runs where the file lives, so agents.md is never
+            # read back here and a failed read can't duplicate the row.
+            await self._append_file(
+                agents_md, _AGENTS_MD_ROW_TMPL.format(role=role, agent_id=agent_id),
+                unless_contains=agent_id,
+            )
 
         logger.info("Initialized memory for %s agent %s", role, agent_id[:8])
 
@@ -117,17 +209,17 @@ class MemoryManager:
         project_id: str,
     ) -> str:
         """Read an agent's memory.md and return it for context injection."""
-        from db import store
-        agent = await store.get_agent(self.db, agent_id)
-        if not agent:
+        key = (agent_id, project_id)
+        cached = self._ctx_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _CONTEXT_TTL:
+            self._ctx_cache.move_to_end(key)
+            return cached[1]
+
+        loc = await self._locate(agent_id, project_id)
+        if loc is None:
             return ""
 
-        project = await store.get_project(self.db, project_id)
-        if not project or not project.get("local_path"):
-            return ""
-
-        role = agent["role"]
-        memory_path = f"{project['local_path']}\\.openclaw\\agents\\{role}\\memory.md"
+        memory_path = _p(loc.local_path, ".openclaw", "agents", loc.role, "memory.md")
 
         content = await self._read_file(memory_path)
         if not content:
@@ -137,6 +229,10 @@ class MemoryManager:
         if len(content) > 3000:
             content = "...(earlier entries truncated)...\n\n" + content[-2000:]
 
+        self._ctx_cache[key] = (time.monotonic(), content)
+        self._ctx_cache.move_to_end(key)
+        if len(self._ctx_cache) > _CONTEXT_CACHE_SIZE:
+            self._ctx_cache.popitem(last=False)
         return content
 
     async def update_from_task(
@@ -147,107 +243,154 @@ class MemoryManager:
         result_summary: str,
     ) -> None:
         """Append task completion to the agent's memory and heartbeat."""
-        from db import store
-        agent = await store.get_agent(self.db, agent_id)
-        if not agent:
+        loc = await self._locate(agent_id, project_id)
+        if loc is None:
             return
 
-        project = await store.get_project(self.db, project_id)
-        if not project or not project.get("local_path"):
-            return
-
-        role = agent["role"]
-        base = f"{project['local_path']}\\.openclaw\\agents\\{role}"
+        base = _p(loc.local_path, ".openclaw", "agents", loc.role)
         now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
 
         # Append to memory.md.
-        memory_path = f"{base}\\memory.md"
-        existing = await self._read_file(memory_path) or ""
         summary_short = result_summary[:300] if result_summary else "(no summary)"
-        entry = (
-            f"## [{now}] {task.get('title', 'Unknown task')}\n\n"
-            f"**Milestone**: {task.get('milestone', 'N/A')}\n"
-            f"**Result**: {summary_short}\n\n---\n\n"
+        entry = _TASK_ENTRY_TMPL.format(
+            now=now,
+            title=task.get("title", "Unknown task"),
+            milestone=task.get("milestone", "N/A"),
+            result=summary_short,
         )
-        await self._write_file(memory_path, existing + entry)
+        await self._append_file(_p(base, "memory.md"), entry)
+        self._ctx_cache.pop((agent_id, project_id), None)
 
-        # Update heartbeat.md.
-        tasks_completed = agent.get("tasks_completed", 0) + 1
+        # Update heartbeat.md.  The caller bumps agents.tasks_completed after
+        # this returns, so the cached count is advanced in step with it.
+        loc.tasks_completed += 1
         await self._write_file(
-            f"{base}\\heartbeat.md",
-            f"# Heartbeat\n\n"
-            f"**Status**: idle\n"
-            f"**Last active**: {now}\n"
-            f"**Tasks completed**: {tasks_completed}\n"
-            f"**Last task**: {task.get('title', '')}\n",
+            _p(base, "heartbeat.md"),
+            _HEARTBEAT_TMPL.format(now=now, tasks_completed=loc.tasks_completed)
+            + f"**Last task**: {task.get('title', '')}\n",
         )
 
-    async def sync_to_s3(self, project_id: str) -> None:
-        """Bundle all .openclaw memory files and upload to S3."""
+    def invalidate(self, agent_id: str | None = None, project_id: str | None = None) -> None:
+        """
+        Forget cached lookups for an agent and/or project.
+
+        Call when an agent or project is removed or a project's
+        ``local_path`` changes; otherwise entries simply expire.
+        """
+        stale = [
+            key for key in self._location_cache
+            if (agent_id is None or key[0] == agent_id)
+            and (project_id is None or key[1] == project_id)
+        ]
+        for key in stale:
+            self._location_cache.pop(key, None)
+            self._ctx_cache.pop(key, None)
+
+    async def _locate(self, agent_id: str, project_id: str) -> _AgentLocation | None:
+        """Return the agent's role/project path, caching hits and (briefly) misses."""
+        key = (agent_id, project_id)
+        cached = self._location_cache.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            self._location_cache.move_to_end(key)
+            return cached[1]
+
+        from db import store
+        loc = None
+        agent = await store.get_agent(self.db, agent_id)
+        if agent:
+            project = await store.get_project(self.db, project_id)
+            if project and project.get("local_path"):
+                loc = _AgentLocation(
+                    role=agent["role"],
+                    local_path=project["local_path"],
+                    tasks_completed=agent.get("tasks_completed") or 0,
+                )
+
+        expires = time.monotonic() + (_LOCATION_HIT_TTL if loc is not None else _LOCATION_MISS_TTL)
+        self._location_cache[key] = (expires, loc)
+        self._location_cache.move_to_end(key)
+        if len(self._location_cache) > _LOCATION_CACHE_SIZE:
+            self._location_cache.popitem(last=False)
+        return loc
+
+    async def sync_to_s3(
+        self,
+        project_id: str,
+        project: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Bundle all .openclaw memory files and upload to S3.
+
+        ``project`` may be passed by callers that already fetched the row.
+        """
         if not self.s3:
             logger.debug("No S3 client configured, skipping memory sync")
             return
 
         from db import store
-        project = await store.get_project(self.db, project_id)
+        if project is None:
+            project = await store.get_project(self.db, project_id)
         if not project or not project.get("local_path"):
             return
 
-        base_dir = f"{project['local_path']}\\.openclaw"
+        base_dir = _p(project["local_path"], ".openclaw")
 
         # Read all known memory files via the agent.
         files_to_read = ["memory.md", "agents.md"]
 
-        # Discover agent subdirectories via list_directory.
-        agents_listing = await self._list_dir(f"{base_dir}\\agents")
-        if agents_listing:
-            for line in agents_listing.strip().split("\n"):
-                name = line.strip().replace("[DIR] ", "")
-                if name:
-                    for fname in ("identity.md", "memory.md", "heartbeat.md"):
-                        files_to_read.append(f"agents/{name}/{fname}")
-
-        bundle: dict[str, str] = {}
-        for rel_path in files_to_read:
-            content = await self._read_file(f"{base_dir}\\{rel_path}")
+        # Agent subdirectories are named by role; the DB is authoritative,
+        # so no list_directory round trip is needed.
+        agents = await store.list_agents(self.db, project_id)
+        files_to_read.extend(
+            f"agents/{role}/{fname}"
+            for role in dict.fromkeys(a["role"] for a in agents)
+            for fname in _MEMORY_FILES
+        )
+
+        # Read concurrently, but cap in-flight actions so a large agent
+        # roster doesn't flood the single worker connection.  Each file is
+        # encoded into the JSON object as soon as it arrives, so contents are
+        # never held twice (once in a dict, once serialised).
+        sem = asyncio.Semaphore(_SYNC_READ_CONCURRENCY)
+        buf = io.BytesIO()
+        synced = 0
+
+        async def _read_one(rel_path: str) -> None:
+            nonlocal synced
+            async with sem:
+                content = await self._read_file(_p(base_dir, *rel_path.split("/")))
             if content:
-                bundle[rel_path] = content
+                buf.write(b"," if synced else b"{")
+                buf.write(json_codec.dumpb(rel_path) + b":" + json_codec.dumpb(content))
+                synced += 1
 
-        if not bundle:
+        async with asyncio.TaskGroup() as tg:
+            for rel_path in files_to_read:
+                tg.create_task(_read_one(rel_path))
+
+        if not synced:
             logger.debug("No memory files to sync for project %s", project_id)
             return
 
-        data = json.dumps(bundle, indent=2).encode()
+        buf.write(b"}")
         slug = project.get("name", project_id)
         key = f"memory/{slug}/memory_bundle.json"
-        await self.s3.upload(key, data, content_type="application/json")
-        logger.info("Synced memory to S3 for project %s (%d files)", project_id, len(bundle))
+        await self.s3.upload(key, buf.getvalue(), content_type="application/json")
+        logger.info("Synced memory to S3 for project %s (%d files)", project_id, synced)
 
     # ------------------------------------------------------------------
-    # Agent-side file operations (via HTTP API → WebSocket → laptop)
+    # File operations (delegated to the memory backend)
     # ------------------------------------------------------------------
 
-    async def _agent_action(self, action: str, params: dict) -> str | None:
-        """Send an action to the laptop agent via the gateway HTTP API."""
-        import aiohttp
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.gateway_api_url}/action",
-                    json={"action": action, "params": params, "confirmed": True},
-                    timeout=aiohttp.ClientTimeout(total=15),
-                ) as resp:
-                    result = await resp.json()
-                    if result.get("status") == "ok":
-                        return result.get("result", "")
-                    logger.warning("Agent action %s failed: %s", action, result)
-                    return None
-        except Exception as exc:
-            logger.warning("Agent action %s error: %s", action, exc)
-            return None
+    async def close(self) -> None:
+        """Release backend resources (called on gateway shutdown)."""
+        await self.backend.close()
 
     async def _write_file(self, path: str, content: str) -> None:
-        await self._agent_action("file_write", {"file": path, "content": content})
+        await self.backend.write(path, content)
+
+    async def _append_file(self, path: str, content: str, *, unless_contains: str = "") -> None:
+        await self.backend.append(path, content, unless_contains=unless_contains)
 
     async def _write_if_missing(self, path: str, content: str) -> None:
         """Write file only if it doesn't already exist."""
@@ -256,10 +399,4 @@ class MemoryManager:
             await self._write_file(path, content)
 
     async def _read_file(self, path: str) -> str | None:
-        result = await self._agent_action("file_read", {"file": path})
-        if result and not result.startswith("Error"):
-            return result
-        return None
-
-    async def _list_dir(self, path: str) -> str | None:
-        return await self._agent_action("list_directory", {"directory": path})
+        return await self.backend.read(path)
@@ -8,9 +8,10 @@ Manages the full lifecycle of a project:
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
 import logging
 import re
+from collections import OrderedDict
 from typing import Any
 
 import aiohttp
@@ -22,6 +23,7 @@ from ai.provider_router import ProviderRouter
 from ai.prompts import PLANNING_PROMPT
 from ai import context as ctx
 import bot_config as cfg
+import json_codec
 from chathan.protocol import PlanSpec
 from db import store
 from search.web_search import WebSearcher
@@ -29,6 +31,9 @@ from .scheduler import Scheduler
 
 logger = logging.getLogger("skynet.core.pm")
 
+# /action bodies are pre-encoded, so the content type is set explicitly.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 # ORACLE prompt for AI-based task-to-agent assignment.
 _ORACLE_ASSIGNMENT_PROMPT = """You are SKYNET ORACLE — the AI task assignment engine.
 
@@ -43,16 +48,102 @@ Respond with ONLY a JSON object:
 Do not include any other text.
 """
 
+# AGENT_CONFIGS is static, so the ORACLE system prompt is built once.
+_ORACLE_SYSTEM_PROMPT = _ORACLE_ASSIGNMENT_PROMPT.format(
+    roles_info="\n".join(
+        f"- {role}: {conf['description']}" for role, conf in AGENT_CONFIGS.items()
+    ),
+)
+_VALID_ROLES: frozenset[str] = frozenset(ALL_ROLES)
+
+# ORACLE plan cache: (tech stack, task-title keywords) -> role.  Task titles
+# repeat heavily across similar projects, so most assignments after the
+# first few plans are answered without an LLM call.
+_ORACLE_CACHE_SIZE = 1024
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset({
+    "a", "an", "and", "as", "at", "by", "for", "from", "in", "into",
+    "of", "on", "or", "the", "to", "with",
+})
+
+
+def _stack_signature(tech_stack: dict[str, Any]) -> str:
+    return json_codec.dumps(tech_stack, sort_keys=True).lower()
+
+
+@functools.lru_cache(maxsize=256)
+def _title_keywords(title: str) -> str:
+    """Order-insensitive keyword signature of a task title ("" if none)."""
+    words = {w for w in _WORD_RE.findall(title.lower()) if w not in _STOPWORDS}
+    return " ".join(sorted(words))
+
+
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+_GH_URL_RE = re.compile(r"https://github\.com/[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+")
+
 
 def _slugify(name: str) -> str:
     """Convert a display name to a URL-safe slug."""
-    slug = re.sub(r"[^a-zA-Z0-9]+", "-", name.lower()).strip("-")
+    slug = _SLUG_RE.sub("-", name.lower()).strip("-")
     return slug or "project"
 
 
-def _join_path(base: str, leaf: str) -> str:
+def _path_prefix(base: str) -> str:
+    """*base* without trailing separators, plus the separator its style uses."""
     sep = "\\" if ("\\" in base or ":" in base) else "/"
-    return base.rstrip("\\/") + sep + leaf
+    return base.rstrip("\\/") + sep
+
+
+def _join_path(base: str, leaf: str) -> str:
+    return _path_prefix(base) + leaf
+
+
+# Agent error markers (matched case-insensitively anywhere in the message).
+# Each tuple is the source of truth; the regex is one scan instead of N.
+_TRANSIENT_ERROR_MARKERS = (
+    "no existing session",
+    "agent disconnected",
+    "agent not connected",
+    "temporarily unavailable",
+    "timeout",
+    "timed out",
+    "connection reset",
+    "connection aborted",
+    "broken pipe",
+    "transport endpoint",
+    "ssh action failed",
+    "http 503",
+    "service unavailable",
+)
+_DEFERRED_BOOTSTRAP_MARKERS = (
+    "no existing session",
+    "agent disconnected",
+    "agent not connected",
+    "ssh action failed",
+    "ssh fallback is not configured",
+    "ssh tunnel mode is enabled but ssh executor is not configured",
+    "no connected agent and ssh fallback is not configured",
+    "unable to connect to port",
+    "could not resolve hostname",
+    "connection reset",
+    "connection aborted",
+    "timed out",
+    "timeout",
+    "service unavailable",
+    "http 503",
+    "no lines in openssh private key file",
+    "not a valid openssh private key file",
+    "private key file is encrypted",
+    "password is required for key",
+)
+
+
+def _marker_re(markers: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile("|".join(map(re.escape, markers)), re.IGNORECASE)
+
+
+_TRANSIENT_ERROR_RE = _marker_re(_TRANSIENT_ERROR_MARKERS)
+_DEFERRED_BOOTSTRAP_RE = _marker_re(_DEFERRED_BOOTSTRAP_MARKERS)
 
 
 class ProjectManager:
@@ -71,10 +162,61 @@ class ProjectManager:
         self.searcher = searcher
         self.scheduler = scheduler
         self.base_dir = project_base_dir
+        # The base never changes, so its separator is worked out once.
+        self._base_prefix = _path_prefix(project_base_dir)
         self.planner_agent = PlannerAgent(
             router=self.router,
             run_agent_action=self._run_agent_action_for_planner,
         )
+        # Keep-alive session for /action calls; created on first use
+        # because __init__ may run outside the event loop.
+        self._http: aiohttp.ClientSession | None = None
+        self._http_lock = asyncio.Lock()
+        self._oracle_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+
+    async def _get_http(self) -> aiohttp.ClientSession:
+        async with self._http_lock:
+            if self._http is None or self._http.closed:
+                # A dead gateway fails in seconds instead of after the full
+                # 130 s budget, which long-running actions still get.  Only
+                # the TCP connect is bounded (sock_connect): ``connect`` would
+                # also count time queued for a free pooled connection, which
+                # another /action call may hold for the full 130 s.  No
+                # sock_read bound: actions such as test runs stay silent
+                # until they finish.
+                self._http = aiohttp.ClientSession(
+                    timeout=aiohttp.ClientTimeout(total=130, sock_connect=5),
+                    connector=aiohttp.TCPConnector(
+                        limit=32, keepalive_timeout=60, ttl_dns_cache=300,
+                    ),
+                )
+            return self._http
+
+    async def close(self) -> None:
+        """Close the shared HTTP session (called on gateway shutdown)."""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+
+    async def _load_project(
+        self,
+        project_id: str,
+        *,
+        require_status: tuple[str, ...] = (),
+        status_error: str = "",
+    ) -> dict[str, Any]:
+        """
+        Fetch a project row, raising ValueError if it is missing.
+
+        With *require_status*, a project in any other status raises too;
+        *status_error* is formatted with the project's ``status``.
+        """
+        project = await store.get_project(self.db, project_id)
+        if not project:
+            raise ValueError("Project not found.")
+        if require_status and project["status"] not in require_status:
+            raise ValueError(status_error.format(status=project["status"]))
+        return project
 
     async def create_project(self, name: str) -> dict[str, Any]:
         """Create a new project in 'ideation' status."""
@@ -83,7 +225,7 @@ class ProjectManager:
         if existing:
             raise ValueError(f"Project '{slug}' already exists.")
 
-        local_path = _join_path(self.base_dir, slug)
+        local_path = self._base_prefix + slug
         project = await store.create_project(
             self.db, name=slug, display_name=name, local_path=local_path,
         )
@@ -92,8 +234,7 @@ class ProjectManager:
             if cfg.AUTO_BOOTSTRAP_STRICT:
                 # Strict mode keeps creation atomic: do not retain a project row
                 # if required workspace bootstrap steps failed.
-                await self.db.execute("DELETE FROM projects WHERE id = ?", (project["id"],))
-                await self.db.commit()
+                await store.delete_project(self.db, project["id"])
                 raise ValueError(
                     f"Project bootstrap failed and creation was rolled back. {bootstrap_summary}"
                 )
@@ -113,50 +254,45 @@ class ProjectManager:
             ),
             detail=bootstrap_summary,
         )
-        out = await store.get_project(self.db, project["id"])
-        if out is None:
-            raise ValueError("Project was created but could not be loaded.")
-        out["bootstrap_summary"] = bootstrap_summary
-        out["bootstrap_ok"] = bootstrap_ok
-        return out
+        # store.create_project returned the full row and bootstrap keeps
+        # it in sync with its own updates, so no re-read is needed.
+        project["bootstrap_summary"] = bootstrap_summary
+        project["bootstrap_ok"] = bootstrap_ok
+        return project
 
     async def add_idea(self, project_id: str, text: str) -> int:
         """Add an idea message to a project in ideation phase."""
-        project = await store.get_project(self.db, project_id)
-        if not project:
-            raise ValueError("Project not found.")
-        if project["status"] != "ideation":
-            raise ValueError(f"Project is in '{project['status']}' status, not ideation.")
-
-        idea_id = await store.add_idea(self.db, project_id, text)
-        ideas = await store.get_ideas(self.db, project_id)
-        return len(ideas)
+        await self._load_project(
+            project_id,
+            require_status=("ideation",),
+            status_error="Project is in '{status}' status, not ideation.",
+        )
+        return await store.add_idea_and_count(self.db, project_id, text)
 
     async def generate_plan(self, project_id: str) -> dict[str, Any]:
         """Use AI to synthesise ideas into a structured project plan."""
-        project = await store.get_project(self.db, project_id)
+        # Independent reads: queue both on the connection thread at once.
+        project, ideas = await asyncio.gather(
+            store.get_project(self.db, project_id),
+            store.get_ideas(self.db, project_id),
+        )
         if not project:
             raise ValueError("Project not found.")
-
-        ideas = await store.get_ideas(self.db, project_id)
         if not ideas:
             raise ValueError("No ideas to plan from. Send some ideas first.")
 
-        # Build the prompt from all ideas.
-        idea_text = "\n".join(
-            f"- {idea['message_text']}" for idea in ideas
-        )
-
         system_prompt = PLANNING_PROMPT.format(project_path=project["local_path"])
 
+        # Build the prompt from all ideas with a single join.
         messages = [{
             "role": "user",
-            "content": (
-                f"Create a detailed implementation plan for this project idea:\n\n"
-                f"{idea_text}\n\n"
-                f"The project name is: {project['display_name']}\n"
-                f"Output ONLY the JSON plan, no other text."
-            ),
+            "content": "\n".join([
+                "Create a detailed implementation plan for this project idea:\n",
+                *["- " + idea["message_text"] for idea in ideas],
+                "",
+                "The project name is: " + project["display_name"],
+                "Output ONLY the JSON plan, no other text.",
+            ]),
         }]
 
         # Let the AI use planning tools (web search, file read).
@@ -170,17 +306,8 @@ class ProjectManager:
         if not plan_data:
             raise ValueError(f"AI did not return valid plan JSON. Response: {final_text[:200]}")
 
-        # Store the plan.
+        # Store the plan and its tasks (one per milestone task) together.
         milestones = plan_data.get("milestones", [])
-        plan_id = await store.create_plan(
-            self.db,
-            project_id=project_id,
-            summary=plan_data.get("summary", ""),
-            timeline=milestones,
-            milestones=milestones,
-        )
-
-        # Create tasks from milestones.
         all_tasks = []
         for milestone in milestones:
             for task in milestone.get("tasks", []):
@@ -189,7 +316,15 @@ class ProjectManager:
                     "title": task.get("title", "Untitled task"),
                     "description": task.get("description", ""),
                 })
-        await store.create_tasks(self.db, project_id, plan_id, all_tasks)
+        plan, task_ids = await store.create_active_plan(
+            self.db,
+            project_id=project_id,
+            summary=plan_data.get("summary", ""),
+            timeline=milestones,
+            milestones=milestones,
+            tasks=all_tasks,
+        )
+        plan_id = plan["id"]
 
         # Build a formal PlanSpec from the AI output.
         plan_spec = PlanSpec.from_ai_plan(project_id, plan_id, plan_data)
@@ -201,46 +336,49 @@ class ProjectManager:
             plan_spec.total_estimated_minutes,
         )
 
-        # ORACLE: AI-based task-to-agent assignment.
+        # ORACLE: AI-based task-to-agent assignment.  The new tasks are
+        # already in hand, so they are not read back.
         tech_stack = plan_data.get("tech_stack", {})
-        await self._assign_agents_to_tasks(project_id, plan_id, tech_stack)
+        role_rows = await self._oracle_roles(
+            project_id,
+            [{"id": tid, **task} for tid, task in zip(task_ids, all_tasks)],
+            tech_stack,
+        )
 
-        # Update project with tech stack and description.
-        await store.update_project(
-            self.db, project_id,
+        # Role assignments plus the project's tech stack and description,
+        # committed together.
+        await store.update_project_and_task_roles(
+            self.db, project_id, role_rows,
             status="planning",
             description=plan_data.get("summary", ""),
-            tech_stack=json.dumps(tech_stack),
+            tech_stack=json_codec.dumps(tech_stack),
         )
 
-        plan = await store.get_active_plan(self.db, project_id)
         # Attach the PlanSpec dict for downstream consumers.
         plan["plan_spec"] = plan_spec.to_dict()
         return plan
 
     async def approve_plan(self, project_id: str) -> None:
         """Approve the plan and mark project ready for execution."""
-        project = await store.get_project(self.db, project_id)
-        if not project:
-            raise ValueError("Project not found.")
-        if project["status"] not in ("planning", "ideation"):
-            raise ValueError(f"Cannot approve: project is in '{project['status']}' status.")
+        await self._load_project(
+            project_id,
+            require_status=("planning", "ideation"),
+            status_error="Cannot approve: project is in '{status}' status.",
+        )
 
-        await store.update_project(
-            self.db, project_id,
+        await store.update_project_with_event(
+            self.db, project_id, "plan_approved", "Plan approved by user",
             status="approved",
             approved_at=store._now(),
         )
-        await store.add_event(self.db, project_id, "plan_approved", "Plan approved by user")
 
     async def start_execution(self, project_id: str) -> None:
         """Submit the project to the scheduler for autonomous coding."""
-        project = await store.get_project(self.db, project_id)
-        if not project:
-            raise ValueError("Project not found.")
-        if project["status"] != "approved":
-            raise ValueError(f"Cannot start: project is in '{project['status']}' status.")
-
+        await self._load_project(
+            project_id,
+            require_status=("approved",),
+            status_error="Cannot start: project is in '{status}' status.",
+        )
         await self.scheduler.submit(project_id)
 
     async def pause_project(self, project_id: str) -> None:
@@ -255,8 +393,10 @@ class ProjectManager:
 
     async def cancel_project(self, project_id: str) -> None:
         self.scheduler.cancel(project_id)
-        await store.update_project(self.db, project_id, status="cancelled")
-        await store.add_event(self.db, project_id, "cancelled", "Project cancelled by user")
+        await store.update_project_with_event(
+            self.db, project_id, "cancelled", "Project cancelled by user",
+            status="cancelled",
+        )
 
     async def remove_project(self, project_id: str) -> dict[str, Any]:
         """
@@ -264,35 +404,47 @@ class ProjectManager:
 
         Note: Workspace files are not deleted here.
         """
-        project = await store.get_project(self.db, project_id)
-        if not project:
-            raise ValueError("Project not found.")
+        project = await self._load_project(project_id)
         self.scheduler.cancel(project_id)
         deleted = await store.remove_project_cascade(self.db, project_id)
         if not deleted:
             raise ValueError("Project could not be removed.")
+        if self.scheduler.memory_manager is not None:
+            self.scheduler.memory_manager.invalidate(project_id=project_id)
         return project
 
     async def list_projects(self) -> list[dict[str, Any]]:
         return await store.list_projects(self.db)
 
-    async def get_status(self, project_id: str) -> dict[str, Any]:
-        project = await store.get_project(self.db, project_id)
+    async def get_status(
+        self,
+        project_id: str,
+        *,
+        include_events: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Project row, task progress and scheduler state for one project.
+
+        ``recent_events`` holds the last five events, or is empty when
+        ``include_events`` is False (saves the events query for callers
+        that only report progress).
+        """
+        reads = [
+            store.get_project(self.db, project_id),
+            store.get_task_progress(self.db, project_id),
+        ]
+        if include_events:
+            reads.append(store.get_events(self.db, project_id, limit=5))
+        project, (completed, total, current_task), *rest = await asyncio.gather(*reads)
         if not project:
             raise ValueError("Project not found.")
-
-        tasks = await store.get_tasks(self.db, project_id)
-        completed = sum(1 for t in tasks if t["status"] == "completed")
-        total = len(tasks)
-        in_progress = [t for t in tasks if t["status"] == "in_progress"]
-
-        events = await store.get_events(self.db, project_id, limit=5)
+        events = rest[0] if rest else []
 
         return {
             "project": project,
             "progress": f"{completed}/{total}",
             "percent": round(completed / total * 100) if total else 0,
-            "current_task": in_progress[0]["title"] if in_progress else None,
+            "current_task": current_task,
             "recent_events": events,
             "is_running": self.scheduler.is_running(project_id),
         }
@@ -306,65 +458,104 @@ class ProjectManager:
     # SKYNET ORACLE — AI task-to-agent assignment
     # ------------------------------------------------------------------
 
-    async def _assign_agents_to_tasks(
+    async def _oracle_roles(
         self,
         project_id: str,
-        plan_id: str,
+        tasks: list[dict[str, Any]],
         tech_stack: dict[str, Any],
-    ) -> None:
-        """Use AI to classify each task → best agent role."""
-        tasks = await store.get_tasks(self.db, project_id, plan_id)
+    ) -> list[tuple[str, Any]]:
+        """Best agent role per task as (role, task_id) rows; failures yield fewer rows."""
         if not tasks:
-            return
+            return []
+
+        # Answer what we can from the plan cache; only the rest go to the LLM.
+        stack_sig = _stack_signature(tech_stack)
+        rows: list[tuple[str, Any]] = []
+        pending = []
+        for t in tasks:
+            role = self._oracle_cache_get(stack_sig, t["title"])
+            if role is None:
+                pending.append(t)
+            else:
+                rows.append((role, t["id"]))
+        cached = len(rows)
 
-        # Build role descriptions for the ORACLE prompt.
-        roles_info = "\n".join(
-            f"- {role}: {cfg['description']}"
-            for role, cfg in AGENT_CONFIGS.items()
-        )
+        if pending:
+            try:
+                rows.extend(await self._oracle_assign(stack_sig, tech_stack, pending))
+            except Exception as exc:
+                logger.warning("ORACLE assignment failed: %s — using default roles", exc)
 
+        if rows:
+            logger.info(
+                "ORACLE assigned %d tasks to agent roles for project %s (%d from cache)",
+                len(rows), project_id, cached,
+            )
+        return rows
+
+    async def _oracle_assign(
+        self,
+        stack_sig: str,
+        tech_stack: dict[str, Any],
+        tasks: list[dict[str, Any]],
+    ) -> list[tuple[str, Any]]:
+        """Ask the LLM for roles and remember them; returns (role, task_id) rows."""
         task_list = [
             {"id": t["id"], "title": t["title"], "desc": t.get("description", "")}
             for t in tasks
         ]
 
-        system = _ORACLE_ASSIGNMENT_PROMPT.format(roles_info=roles_info)
         messages = [{
             "role": "user",
             "content": (
-                f"Tech stack: {json.dumps(tech_stack)}\n\n"
-                f"Tasks:\n{json.dumps(task_list, indent=2)}\n\n"
+                f"Tech stack: {json_codec.dumps(tech_stack)}\n\n"
+                f"Tasks:\n{json_codec.dumps(task_list, indent=True)}\n\n"
                 f"Assign each task to the best agent role."
             ),
         }]
 
-        try:
-            response = await self.router.chat(
-                messages, system=system, max_tokens=1024,
-                task_type="planning",
-            )
-            assignments = self._parse_plan_json(response.text)
-            if not assignments or "assignments" not in assignments:
-                logger.warning("ORACLE returned invalid assignment JSON.")
-                return
-
-            valid_roles = ALL_ROLES
-            for entry in assignments["assignments"]:
-                task_id = entry.get("task_id", "")
-                role = entry.get("role", "backend")
-                if role not in valid_roles:
-                    role = "backend"
-                await store.update_task(
-                    self.db, task_id, assigned_agent_role=role,
-                )
-
-            logger.info(
-                "ORACLE assigned %d tasks to agent roles for project %s",
-                len(assignments["assignments"]), project_id,
-            )
-
-        except Exception as exc:
-            logger.warning("ORACLE assignment failed: %s — using default roles", exc)
+        response = await self.router.chat(
+            messages, system=_ORACLE_SYSTEM_PROMPT, max_tokens=1024,
+            task_type="planning",
+        )
+        assignments = self._parse_plan_json(response.text)
+        if not assignments or "assignments" not in assignments:
+            logger.warning("ORACLE returned invalid assignment JSON.")
+            return []
+
+        # Task IDs the LLM made up are dropped here rather than sent to the
+        # DB as UPDATEs that match nothing.
+        by_id = {str(t["id"]): t for t in tasks}
+        rows = []
+        for entry in assignments["assignments"]:
+            task = by_id.get(str(entry.get("task_id", "")))
+            if task is None:
+                continue
+            role = entry.get("role", "backend")
+            if role not in _VALID_ROLES:
+                role = "backend"
+            rows.append((role, task["id"]))
+            self._oracle_cache_put(stack_sig, task["title"], role)
+        return rows
+
+    def _oracle_cache_get(self, stack_sig: str, title: str) -> str | None:
+        keywords = _title_keywords(title)
+        if not keywords:
+            return None
+        key = (stack_sig, keywords)
+        role = self._oracle_cache.get(key)
+        if role is not None:
+            self._oracle_cache.move_to_end(key)
+        return role
+
+    def _oracle_cache_put(self, stack_sig: str, title: str, role: str) -> None:
+        keywords = _title_keywords(title)
+        if not keywords:
+            return
+        self._oracle_cache[(stack_sig, keywords)] = role
+        self._oracle_cache.move_to_end((stack_sig, keywords))
+        if len(self._oracle_cache) > _ORACLE_CACHE_SIZE:
+            self._oracle_cache.popitem(last=False)
 
     # ------------------------------------------------------------------
     # Internal
@@ -431,37 +622,35 @@ class ProjectManager:
             "2. Let autonomous agents implement milestone-by-milestone.\n"
             "3. Review milestone updates and final deliverables.\n"
         )
-        ok, msg = await self._run_agent_action(
-            "file_write",
-            {"file": readme_path, "content": readme},
-            confirmed=True,
-            retry_on_transient=True,
-        )
-        if ok:
-            bootstrap_notes.append("readme: ok")
-        elif self._is_deferred_bootstrap_error(msg):
-            bootstrap_notes.append(f"readme: deferred ({msg})")
-            return "; ".join(bootstrap_notes), True
-        else:
-            bootstrap_notes.append(f"readme: failed ({msg})")
-        if not ok:
-            return "; ".join(bootstrap_notes), False
-
-        ok, msg = await self._run_agent_action(
-            "git_init",
-            {"working_dir": path},
-            confirmed=True,
-            retry_on_transient=True,
+        # git init does not need the README, so both go out together.  Both
+        # outcomes are recorded (a repo may exist even if the README failed);
+        # the first non-ok step, in the original order, decides the result.
+        results = await asyncio.gather(
+            self._run_agent_action(
+                "file_write",
+                {"file": readme_path, "content": readme},
+                confirmed=True,
+                retry_on_transient=True,
+            ),
+            self._run_agent_action(
+                "git_init",
+                {"working_dir": path},
+                confirmed=True,
+                retry_on_transient=True,
+            ),
         )
-        if ok:
-            bootstrap_notes.append("git_init: ok")
-        elif self._is_deferred_bootstrap_error(msg):
-            bootstrap_notes.append(f"git_init: deferred ({msg})")
-            return "; ".join(bootstrap_notes), True
-        else:
-            bootstrap_notes.append(f"git_init: failed ({msg})")
-        if not ok:
-            return "; ".join(bootstrap_notes), False
+        outcome: bool | None = None
+        for step, (ok, msg) in zip(("readme", "git_init"), results):
+            if ok:
+                bootstrap_notes.append(f"{step}: ok")
+            elif self._is_deferred_bootstrap_error(msg):
+                bootstrap_notes.append(f"{step}: deferred ({msg})")
+                outcome = True if outcome is None else outcome
+            else:
+                bootstrap_notes.append(f"{step}: failed ({msg})")
+                outcome = False if outcome is None else outcome
+        if outcome is not None:
+            return "; ".join(bootstrap_notes), outcome
 
         ok_add, msg_add = await self._run_agent_action(
             "git_add_all",
@@ -521,6 +710,7 @@ class ProjectManager:
                         project["id"],
                         github_repo=repo_url,
                     )
+                    project["github_repo"] = repo_url
                     bootstrap_notes.append(f"github: ok ({repo_url})")
                 else:
                     bootstrap_notes.append("github: ok")
@@ -577,18 +767,18 @@ class ProjectManager:
     ) -> tuple[bool, str]:
         payload = {"action": action, "params": params, "confirmed": confirmed}
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.scheduler.gateway_url}/action",
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=130),
-                ) as resp:
-                    status_code = resp.status
-                    try:
-                        data = await resp.json()
-                    except Exception:
-                        raw = (await resp.text()).strip()
-                        return False, raw or f"http {status_code}"
+            http = await self._get_http()
+            async with http.post(
+                f"{self.scheduler.gateway_url}/action",
+                data=json_codec.dumpb(payload),
+                headers=_JSON_HEADERS,
+            ) as resp:
+                status_code = resp.status
+                try:
+                    data = json_codec.loads(await resp.read())
+                except Exception:
+                    raw = (await resp.text()).strip()
+                    return False, raw or f"http {status_code}"
         except Exception as exc:
             return False, str(exc)
 
@@ -617,54 +807,16 @@ class ProjectManager:
     def _extract_github_url(text: str) -> str | None:
         if not text:
             return None
-        match = re.search(r"https://github\.com/[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+", text)
+        match = _GH_URL_RE.search(text)
         return match.group(0) if match else None
 
     @staticmethod
     def _is_transient_agent_error(message: str) -> bool:
-        text = (message or "").lower()
-        markers = (
-            "no existing session",
-            "agent disconnected",
-            "agent not connected",
-            "temporarily unavailable",
-            "timeout",
-            "timed out",
-            "connection reset",
-            "connection aborted",
-            "broken pipe",
-            "transport endpoint",
-            "ssh action failed",
-            "http 503",
-            "service unavailable",
-        )
-        return any(marker in text for marker in markers)
+        return _TRANSIENT_ERROR_RE.search(message or "") is not None
 
     @staticmethod
     def _is_deferred_bootstrap_error(message: str) -> bool:
         """
         Detect infra/connectivity problems where bootstrap should be deferred.
         """
-        text = (message or "").lower()
-        markers = (
-            "no existing session",
-            "agent disconnected",
-            "agent not connected",
-            "ssh action failed",
-            "ssh fallback is not configured",
-            "ssh tunnel mode is enabled but ssh executor is not configured",
-            "no connected agent and ssh fallback is not configured",
-            "unable to connect to port",
-            "could not resolve hostname",
-            "connection reset",
-            "connection aborted",
-            "timed out",
-            "timeout",
-            "service unavailable",
-            "http 503",
-            "no lines in openssh private key file",
-            "not a valid openssh private key file",
-            "private key file is encrypted",
-            "password is required for key",
-        )
-        return any(marker in text for marker in markers)
+        return _DEFERRED_BOOTSTRAP_RE.search(message or "") is not None
@@ -9,17 +9,29 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from dataclasses import dataclass
 from typing import Any, Callable, Awaitable
 
 import aiosqlite
 
+from agents.agent_worker import AgentWorker
 from ai.provider_router import ProviderRouter
 from search.web_search import WebSearcher
 from skills.registry import SkillRegistry
+from .worker import Worker
 
 logger = logging.getLogger("skynet.core.scheduler")
 
 
+@dataclass
+class _RunState:
+    """A running project's worker task and its control events."""
+
+    task: asyncio.Task
+    pause: asyncio.Event
+    cancel: asyncio.Event
+
+
 class Scheduler:
     """Manages parallel project workers."""
 
@@ -45,21 +57,19 @@ class Scheduler:
         self.skill_registry = skill_registry
         self.memory_manager = memory_manager
 
-        self._tasks: dict[str, asyncio.Task] = {}
-        self._pause_events: dict[str, asyncio.Event] = {}
-        self._cancel_events: dict[str, asyncio.Event] = {}
+        self._running: dict[str, _RunState] = {}
 
     @property
     def running_count(self) -> int:
-        return len(self._tasks)
+        return len(self._running)
 
     def is_running(self, project_id: str) -> bool:
-        return project_id in self._tasks
+        return project_id in self._running
 
     async def submit(self, project_id: str) -> None:
-        if project_id in self._tasks:
+        if project_id in self._running:
             raise RuntimeError(f"Project {project_id} is already running.")
-        if len(self._tasks) >= self.max_parallel:
+        if len(self._running) >= self.max_parallel:
             raise RuntimeError(
                 f"Max parallel limit reached ({self.max_parallel}). "
                 f"Pause or cancel a project first."
@@ -72,7 +82,6 @@ class Scheduler:
         # Use AgentWorker (v3) when skill_registry is available,
         # otherwise fall back to legacy Worker.
         if self.skill_registry is not None:
-            from agents.agent_worker import AgentWorker
             worker = AgentWorker(
                 project_id=project_id,
                 db=self.db,
@@ -87,7 +96,6 @@ class Scheduler:
                 request_approval=self.request_approval,
             )
         else:
-            from .worker import Worker
             worker = Worker(
                 project_id=project_id,
                 db=self.db,
@@ -104,44 +112,41 @@ class Scheduler:
             worker.run(),
             name=f"project-{project_id}",
         )
-        task.add_done_callback(lambda t: self._cleanup(project_id))
+        task.add_done_callback(lambda t: self._cleanup(project_id, t))
 
-        self._tasks[project_id] = task
-        self._pause_events[project_id] = pause_event
-        self._cancel_events[project_id] = cancel_event
+        self._running[project_id] = _RunState(task, pause_event, cancel_event)
 
         logger.info("Started worker for project %s", project_id)
 
     def pause(self, project_id: str) -> bool:
-        event = self._pause_events.get(project_id)
-        if event:
-            event.clear()
+        state = self._running.get(project_id)
+        if state:
+            state.pause.clear()
             return True
         return False
 
     def resume(self, project_id: str) -> bool:
-        event = self._pause_events.get(project_id)
-        if event:
-            event.set()
+        state = self._running.get(project_id)
+        if state:
+            state.pause.set()
             return True
         return False
 
     def cancel(self, project_id: str) -> bool:
-        event = self._cancel_events.get(project_id)
-        if event:
-            event.set()
+        state = self._running.get(project_id)
+        if state:
+            state.cancel.set()
             return True
         return False
 
     def cancel_all(self) -> int:
-        count = 0
-        for project_id in list(self._tasks):
-            if self.cancel(project_id):
-                count += 1
-        return count
-
-    def _cleanup(self, project_id: str) -> None:
-        self._tasks.pop(project_id, None)
-        self._pause_events.pop(project_id, None)
-        self._cancel_events.pop(project_id, None)
+        for state in self._running.values():
+            state.cancel.set()
+        return len(self._running)
+
+    def _cleanup(self, project_id: str, task: asyncio.Task) -> None:
+        state = self._running.get(project_id)
+        # Only drop the entry this task owns, never a newer run's.
+        if state is not None and state.task is task:
+            del self._running[project_id]
         logger.info("Worker finished for project %s", project_id)
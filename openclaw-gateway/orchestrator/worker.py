@@ -12,7 +12,6 @@ import json
 import logging
 from typing import Any, Callable, Awaitable
 
-import aiohttp
 import aiosqlite
 
 from ai.provider_router import ProviderRouter
@@ -21,6 +20,7 @@ from ai.prompts import CODING_PROMPT, TESTING_PROMPT
 from ai import context as ctx
 from db import store
 from search.web_search import WebSearcher
+from skills.base import agent_session
 
 logger = logging.getLogger("skynet.core.worker")
 
@@ -450,13 +450,11 @@ class Worker:
     ) -> str:
         """Send an action to the laptop agent via the gateway HTTP API."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.gateway_url}/action",
-                    json={"action": action, "params": params, "confirmed": confirmed},
-                    timeout=aiohttp.ClientTimeout(total=130),
-                ) as resp:
-                    result = await resp.json()
+            async with agent_session().post(
+                f"{self.gateway_url}/action",
+                json={"action": action, "params": params, "confirmed": confirmed},
+            ) as resp:
+                result = await resp.json()
         except Exception as exc:
             return f"ERROR: Failed to reach agent: {exc}"
 
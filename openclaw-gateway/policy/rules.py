@@ -26,6 +26,7 @@ ACTION_RISK: dict[str, str] = {
 
     # WRITE — modifies local state
     "file_write": "WRITE",
+    "append_file": "WRITE",
     "create_directory": "WRITE",
     "git_commit": "WRITE",
     "git_init": "WRITE",
@@ -8,11 +8,45 @@ load based on their role.
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Callable, Awaitable
 
 import aiohttp
 
+# Keep-alive session for gateway /action calls, shared by every SkillContext
+# and worker so tool calls reuse pooled connections.  Bound to the loop it
+# was created on.
+_agent_session: tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession] | None = None
+
+
+def agent_session() -> aiohttp.ClientSession:
+    """Return the shared /action session, creating it on first use."""
+    global _agent_session
+    loop = asyncio.get_running_loop()
+    if _agent_session is not None:
+        owner, session = _agent_session
+        if owner is loop and not session.closed:
+            return session
+    # sock_connect rather than connect: the latter includes waiting for a
+    # free pooled connection, and /action calls may hold one for 130 s.
+    session = aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=130, sock_connect=5),
+        connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60, ttl_dns_cache=300),
+    )
+    _agent_session = (loop, session)
+    return session
+
+
+async def close_agent_session() -> None:
+    """Close the shared /action session (called on gateway shutdown)."""
+    global _agent_session
+    if _agent_session is not None:
+        _, session = _agent_session
+        _agent_session = None
+        if not session.closed:
+            await session.close()
+
 
 class SkillContext:
     """Runtime context passed to skill execution — provides gateway services."""
@@ -40,13 +74,11 @@ class SkillContext:
     ) -> str:
         """Send an action to the laptop agent via the gateway HTTP API."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.gateway_api_url}/action",
-                    json={"action": action, "params": params, "confirmed": confirmed},
-                    timeout=aiohttp.ClientTimeout(total=130),
-                ) as resp:
-                    result = await resp.json()
+            async with agent_session().post(
+                f"{self.gateway_api_url}/action",
+                json={"action": action, "params": params, "confirmed": confirmed},
+            ) as resp:
+                result = await resp.json()
         except Exception as exc:
             return f"ERROR: Failed to reach agent: {exc}"
 
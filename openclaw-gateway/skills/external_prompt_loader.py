@@ -8,6 +8,7 @@ injected into system prompts.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import hashlib
 import logging
@@ -18,6 +19,9 @@ from urllib.request import Request, urlopen
 
 logger = logging.getLogger("skynet.skills.external_loader")
 
+# Max concurrent SKILL.md downloads in sync_remote_skill_urls.
+_MAX_DOWNLOAD_WORKERS = 8
+
 
 @dataclass
 class ExternalPromptSkill:
@@ -138,8 +142,8 @@ def sync_remote_skill_urls(skill_urls: list[str], cache_root: str) -> list[Path]
 
     cache_dir = Path(cache_root)
     cache_dir.mkdir(parents=True, exist_ok=True)
-    out: list[Path] = []
 
+    jobs: list[tuple[str, Path]] = []
     for raw_input in skill_urls:
         item = raw_input.strip()
         if not item:
@@ -152,16 +156,26 @@ def sync_remote_skill_urls(skill_urls: list[str], cache_root: str) -> list[Path]
         raw_url, suggested_name = converted
         skill_dir = cache_dir / _safe_name(suggested_name)
         skill_dir.mkdir(parents=True, exist_ok=True)
-        skill_file = skill_dir / "SKILL.md"
+        jobs.append((raw_url, skill_dir / "SKILL.md"))
+
+    if not jobs:
+        return []
+
+    def _fetch(job: tuple[str, Path]) -> Path | None:
+        raw_url, skill_file = job
         try:
             text = _download_text(raw_url)
             skill_file.write_text(text, encoding="utf-8")
-            out.append(skill_file)
             logger.info("Fetched external skill: %s", raw_url)
+            return skill_file
         except Exception as exc:
             logger.warning("Failed to fetch external skill from %s: %s", raw_url, exc)
+            return None
 
-    return out
+    # Downloads are independent network round trips; fetch them in parallel
+    # and keep the input order in the result.
+    with ThreadPoolExecutor(max_workers=min(_MAX_DOWNLOAD_WORKERS, len(jobs))) as pool:
+        return [path for path in pool.map(_fetch, jobs) if path is not None]
 
 
 def _read_skill_file(path: Path, max_chars: int) -> ExternalPromptSkill | None:
@@ -303,6 +303,8 @@ class SSHTunnelExecutor:
                 return self._file_read(client, params)
             if action == "file_write":
                 return self._file_write(client, params)
+            if action == "append_file":
+                return self._append_file(client, params)
             if action == "create_directory":
                 return self._create_directory(client, params)
             if action == "list_directory":
@@ -847,6 +849,53 @@ class SSHTunnelExecutor:
         finally:
             sftp.close()
 
+    def _append_file(self, client: paramiko.SSHClient, params: dict[str, Any]) -> dict[str, Any]:
+        filepath = self._require_str(params, "file")
+        content = params.get("content", "")
+        unless_contains = params.get("unless_contains") or ""
+        if not isinstance(content, str):
+            return {"returncode": 1, "stdout": "", "stderr": "content must be a string."}
+        if not isinstance(unless_contains, str):
+            return {"returncode": 1, "stdout": "", "stderr": "unless_contains must be a string."}
+        if len(content.encode("utf-8")) > 1_048_576:
+            return {"returncode": 1, "stdout": "", "stderr": "Content exceeds 1 MB limit."}
+
+        sftp = client.open_sftp()
+        try:
+            parent = str(PureWindowsPath(filepath).parent) if self.remote_os == "windows" else str(PurePosixPath(filepath).parent)
+            self._sftp_makedirs(sftp, parent)
+            if unless_contains:
+                try:
+                    with sftp.open(filepath, "r") as fh:
+                        existing = fh.read().decode("utf-8", errors="replace")
+                except FileNotFoundError:
+                    existing = ""
+                if unless_contains in existing:
+                    return {"returncode": 0, "stdout": f"{filepath} already up to date.", "stderr": ""}
+            with sftp.open(filepath, "a") as fh:
+                fh.write(content)
+            return {"returncode": 0, "stdout": f"Appended {len(content)} bytes to {filepath}.", "stderr": ""}
+        except OSError as exc:
+            if self.remote_os == "windows":
+                encoded = base64.b64encode(content.encode("utf-8")).decode("ascii")
+                skip = (
+                    f"if ((Test-Path $p) -and [System.IO.File]::ReadAllText($p).Contains({_ps_quote(unless_contains)})) "
+                    f"{{ Write-Output ($p + ' already up to date.'); exit 0 }}; "
+                    if unless_contains else ""
+                )
+                ps = (
+                    f"$p={_ps_quote(filepath)}; "
+                    "$d=Split-Path -Parent $p; if ($d) { New-Item -ItemType Directory -Path $d -Force | Out-Null }; "
+                    f"{skip}"
+                    f"$bytes=[System.Convert]::FromBase64String('{encoded}'); "
+                    "$fs=[System.IO.File]::Open($p,[System.IO.FileMode]::Append); "
+                    "try { $fs.Write($bytes,0,$bytes.Length) } finally { $fs.Close() };"
+                )
+                return self._run_command(client, ["powershell", "-NoProfile", "-Command", ps], cwd=None)
+            return {"returncode": 1, "stdout": "", "stderr": str(exc)}
+        finally:
+            sftp.close()
+
     def _create_directory(self, client: paramiko.SSHClient, params: dict[str, Any]) -> dict[str, Any]:
         directory = self._require_str(params, "directory")
         sftp = client.open_sftp()
@@ -108,17 +108,13 @@ class BackgroundScheduler:
         offloads old ones to S3 to prevent DB bloat.
         """
         try:
-            # Get projects with old conversations.
-            projects = await store.list_projects(self.db)
-
-            for project in projects:
-                project_id = project["id"]
+            # Only projects with more than 30 messages have anything to archive.
+            counts = await store.count_conversations_by_project(self.db, more_than=30)
+            for project_id in counts:
                 # Get all messages (we'll archive the older ones).
                 all_msgs = await store.get_conversation(
                     self.db, project_id, limit=500,
                 )
-                if len(all_msgs) <= 30:
-                    continue  # Not enough to archive.
 
                 # Keep the 30 most recent, archive the rest.
                 to_archive = all_msgs[:-30]
@@ -184,7 +180,7 @@ class BackgroundScheduler:
                 logger.error("Empty zip data for project %s", project_slug)
                 return None
 
-            zip_bytes = base64.b64decode(zip_b64)
+            zip_bytes = await asyncio.to_thread(base64.b64decode, zip_b64)
             key = await self.s3.upload_project_snapshot(project_slug, version, zip_bytes)
             logger.info("Backed up project %s v%d → %s", project_slug, version, key)
             return key
@@ -218,9 +214,8 @@ class BackgroundStorage:
             logger.info("Daily backup skipped: no connected agent and SSH fallback is unhealthy.")
             return
 
-        projects = await store.list_projects(self.db)
         active = [
-            p for p in projects
+            p async for p in store.iter_projects(self.db)
             if str(p.get("status", "")).lower() not in {"cancelled"}
         ]
         if not active:
@@ -27,6 +27,10 @@ from typing import Any
 
 logger = logging.getLogger("skynet.storage.s3")
 
+# Payloads that are already deflate-compressed gain almost nothing from a
+# second pass, so they are gzipped at the fastest level.
+_PRECOMPRESSED_TYPES = frozenset({"application/zip", "application/gzip"})
+
 
 class S3Storage:
     """Async-friendly S3 client for SKYNET artifact storage."""
@@ -58,11 +62,12 @@ class S3Storage:
     # ------------------------------------------------------------------
 
     async def upload(self, key: str, data: bytes, content_type: str = "application/octet-stream") -> None:
-        """Upload raw bytes to S3 (gzip-compressed)."""
-        compressed = gzip.compress(data)
+        """Upload raw bytes to S3 (gzip-compressed off the event loop)."""
         full_key = self._full_key(key)
+        level = 1 if content_type in _PRECOMPRESSED_TYPES else 9
 
         def _put():
+            compressed = gzip.compress(data, compresslevel=level)
             client = self._get_client()
             client.put_object(
                 Bucket=self.bucket,
@@ -71,9 +76,10 @@ class S3Storage:
                 ContentType=content_type,
                 ContentEncoding="gzip",
             )
+            return len(compressed)
 
-        await self._run_sync(_put)
-        logger.info("Uploaded %s (%d bytes compressed)", full_key, len(compressed))
+        size = await self._run_sync(_put)
+        logger.info("Uploaded %s (%d bytes compressed)", full_key, size)
 
     async def download(self, key: str) -> bytes | None:
         """Download and decompress an object from S3. Returns None if not found."""
@@ -3579,7 +3579,7 @@ async def _handle_natural_action(update: Update, text: str) -> bool:
 
         if intent == "project_status":
             try:
-                status = await _project_manager.get_status(project["id"])
+                status = await _project_manager.get_status(project["id"], include_events=False)
                 current = status.get("current_task")
                 sentence = (
                     f"'{_project_display(project)}' is {status['project']['status']} "
@@ -4470,14 +4470,13 @@ async def cmd_heartbeat(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     if not _heartbeat:
         await update.message.reply_text("Heartbeat scheduler not configured.")
         return
-    status = _heartbeat.get_status()
-    if not status:
+    if not _heartbeat.task_count:
         await update.message.reply_text("No heartbeat tasks registered.")
         return
     lines = [
         f"<b>SKYNET Heartbeat</b> ({'running' if _heartbeat.is_running else 'stopped'})\n",
     ]
-    for t in status:
+    for t in _heartbeat.iter_status():
         enabled = "ON" if t["enabled"] else "OFF"
         next_in = int(t.get("next_run_in", 0))
         lines.append(
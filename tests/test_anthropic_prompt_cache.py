@@ -0,0 +1,74 @@
+"""Anthropic adapter prompt caching: request breakpoints and usage accounting."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import types
+
+import pytest
+
+pytest.importorskip("anthropic")
+
+
+def _adapter():
+    repo_root = Path(__file__).parent.parent
+    gateway_root = str(repo_root / "openclaw-gateway")
+    if gateway_root not in sys.path:
+        sys.path.insert(0, gateway_root)
+
+    from ai.providers import anthropic_ai
+    return anthropic_ai
+
+
+def test_static_prefix_and_last_message_are_marked_for_caching() -> None:
+    mod = _adapter()
+    tools = [{"name": "a", "input_schema": {}}, {"name": "b", "input_schema": {}}]
+    messages = [
+        {"role": "user", "content": "plan this"},
+        {"role": "assistant", "content": [
+            {"type": "tool_use", "id": "t1", "name": "a", "input": {}},
+        ]},
+        {"role": "user", "content": [
+            {"type": "tool_result", "tool_use_id": "t1", "content": "ok"},
+        ]},
+    ]
+
+    assert mod._convert_system("SYS") == [
+        {"type": "text", "text": "SYS", "cache_control": {"type": "ephemeral"}},
+    ]
+    converted_tools = mod._convert_tools(tools)
+    assert "cache_control" not in converted_tools[0]
+    assert converted_tools[1]["cache_control"] == {"type": "ephemeral"}
+
+    converted = mod._convert_messages(messages)
+    assert converted[:2] == messages[:2]
+    assert converted[2]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in messages[2]["content"][0]  # caller's history untouched
+    assert mod._convert_messages([{"role": "user", "content": "hi"}])[0]["content"] == [
+        {"type": "text", "text": "hi", "cache_control": {"type": "ephemeral"}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cached_prompt_tokens_count_as_input_tokens() -> None:
+    mod = _adapter()
+    usage = types.SimpleNamespace(
+        input_tokens=12, output_tokens=5,
+        cache_read_input_tokens=900, cache_creation_input_tokens=300,
+    )
+    reply = types.SimpleNamespace(
+        content=[types.SimpleNamespace(type="text", text="hi")], usage=usage,
+    )
+
+    async def _create(**kwargs):
+        return reply
+
+    provider = mod.AnthropicProvider(api_key="test")
+    provider._client = types.SimpleNamespace(messages=types.SimpleNamespace(create=_create))
+    response = await provider.chat([{"role": "user", "content": "hi"}], system="SYS")
+
+    # Cache reads and writes are billed and quota'd like any prompt token.
+    assert (response.input_tokens, response.output_tokens) == (1212, 5)
+    usage.cache_read_input_tokens = usage.cache_creation_input_tokens = None
+    assert (await provider.chat([{"role": "user", "content": "hi"}])).input_tokens == 12
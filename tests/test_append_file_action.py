@@ -0,0 +1,98 @@
+"""append_file action on the CHATHAN worker and the SSH tunnel executor."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import io
+import sys
+
+import pytest
+
+_REPO_ROOT = Path(__file__).parent.parent
+
+
+def _agent_actions():
+    agent_root = str(_REPO_ROOT / "openclaw-agent")
+    if agent_root not in sys.path:
+        sys.path.insert(0, agent_root)
+
+    from executor import actions
+    return actions
+
+
+@pytest.mark.asyncio
+async def test_worker_append_file_creates_appends_and_skips_listed_rows(tmp_path) -> None:
+    actions = _agent_actions()
+    target = tmp_path / "proj" / ".openclaw" / "agents.md"
+
+    first = await actions.append_file({"file": str(target), "content": "| backend | a1 | idle |\n"})
+    assert first["returncode"] == 0
+    await actions.append_file({
+        "file": str(target), "content": "| backend | a1 | idle |\n", "unless_contains": "a1",
+    })
+    await actions.append_file({
+        "file": str(target), "content": "| backend | a2 | idle |\n", "unless_contains": "a2",
+    })
+
+    assert target.read_text(encoding="utf-8") == (
+        "| backend | a1 | idle |\n| backend | a2 | idle |\n"
+    )
+    bad = await actions.append_file({"file": str(target), "content": 1})
+    assert bad["returncode"] == 1
+
+
+class _SFTPFile(io.BytesIO):
+    def __init__(self, files: dict[str, bytes], path: str, mode: str) -> None:
+        super().__init__(files.get(path, b"") if mode == "r" else b"")
+        self._files, self._path, self._mode = files, path, mode
+
+    def write(self, data) -> int:  # paramiko accepts str as well as bytes
+        return super().write(data.encode("utf-8") if isinstance(data, str) else data)
+
+    def close(self) -> None:
+        if self._mode == "a":
+            self._files[self._path] = self._files.get(self._path, b"") + self.getvalue()
+        super().close()
+
+
+class _SFTP:
+    def __init__(self) -> None:
+        self.files: dict[str, bytes] = {}
+
+    def stat(self, path: str) -> None:
+        return None
+
+    def mkdir(self, path: str) -> None:
+        return None
+
+    def open(self, path: str, mode: str) -> _SFTPFile:
+        if mode == "r" and path not in self.files:
+            raise FileNotFoundError(path)
+        return _SFTPFile(self.files, path, mode)
+
+    def close(self) -> None:
+        return None
+
+
+def test_ssh_append_file_skips_rows_already_present(monkeypatch) -> None:
+    pytest.importorskip("paramiko")
+    gateway_root = str(_REPO_ROOT / "openclaw-gateway")
+    if gateway_root not in sys.path:
+        sys.path.insert(0, gateway_root)
+    monkeypatch.setenv("OPENCLAW_SSH_REMOTE_OS", "linux")
+    from ssh_tunnel_executor import SSHTunnelExecutor
+
+    sftp = _SFTP()
+    client = type("_Client", (), {"open_sftp": lambda self: sftp})()
+    executor = SSHTunnelExecutor()
+    path = "/home/me/proj/.openclaw/agents.md"
+
+    for agent_id in ("a1", "a1", "a2"):
+        result = executor._append_file(client, {
+            "file": path,
+            "content": f"| backend | {agent_id} | idle |\n",
+            "unless_contains": agent_id,
+        })
+        assert result["returncode"] == 0
+
+    assert sftp.files[path] == b"| backend | a1 | idle |\n| backend | a2 | idle |\n"
@@ -0,0 +1,532 @@
+"""Gateway store helper tests."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from pathlib import Path
+import importlib.util
+import sys
+
+import pytest
+
+
+def _load_module(path: Path, module_name: str):
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load module from {path}")
+    mod = importlib.util.module_from_spec(spec)
+    # Gateway modules import shared helpers (json_codec) from the gateway root.
+    gateway_root = str(path.parents[1])
+    if gateway_root not in sys.path:
+        sys.path.insert(0, gateway_root)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+_REPO_ROOT = Path(__file__).parent.parent
+
+
+def _load_store():
+    return _load_module(
+        _REPO_ROOT / "openclaw-gateway" / "db" / "store.py", "oc_gateway_store_helpers",
+    )
+
+
+def _load_schema():
+    return _load_module(
+        _REPO_ROOT / "openclaw-gateway" / "db" / "schema.py", "oc_gateway_schema_helpers",
+    )
+
+
+def test_now_matches_strftime_and_is_cached_per_second(monkeypatch) -> None:
+    store = _load_store()
+    fixed = 1_700_000_000.25
+    monkeypatch.setattr(store.time, "time", lambda: fixed)
+
+    stamp = store._now()
+    expected = datetime.fromtimestamp(fixed, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    assert stamp == expected
+    assert store._today() == expected[:10]
+    assert store._now() is stamp
+
+    monkeypatch.setattr(store.time, "time", lambda: fixed + 1)
+    assert store._now() != stamp
+
+
+@pytest.mark.asyncio
+async def test_iter_projects_streams_in_batches(monkeypatch) -> None:
+    schema = _load_schema()
+    store = _load_store()
+    monkeypatch.setattr(store, "_ITER_BATCH_SIZE", 2)
+
+    db = await schema.init_db(":memory:")
+    try:
+        for i in range(5):
+            await store.create_project(db, f"p{i}", f"P{i}", f"/tmp/p{i}")
+        streamed = [p async for p in store.iter_projects(db)]
+        assert streamed == await store.list_projects(db)
+        assert len(streamed) == 5
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_get_conversation_returns_latest_messages_oldest_first() -> None:
+    schema = _load_schema()
+    store = _load_store()
+
+    db = await schema.init_db(":memory:")
+    try:
+        project = await store.create_project(db, "conv", "Conv", "/tmp/conv")
+        for i in range(5):
+            await store.add_conversation_message(db, project["id"], "user", {"n": i})
+        rows = await store.get_conversation(db, project["id"], limit=3)
+        assert [row["content"]["n"] for row in rows] == [2, 3, 4]
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_conversation_content_round_trips_strings_verbatim() -> None:
+    schema = _load_schema()
+    store = _load_store()
+
+    db = await schema.init_db(":memory:")
+    try:
+        project = await store.create_project(db, "conv-str", "Conv", "/tmp/conv-str")
+        await store.add_conversation_message(db, project["id"], "user", "123")
+        await store.add_conversation_message(db, project["id"], "user", "plain text")
+        # Legacy rows stored plain strings without JSON encoding.
+        await db.execute(
+            "INSERT INTO conversations (project_id, role, content) VALUES (?, 'user', 'legacy')",
+            (project["id"],),
+        )
+        rows = await store.get_conversation(db, project["id"])
+        assert [row["content"] for row in rows] == ["123", "plain text", "legacy"]
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_remove_project_cascade_clears_child_rows() -> None:
+    schema = _load_schema()
+    store = _load_store()
+
+    db = await schema.init_db(":memory:")
+    try:
+        keep = await store.create_project(db, "keep", "Keep", "/tmp/keep")
+        drop = await store.create_project(db, "drop", "Drop", "/tmp/drop")
+        for project in (keep, drop):
+            await store.add_idea(db, project["id"], "idea")
+            await store.add_event(db, project["id"], "created", "created")
+            await store.add_conversation_message(db, project["id"], "user", "hi")
+
+        assert await store.remove_project_cascade(db, drop["id"]) is True
+        assert await store.get_project(db, drop["id"]) is None
+        assert await store.get_ideas(db, drop["id"]) == []
+        assert await store.get_events(db, drop["id"]) == []
+        assert await store.get_conversation(db, drop["id"]) == []
+        assert len(await store.get_ideas(db, keep["id"])) == 1
+
+        assert await store.remove_project_cascade(db, drop["id"]) is False
+    finally:
+        await db.close()
+
+
+def test_update_sql_is_canonical_per_column_set() -> None:
+    store = _load_store()
+
+    sql_a, cols_a = store._update_sql("tasks", {"status": 1, "error_message": 2})
+    sql_b, cols_b = store._update_sql("tasks", ["error_message", "status"])
+    assert sql_a is sql_b
+    assert cols_a == cols_b == ("error_message", "status")
+    assert sql_a == "UPDATE tasks SET error_message = ?, status = ? WHERE id = ?"
+
+
+@pytest.mark.asyncio
+async def test_update_task_rejects_unknown_columns() -> None:
+    schema = _load_schema()
+    store = _load_store()
+
+    db = await schema.init_db(":memory:")
+    try:
+        with pytest.raises(ValueError):
+            await store.update_task(db, 1, **{"status = 'x' --": "y"})
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_record_provider_usage_returns_accumulated_row() -> None:
+    schema = _load_schema()
+    store = _load_store()
+
+    db = await schema.init_db(":memory:")
+    try:
+        first = await store.record_provider_usage(db, "gemini", tokens=10)
+        assert (first["requests_used"], first["tokens_used"], first["errors"]) == (1, 10, 0)
+
+        second = await store.record_provider_usage(db, "gemini", requests=0, error=True)
+        assert (second["requests_used"], second["tokens_used"], second["errors"]) == (1, 10, 1)
+        assert second == await store.get_provider_usage(db, "gemini")
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_coalesced_writes_commit_once_after_burst(tmp_path) -> None:
+    schema = _load_schema()
+    store = _load_store()
+    db_path = str(tmp_path / "gateway.db")
+
+    db = await schema.init_db(db_path)
+    reader = await schema.init_db(db_path)
+    try:
+        project = await store.create_project(db, "burst", "Burst", "/tmp/burst")
+        for i in range(5):
+            await store.add_event(db, project["id"], "tick", f"tick {i}")
+
+        # Visible on the writing connection, not yet committed for others.
+        assert len(await store.get_events(db, project["id"])) == 5
+        assert await store.get_events(reader, project["id"]) == []
+
+        await asyncio.sleep(store._COMMIT_DELAY * 5)
+        assert len(await store.get_events(reader, project["id"])) == 5
+
+        await store.add_event(db, project["id"], "tick", "last")
+        await store.flush(db)
+        assert len(await store.get_events(reader, project["id"])) == 6
+    finally:
+        await reader.close()
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_forget_profile_facts_matches_substrings_literally() -> None:
+    schema = _load_schema()
+    store = _load_store()
+
+    db = await schema.init_db(":memory:")
+    try:
+        user = await store.ensure_user(db, telegram_user_id=42)
+        uid = int(user["id"])
+        await store.add_or_update_profile_fact(db, user_id=uid, fact_key="City", fact_value="Kochi")
+        await store.add_or_update_profile_fact(
+            db, user_id=uid, fact_key="pet", fact_value="Dog named Max",
+        )
+
+        assert await store.forget_profile_facts(db, user_id=uid, key_or_text="%") == 0
+        assert await store.forget_profile_facts(db, user_id=uid, key_or_text="city") == 1
+        assert await store.forget_profile_facts(db, user_id=uid, key_or_text="NAMED max") == 1
+        assert await store.list_profile_facts(db, user_id=uid) == []
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_get_conversation_column_projection() -> None:
+    schema = _load_schema()
+    store = _load_store()
+
+    db = await schema.init_db(":memory:")
+    try:
+        project = await store.create_project(db, "proj", "Proj", "/tmp/proj")
+        await store.add_conversation_message(
+            db, project["id"], "user", {"text": "hi"}, phase="planning",
+        )
+        await store.add_conversation_message(db, project["id"], "assistant", "ok", phase="coding")
+
+        rows = await store.get_conversation(
+            db, project["id"], phase="planning", columns=("role", "content"),
+        )
+        assert rows == [{"id": rows[0]["id"], "role": "user", "content": {"text": "hi"}}]
+
+        ids = await store.get_conversation(db, project["id"], columns=("id",))
+        assert [set(row) for row in ids] == [{"id"}, {"id"}]
+
+        with pytest.raises(ValueError):
+            await store.get_conversation(db, project["id"], columns=("role; DROP TABLE x",))
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_run_sync_private_aiosqlite_api_is_still_there() -> None:
+    # _run_sync calls Connection._execute(fn, Connection._conn, ...), which
+    # aiosqlite does not promise to keep.  Fail here, not in production, if
+    # an upgrade past the pinned range renames or reshapes either one.
+    import inspect
+    import sqlite3
+
+    import aiosqlite
+
+    schema = _load_schema()
+    store = _load_store()
+    assert inspect.iscoroutinefunction(aiosqlite.Connection._execute)
+
+    db = await schema.init_db(":memory:")
+    try:
+        assert isinstance(db._conn, sqlite3.Connection)
+        seen = await store._run_sync(db, lambda conn, a: (conn, a), 1)
+        assert seen == (db._conn, 1)
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_single_hop_helpers_keep_multi_statement_semantics() -> None:
+    schema = _load_schema()
+    store = _load_store()
+
+    db = await schema.init_db(":memory:")
+    try:
+        project = await store.create_project(db, "proj", "Proj", "/tmp/proj")
+        assert project["name"] == "proj"
+
+        first = await store.create_plan(db, project["id"], "v1", [], [])
+        second = await store.create_plan(db, project["id"], "v2", [], [])
+        assert second > first
+        assert (await store.get_active_plan(db, project["id"]))["id"] == second
+
+        run_id = await store.create_agent_run(
+            db, project_id=project["id"], task_id=None, agent_id="a1",
+            agent_role="coder", metadata={"a": 1},
+        )
+        await store.heartbeat_agent_run(db, run_id=run_id, metadata_patch={"b": 2})
+        await store.finish_agent_run(db, run_id=run_id, status="Done", metadata_patch={"c": 3})
+        (run,) = await store.list_agent_runs(db, project_id=project["id"])
+        assert run["status"] == "done"
+        assert run["metadata"] == {"a": 1, "b": 2, "c": 3}
+
+        user = await store.ensure_user(db, telegram_user_id=7, username="old")
+        again = await store.ensure_user(db, telegram_user_id=7, username="new")
+        assert again["id"] == user["id"] and again["username"] == "new"
+    finally:
+        await store.flush(db)
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_create_active_plan_writes_one_transaction() -> None:
+    schema = _load_schema()
+    store = _load_store()
+
+    db = await schema.init_db(":memory:")
+    try:
+        project = await store.create_project(db, "proj", "Proj", "/tmp/proj")
+        old_plan = await store.create_plan(db, project["id"], "v1", [], [])
+        plan, task_ids = await store.create_active_plan(
+            db, project["id"], "v2", [], [],
+            [{"title": "a", "milestone": "m1"}, {"title": "b"}],
+        )
+        plan_id = plan["id"]
+        assert plan_id != old_plan
+        assert not db.in_transaction
+        assert (await store.get_active_plan(db, project["id"]))["id"] == plan_id
+
+        tasks = await store.get_tasks(db, project["id"], plan_id=plan_id)
+        assert [t["id"] for t in tasks] == task_ids
+        assert [(t["title"], t["milestone"], t["order_index"]) for t in tasks] == [
+            ("a", "m1", 0), ("b", "", 1),
+        ]
+
+        more = await store.create_tasks(
+            db, project["id"], plan_id, [{"title": "c"}, {"title": "d"}],
+        )
+        tasks = await store.get_tasks(db, project["id"], plan_id=plan_id)
+        assert sorted(t["id"] for t in tasks) == task_ids + more
+        assert await store.create_tasks(db, project["id"], plan_id, []) == []
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_batched_project_lookups() -> None:
+    schema = _load_schema()
+    store = _load_store()
+
+    db = await schema.init_db(":memory:")
+    try:
+        a = await store.create_project(db, "a", "A", "/tmp/a")
+        b = await store.create_project(db, "b", "B", "/tmp/b")
+        for _ in range(3):
+            await store.add_conversation_message(db, a["id"], "user", "hi")
+        await store.add_conversation_message(db, b["id"], "user", "hi")
+
+        found = await store.get_projects_by_ids(db, [b["id"], "missing", a["id"], b["id"]])
+        assert set(found) == {a["id"], b["id"]}
+        assert found[a["id"]]["name"] == "a"
+        assert await store.get_projects_by_ids(db, []) == {}
+
+        assert await store.count_conversations_by_project(db) == {a["id"]: 3, b["id"]: 1}
+        assert await store.count_conversations_by_project(db, more_than=1) == {a["id"]: 3}
+    finally:
+        await store.flush(db)
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_column_projection() -> None:
+    schema = _load_schema()
+    store = _load_store()
+
+    db = await schema.init_db(":memory:")
+    try:
+        project = await store.create_project(db, "proj", "Proj", "/tmp/proj")
+        plan, _ = await store.create_active_plan(
+            db, project["id"], "v1", [], [], [{"title": "a", "description": "long"}],
+        )
+        plan_id = plan["id"]
+
+        rows = await store.get_tasks(db, project["id"], plan_id, columns=("title", "status"))
+        assert rows == [{"id": rows[0]["id"], "title": "a", "status": "pending"}]
+        assert (await store.get_tasks(db, project["id"]))[0]["description"] == "long"
+
+        with pytest.raises(ValueError):
+            await store.get_tasks(db, project["id"], columns=("title FROM tasks; --",))
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_buffered_provider_usage_flushes_as_one_upsert() -> None:
+    schema = _load_schema()
+    store = _load_store()
+
+    db = await schema.init_db(":memory:")
+    try:
+        await store.record_provider_usage(db, "groq", tokens=1)
+        store.buffer_provider_usage("groq", tokens=5)
+        store.buffer_provider_usage("groq", requests=0, error=True)
+        store.buffer_provider_usage("gemini", tokens=7)
+        assert (await store.get_provider_usage(db, "gemini")) is None
+
+        assert await store.flush_provider_usage(db) == 2
+        assert await store.flush_provider_usage(db) == 0
+
+        groq = await store.get_provider_usage(db, "groq")
+        assert (groq["requests_used"], groq["tokens_used"], groq["errors"]) == (2, 6, 1)
+        gemini = await store.get_provider_usage(db, "gemini")
+        assert (gemini["requests_used"], gemini["tokens_used"], gemini["errors"]) == (1, 7, 0)
+    finally:
+        await store.flush(db)
+        await db.close()
+
+
+def test_uuid_pool_ids_are_distinct_12_char_hex() -> None:
+    store = _load_store()
+
+    ids = [store._uuid() for _ in range(2000)]  # spans several pool refills
+    assert all(len(i) == 12 and int(i, 16) >= 0 for i in ids)
+    assert len(set(ids)) == len(ids)
+
+
+def test_content_decode_keeps_legacy_fragments_as_text() -> None:
+    store = _load_store()
+
+    decoded = [store._loads_content(r) for r in ['{"a": 1}', '"x"', "[1, 2]"]]
+    assert decoded == [{"a": 1}, "x", [1, 2]]
+    # Plain-text fragments that would parse once concatenated must stay raw text.
+    for raw in (
+        ["1,[2", "3]"], ["1],[2"], ["1],2,[3"], ["legacy"], ["1, 2"], ['"x"],["y', 'z"'],
+    ):
+        assert [store._loads_content(r) for r in raw] == raw
+
+
+@pytest.mark.asyncio
+async def test_update_project_with_event_writes_both_rows() -> None:
+    schema = _load_schema()
+    store = _load_store()
+
+    db = await schema.init_db(":memory:")
+    try:
+        project = await store.create_project(db, "proj", "Proj", "/tmp/proj")
+        await store.update_project_with_event(
+            db, project["id"], "cancelled", "Project cancelled by user", status="cancelled",
+        )
+
+        assert (await store.get_project(db, project["id"]))["status"] == "cancelled"
+        events = await store.get_events(db, project["id"])
+        assert [e["event_type"] for e in events] == ["cancelled"]
+
+        with pytest.raises(ValueError):
+            await store.update_project_with_event(db, project["id"], "x", "y", bogus=1)
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_update_project_and_task_roles_sets_every_row() -> None:
+    schema = _load_schema()
+    store = _load_store()
+
+    db = await schema.init_db(":memory:")
+    try:
+        project = await store.create_project(db, "proj", "Proj", "/tmp/proj")
+        _, task_ids = await store.create_active_plan(
+            db, project["id"], "v1", [], [], [{"title": "a"}, {"title": "b"}],
+        )
+
+        await store.update_project_and_task_roles(
+            db, project["id"], [("frontend", task_ids[0]), ("qa", str(task_ids[1]))],
+        )
+        await store.update_project_and_task_roles(db, project["id"], [], status="planning")
+
+        rows = await store.get_tasks(db, project["id"], columns=("assigned_agent_role",))
+        assert [r["assigned_agent_role"] for r in rows] == ["frontend", "qa"]
+        assert (await store.get_project(db, project["id"]))["status"] == "planning"
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_create_active_plan_returns_the_stored_row() -> None:
+    schema = _load_schema()
+    store = _load_store()
+
+    db = await schema.init_db(":memory:")
+    try:
+        project = await store.create_project(db, "proj", "Proj", "/tmp/proj")
+        await store.create_plan(db, project["id"], "v1", [], [])
+        milestones = [{"name": "M1", "tasks": [{"title": "a"}]}]
+
+        plan, task_ids = await store.create_active_plan(
+            db, project["id"], "v2", milestones, milestones, [{"title": "a"}],
+        )
+
+        assert plan == await store.get_active_plan(db, project["id"])
+        assert plan["milestones"] == milestones
+        tasks = await store.get_tasks(db, project["id"], plan["id"], columns=("title",))
+        assert [t["title"] for t in tasks] == ["a"]
+        assert [t["id"] for t in tasks] == task_ids
+
+        await store.update_project_and_task_roles(
+            db, project["id"], [("qa", task_ids[0])], status="planning",
+        )
+        assert (await store.get_project(db, project["id"]))["status"] == "planning"
+        roles = await store.get_tasks(db, project["id"], columns=("assigned_agent_role",))
+        assert roles[0]["assigned_agent_role"] == "qa"
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_init_db_drops_prefix_duplicate_indexes(tmp_path) -> None:
+    schema = _load_schema()
+    db_path = str(tmp_path / "gateway.db")
+
+    db = await schema.init_db(db_path)
+    await db.execute("CREATE INDEX idx_tasks_project ON tasks(project_id)")
+    await db.execute("CREATE INDEX idx_conversations_project ON conversations(project_id)")
+    await db.commit()
+    await db.close()
+
+    db = await schema.init_db(db_path)
+    try:
+        rows = await db.execute_fetchall("SELECT name FROM sqlite_master WHERE type = 'index'")
+        names = {row[0] for row in rows}
+        assert not names & {"idx_tasks_project", "idx_conversations_project"}
+        assert {"idx_tasks_project_order", "idx_conversations_project_phase"} <= names
+    finally:
+        await db.close()
@@ -0,0 +1,100 @@
+"""Heartbeat scheduler tests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+import importlib.util
+import sys
+
+import pytest
+
+
+def _load_module(path: Path, module_name: str):
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load module from {path}")
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = mod  # dataclasses resolve annotations through it
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _load_scheduler():
+    root = Path(__file__).parent.parent
+    return _load_module(
+        root / "openclaw-gateway" / "heartbeat" / "scheduler.py", "oc_heartbeat_scheduler",
+    )
+
+
+@pytest.mark.asyncio
+async def test_scheduler_runs_tasks_at_their_own_cadence() -> None:
+    mod = _load_scheduler()
+    runs: dict[str, int] = {"fast": 0, "slow": 0, "paused": 0}
+
+    def _counter(name: str):
+        async def handler(ctx) -> None:
+            runs[name] += 1
+        return handler
+
+    scheduler = mod.HeartbeatScheduler(tick_interval=60)
+    scheduler.register(mod.HeartbeatTask("fast", "", 0.05, _counter("fast")))
+    scheduler.register(mod.HeartbeatTask("slow", "", 3600, _counter("slow")))
+    scheduler.register(mod.HeartbeatTask("paused", "", 0.05, _counter("paused")))
+    scheduler.pause_task("paused")
+
+    await scheduler.start()
+    try:
+        await asyncio.sleep(0.3)
+    finally:
+        await scheduler.stop()
+
+    # Sub-tick intervals fire repeatedly instead of once per 60s tick.
+    assert runs["fast"] >= 3
+    assert runs["slow"] == 1
+    assert runs["paused"] == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_wakes_for_task_registered_while_sleeping() -> None:
+    mod = _load_scheduler()
+    ran = asyncio.Event()
+
+    async def handler(ctx) -> None:
+        ran.set()
+
+    scheduler = mod.HeartbeatScheduler(tick_interval=60)
+    await scheduler.start()
+    try:
+        await asyncio.sleep(0.01)
+        scheduler.register(mod.HeartbeatTask("late", "", 10, handler))
+        await asyncio.wait_for(ran.wait(), timeout=1.0)
+    finally:
+        await scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_failed_task_waits_a_full_interval() -> None:
+    mod = _load_scheduler()
+    calls = 0
+
+    async def handler(ctx) -> None:
+        nonlocal calls
+        calls += 1
+        raise RuntimeError("boom")
+
+    scheduler = mod.HeartbeatScheduler(tick_interval=60)
+    scheduler.register(mod.HeartbeatTask("flaky", "", 3600, handler))
+    await scheduler.start()
+    try:
+        await asyncio.sleep(0.1)
+    finally:
+        await scheduler.stop()
+
+    assert calls == 1
+    (status,) = scheduler.get_status()
+    assert status["last_error"] == "boom"
+    assert status["run_count"] == 0
+    assert 3590 < status["next_run_in"] <= 3600
+    assert abs(status["last_run"] - time.time()) < 5
@@ -0,0 +1,46 @@
+"""Shared gateway JSON codec: orjson and stdlib paths produce the same text."""
+
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+import builtins
+import importlib
+import json
+import sys
+
+import pytest
+
+
+def _codec(monkeypatch, *, stdlib: bool):
+    gateway_root = str(Path(__file__).parent.parent / "openclaw-gateway")
+    if gateway_root not in sys.path:
+        sys.path.insert(0, gateway_root)
+    if stdlib:
+        real_import = builtins.__import__
+
+        def _no_orjson(name, *args, **kwargs):
+            if name == "orjson":
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", _no_orjson)
+    sys.modules.pop("json_codec", None)
+    mod = importlib.import_module("json_codec")
+    monkeypatch.setitem(sys.modules, "json_codec", mod)
+    return mod
+
+
+@pytest.mark.parametrize("stdlib", [False, True])
+def test_codec_output_is_compact_utf8_and_tolerant(monkeypatch, stdlib: bool) -> None:
+    if not stdlib:
+        pytest.importorskip("orjson")
+    codec = _codec(monkeypatch, stdlib=stdlib)
+    value = {"b": "é", 1: date(2024, 1, 2), "a": [1, None]}
+
+    assert codec.dumps(value) == '{"b":"é","1":"2024-01-02","a":[1,null]}'
+    assert codec.dumpb(value) == codec.dumps(value).encode()
+    assert codec.dumps({"b": 1, "a": 2}, indent=True, sort_keys=True) == '{\n  "a": 2,\n  "b": 1\n}'
+    assert codec.loads(b'{"k": [1]}') == codec.loads('{"k": [1]}') == {"k": [1]}
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads("{nope")
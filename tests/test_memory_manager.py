@@ -0,0 +1,250 @@
+"""Memory manager tests (agent file actions are faked in-process)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import importlib
+import importlib.util
+import json
+import sys
+import types
+
+import pytest
+
+
+def _load_module(path: Path, module_name: str):
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load module from {path}")
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+_REPO_ROOT = Path(__file__).parent.parent
+
+
+def _load_memory_package():
+    pkg_dir = _REPO_ROOT / "openclaw-gateway" / "memory"
+    if str(pkg_dir.parent) not in sys.path:  # for the shared json_codec module
+        sys.path.insert(0, str(pkg_dir.parent))
+    spec = importlib.util.spec_from_file_location(
+        "oc_memory", pkg_dir / "__init__.py", submodule_search_locations=[str(pkg_dir)],
+    )
+    pkg = importlib.util.module_from_spec(spec)
+    sys.modules["oc_memory"] = pkg
+    spec.loader.exec_module(pkg)
+    return (
+        importlib.import_module("oc_memory.manager"),
+        importlib.import_module("oc_memory.backends"),
+    )
+
+
+def _fake_manager(db=None):
+    mod, _ = _load_memory_package()
+    files: dict[str, str] = {}
+    calls: list[str] = []
+
+    async def _dispatch(action: str, params: dict, *, confirmed: bool) -> dict:
+        calls.append(action)
+        path = params.get("file", "")
+        if action == "file_read":
+            if path not in files:
+                result = {"returncode": 1, "stdout": "", "stderr": "missing"}
+                return {"status": "ok", "result": result}
+            result = {"returncode": 0, "stdout": files[path], "stderr": ""}
+            return {"status": "ok", "result": result}
+        if action == "file_write":
+            files[path] = params["content"]
+        elif action == "append_file":
+            marker = params.get("unless_contains")
+            if not (marker and marker in files.get(path, "")):
+                files[path] = files.get(path, "") + params["content"]
+        return {"status": "ok", "result": {"returncode": 0, "stdout": "", "stderr": ""}}
+
+    manager = mod.MemoryManager(db=db, gateway_api_url="http://unused", dispatch=_dispatch)
+    return manager, files, calls
+
+
+@pytest.mark.asyncio
+async def test_initialize_registers_agent_once_without_reading_registry_back() -> None:
+    manager, files, calls = _fake_manager()
+    project = {"local_path": "C:\\proj", "display_name": "Proj"}
+
+    await manager.initialize_agent_memory("agent-1", "backend", project, {})
+    await manager.initialize_agent_memory("agent-1", "backend", project, {})
+    await manager.initialize_agent_memory("agent-2", "frontend", project, {})
+
+    registry = files["C:\\proj\\.openclaw\\agents.md"]
+    assert registry.count("| backend | agent-1 | idle |") == 1
+    assert registry.count("| frontend | agent-2 | idle |") == 1
+    assert registry.startswith("# Agent Registry — Proj")
+    # One idempotent append per call; the worker skips rows already listed.
+    assert calls.count("append_file") == 3
+
+
+@pytest.mark.asyncio
+async def test_registry_row_does_not_depend_on_reading_identity() -> None:
+    manager, files, calls = _fake_manager()
+    project = {"local_path": "C:\\proj", "display_name": "Proj"}
+    await manager.initialize_agent_memory("agent-1", "backend", project, {})
+
+    # A read failure makes identity.md look missing; the row is still not duplicated.
+    real_read = manager.backend.read
+
+    async def _failing_read(path: str):
+        return None
+
+    manager.backend.read = _failing_read
+    await manager.initialize_agent_memory("agent-1", "backend", project, {})
+    manager.backend.read = real_read
+    # A new agent for a role whose identity.md already exists is registered.
+    await manager.initialize_agent_memory("agent-3", "backend", project, {})
+
+    registry = files["C:\\proj\\.openclaw\\agents.md"]
+    assert registry.count("| backend | agent-1 | idle |") == 1
+    assert registry.count("| backend | agent-3 | idle |") == 1
+
+
+@pytest.mark.asyncio
+async def test_initialize_uses_the_project_path_separator() -> None:
+    manager, files, _ = _fake_manager()
+    project = {"local_path": "/home/me/proj/", "display_name": "Proj"}
+
+    await manager.initialize_agent_memory("agent-1", "backend", project, {"skills": ["python"]})
+
+    assert sorted(files) == [
+        "/home/me/proj/.openclaw/agents.md",
+        "/home/me/proj/.openclaw/agents/backend/heartbeat.md",
+        "/home/me/proj/.openclaw/agents/backend/identity.md",
+        "/home/me/proj/.openclaw/agents/backend/memory.md",
+        "/home/me/proj/.openclaw/memory.md",
+    ]
+    assert "## Skills\n- python\n\n" in files["/home/me/proj/.openclaw/agents/backend/identity.md"]
+
+
+@pytest.mark.asyncio
+async def test_context_is_cached_until_task_update(monkeypatch) -> None:
+    schema = _load_module(_REPO_ROOT / "openclaw-gateway" / "db" / "schema.py", "oc_memory_schema")
+    store = _load_module(_REPO_ROOT / "openclaw-gateway" / "db" / "store.py", "oc_memory_store")
+    # MemoryManager imports ``db.store`` lazily.
+    monkeypatch.setitem(sys.modules, "db", types.SimpleNamespace(store=store))
+    monkeypatch.setitem(sys.modules, "db.store", store)
+
+    db = await schema.init_db(":memory:")
+    try:
+        project = await store.create_project(db, "proj", "Proj", "C:\\proj")
+        agent_id = await store.create_agent(db, project["id"], "backend")
+        manager, files, calls = _fake_manager(db)
+        memory_path = "C:\\proj\\.openclaw\\agents\\backend\\memory.md"
+        files[memory_path] = "# Memory\n"
+
+        assert await manager.get_context_for_agent(agent_id, project["id"]) == "# Memory\n"
+        files[memory_path] = "changed behind our back"
+        assert await manager.get_context_for_agent(agent_id, project["id"]) == "# Memory\n"
+        assert calls.count("file_read") == 1
+
+        await manager.update_from_task(agent_id, project["id"], {"title": "T1"}, "done")
+        context = await manager.get_context_for_agent(agent_id, project["id"])
+        assert context.startswith("changed behind our back")
+        assert "T1" in context
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_sync_to_s3_discovers_agents_from_the_db(monkeypatch) -> None:
+    schema = _load_module(_REPO_ROOT / "openclaw-gateway" / "db" / "schema.py", "oc_memory_schema")
+    store = _load_module(_REPO_ROOT / "openclaw-gateway" / "db" / "store.py", "oc_memory_store")
+    monkeypatch.setitem(sys.modules, "db", types.SimpleNamespace(store=store))
+    monkeypatch.setitem(sys.modules, "db.store", store)
+
+    uploads: dict[str, bytes] = {}
+
+    class _S3:
+        async def upload(self, key: str, data: bytes, content_type: str = "") -> None:
+            uploads[key] = data
+
+    db = await schema.init_db(":memory:")
+    try:
+        project = await store.create_project(db, "proj", "Proj", "C:\\proj")
+        await store.create_agent(db, project["id"], "backend")
+        manager, files, calls = _fake_manager(db)
+        manager.s3 = _S3()
+        files["C:\\proj\\.openclaw\\memory.md"] = "shared"
+        files["C:\\proj\\.openclaw\\agents\\backend\\memory.md"] = "mine"
+
+        await manager.sync_to_s3(project["id"])
+
+        assert "list_directory" not in calls
+        bundle = json.loads(uploads["memory/proj/memory_bundle.json"])
+        assert bundle == {"memory.md": "shared", "agents/backend/memory.md": "mine"}
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_local_backend_keeps_memory_on_the_gateway_disk(tmp_path) -> None:
+    manager_mod, backends = _load_memory_package()
+    manager = manager_mod.MemoryManager(
+        db=None, gateway_api_url="http://unused", backend=backends.LocalMemoryBackend(),
+    )
+    project = {"local_path": str(tmp_path / "proj"), "display_name": "Proj"}
+
+    await manager.initialize_agent_memory("agent-1", "backend", project, {})
+    await manager.initialize_agent_memory("agent-1", "backend", project, {})
+
+    registry = (tmp_path / "proj" / ".openclaw" / "agents.md").read_text(encoding="utf-8")
+    assert registry.count("| backend | agent-1 | idle |") == 1
+    assert (tmp_path / "proj" / ".openclaw" / "agents" / "backend" / "identity.md").is_file()
+    assert await manager.backend.read(str(tmp_path / "missing.md")) is None
+
+
+@pytest.mark.asyncio
+async def test_update_from_task_reuses_cached_agent_location(monkeypatch) -> None:
+    schema = _load_module(_REPO_ROOT / "openclaw-gateway" / "db" / "schema.py", "oc_memory_schema")
+    store = _load_module(_REPO_ROOT / "openclaw-gateway" / "db" / "store.py", "oc_memory_store")
+    monkeypatch.setitem(sys.modules, "db", types.SimpleNamespace(store=store))
+    monkeypatch.setitem(sys.modules, "db.store", store)
+
+    lookups = {"agent": 0}
+    real_get_agent = store.get_agent
+
+    async def _counting_get_agent(db, agent_id):
+        lookups["agent"] += 1
+        return await real_get_agent(db, agent_id)
+
+    monkeypatch.setattr(store, "get_agent", _counting_get_agent)
+
+    db = await schema.init_db(":memory:")
+    try:
+        project = await store.create_project(db, "proj", "Proj", "C:\\proj")
+        agent_id = await store.create_agent(db, project["id"], "backend")
+        manager, files, _ = _fake_manager(db)
+        heartbeat = "C:\\proj\\.openclaw\\agents\\backend\\heartbeat.md"
+
+        await manager.update_from_task(agent_id, project["id"], {"title": "T1"}, "done")
+        assert "**Tasks completed**: 1" in files[heartbeat]
+        await manager.update_from_task(agent_id, project["id"], {"title": "T2"}, "done")
+        assert "**Tasks completed**: 2" in files[heartbeat]
+        assert lookups["agent"] == 1
+
+        await manager.update_from_task("missing", project["id"], {"title": "T3"}, "done")
+        await manager.update_from_task("missing", project["id"], {"title": "T3"}, "done")
+        assert lookups["agent"] == 2
+
+        manager.invalidate(agent_id=agent_id)
+        await manager.update_from_task(agent_id, project["id"], {"title": "T4"}, "done")
+        assert lookups["agent"] == 3
+
+        # Hits expire too, so a count bumped elsewhere is picked up again.
+        await store.update_agent(db, agent_id, tasks_completed_delta=10)
+        monkeypatch.setattr(sys.modules[type(manager).__module__], "_LOCATION_HIT_TTL", 0.0)
+        manager.invalidate()
+        await manager.update_from_task(agent_id, project["id"], {"title": "T5"}, "done")
+        await manager.update_from_task(agent_id, project["id"], {"title": "T6"}, "done")
+        assert lookups["agent"] == 5
+        assert "**Tasks completed**: 11" in files[heartbeat]
+    finally:
+        await db.close()
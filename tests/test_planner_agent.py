@@ -0,0 +1,84 @@
+"""PlannerAgent planning loop and plan-JSON extraction."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import types
+
+import pytest
+
+
+def _planner_module():
+    repo_root = Path(__file__).parent.parent
+    gateway_root = str(repo_root / "openclaw-gateway")
+    if gateway_root not in sys.path:
+        sys.path.insert(0, gateway_root)
+
+    from agents import planner_agent
+    return planner_agent
+
+
+def test_parse_plan_json_extracts_the_object_from_prose_and_fences() -> None:
+    mod = _planner_module()
+    parse = mod.PlannerAgent.parse_plan_json
+
+    assert parse('{"summary": "ok"}') == {"summary": "ok"}
+    assert parse('Plan:\n```json\n{"summary": "a {b}", "n": [1]}\n```\nDone {}') == {
+        "summary": "a {b}",
+        "n": [1],
+    }
+    # A brace-y preamble that isn't JSON is skipped for the real object.
+    assert parse('Use {placeholders} like this: {"summary": "x \\" }"}') == {
+        "summary": 'x " }',
+    }
+    assert parse("no json here") is None
+    assert parse('{"unterminated": ') is None
+
+
+def test_find_json_object_spans_a_single_balanced_object() -> None:
+    mod = _planner_module()
+    text = 'x {"a": {"b": "}"}} {"c": 1}'
+
+    begin, end = mod._find_json_object(text)
+    assert text[begin:end] == '{"a": {"b": "}"}}'
+    assert mod._find_json_object(text, end) == (end + 1, len(text))
+    assert mod._find_json_object("{ never closed") is None
+
+
+@pytest.mark.asyncio
+async def test_planning_loop_truncates_old_tool_results_past_the_budget(monkeypatch) -> None:
+    mod = _planner_module()
+    monkeypatch.setattr(mod, "_HISTORY_RESULT_BUDGET", 250)
+    sent: list[list[str]] = []
+
+    class _Router:
+        async def chat(self, messages, **kwargs):
+            sent.append([
+                block["content"]
+                for m in messages if isinstance(m["content"], list)
+                for block in m["content"] if block.get("type") == "tool_result"
+            ])
+            call = types.SimpleNamespace(
+                id=f"t{len(sent)}", name="web_search", input={"query": "q"},
+            )
+            return types.SimpleNamespace(text="", tool_calls=[call])
+
+    async def _search(action, params, confirmed):
+        return True, "r" * 100
+
+    prompt = [{"role": "user", "content": "plan it"}]
+    agent = mod.PlannerAgent(router=_Router(), run_agent_action=_search)
+    _, history = await agent.run_planning_conversation(
+        messages=prompt, system_prompt="sys", max_rounds=5,
+    )
+
+    assert [len(s) for s in sent] == [0, 1, 2, 3, 4]
+    # Newest three results fit the budget; anything older is truncated.
+    assert sent[-1] == ["[truncated]"] + ["r" * 100] * 3
+    assert history[0] is prompt[0] and prompt[0]["content"] == "plan it"
+    tool_uses = [b["id"] for m in history[1:] if m["role"] == "assistant" for b in m["content"]]
+    tool_results = [
+        b["tool_use_id"] for m in history[1:] if m["role"] == "user" for b in m["content"]
+    ]
+    assert tool_uses == tool_results
@@ -154,3 +154,161 @@ async def test_bootstrap_workspace_defers_on_ssh_key_error(monkeypatch) -> None:
         assert "directory: deferred" in summary.lower()
     finally:
         await db.close()
+
+
+@pytest.mark.asyncio
+async def test_create_project_strict_bootstrap_failure_removes_row(monkeypatch) -> None:
+    repo_root = Path(__file__).parent.parent
+    gateway_root = str(repo_root / "openclaw-gateway")
+    if gateway_root not in sys.path:
+        sys.path.insert(0, gateway_root)
+
+    from db import schema, store
+    from orchestrator.project_manager import ProjectManager
+    import bot_config as cfg
+
+    class _DummyRouter:
+        async def chat(self, *args, **kwargs):
+            raise RuntimeError("not used")
+
+    class _DummyScheduler:
+        gateway_url = "http://127.0.0.1:8766"
+
+    db = await schema.init_db(":memory:")
+    try:
+        monkeypatch.setattr(cfg, "AUTO_BOOTSTRAP_STRICT", True)
+        pm = ProjectManager(
+            db=db,
+            router=_DummyRouter(),
+            searcher=None,  # type: ignore[arg-type]
+            scheduler=_DummyScheduler(),  # type: ignore[arg-type]
+            project_base_dir="E:/MyProjects",
+        )
+
+        async def _fail_bootstrap(_project):
+            return ("git_init: failed (not a git binary)", False)
+
+        monkeypatch.setattr(pm, "_bootstrap_project_workspace", _fail_bootstrap)
+        with pytest.raises(ValueError, match="rolled back"):
+            await pm.create_project("kundi-kaadu")
+
+        assert await store.get_project_by_name(db, "kundi-kaadu") is None
+        assert await store.delete_project(db, "missing") is False
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_bootstrap_overlaps_readme_and_git_init(monkeypatch) -> None:
+    repo_root = Path(__file__).parent.parent
+    gateway_root = str(repo_root / "openclaw-gateway")
+    if gateway_root not in sys.path:
+        sys.path.insert(0, gateway_root)
+
+    import asyncio
+
+    from db import schema
+    from orchestrator.project_manager import ProjectManager
+    import bot_config as cfg
+
+    class _DummyRouter:
+        async def chat(self, *args, **kwargs):
+            raise RuntimeError("not used")
+
+    class _DummyScheduler:
+        gateway_url = "http://127.0.0.1:8766"
+
+    db = await schema.init_db(":memory:")
+    try:
+        monkeypatch.setattr(cfg, "AUTO_BOOTSTRAP_PROJECT", True)
+        monkeypatch.setattr(cfg, "AUTO_CREATE_GITHUB_REPO", False)
+        pm = ProjectManager(
+            db=db,
+            router=_DummyRouter(),
+            searcher=None,  # type: ignore[arg-type]
+            scheduler=_DummyScheduler(),  # type: ignore[arg-type]
+            project_base_dir="E:/MyProjects",
+        )
+        started: list[str] = []
+        both_started = asyncio.Event()
+
+        async def _run_agent_action(action, _params, *, confirmed, retry_on_transient=False):
+            del confirmed, retry_on_transient
+            started.append(action)
+            if action in ("file_write", "git_init"):
+                if {"file_write", "git_init"} <= set(started):
+                    both_started.set()
+                await asyncio.wait_for(both_started.wait(), timeout=1)
+            return (True, "")
+
+        monkeypatch.setattr(pm, "_run_agent_action", _run_agent_action)
+
+        project = {
+            "id": "proj-1",
+            "name": "demo",
+            "display_name": "Demo",
+            "local_path": r"E:\MyProjects\demo",
+        }
+        summary, ok = await pm._bootstrap_project_workspace(project)
+        assert ok is True
+        assert summary == (
+            "directory: ok; readme: ok; git_init: ok; git_add: ok; git_commit: ok"
+        )
+        assert started[0] == "create_directory"
+        assert started[-2:] == ["git_add_all", "git_commit"]
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_bootstrap_readme_failure_still_reports_git_init(monkeypatch) -> None:
+    repo_root = Path(__file__).parent.parent
+    gateway_root = str(repo_root / "openclaw-gateway")
+    if gateway_root not in sys.path:
+        sys.path.insert(0, gateway_root)
+
+    from db import schema
+    from orchestrator.project_manager import ProjectManager
+    import bot_config as cfg
+
+    class _DummyRouter:
+        async def chat(self, *args, **kwargs):
+            raise RuntimeError("not used")
+
+    class _DummyScheduler:
+        gateway_url = "http://127.0.0.1:8766"
+
+    db = await schema.init_db(":memory:")
+    try:
+        monkeypatch.setattr(cfg, "AUTO_BOOTSTRAP_PROJECT", True)
+        pm = ProjectManager(
+            db=db,
+            router=_DummyRouter(),
+            searcher=None,  # type: ignore[arg-type]
+            scheduler=_DummyScheduler(),  # type: ignore[arg-type]
+            project_base_dir="E:/MyProjects",
+        )
+        started: list[str] = []
+
+        async def _run_agent_action(action, _params, *, confirmed, retry_on_transient=False):
+            del confirmed, retry_on_transient
+            started.append(action)
+            if action == "file_write":
+                return (False, "disk full")
+            return (True, "")
+
+        monkeypatch.setattr(pm, "_run_agent_action", _run_agent_action)
+
+        project = {
+            "id": "proj-1",
+            "name": "demo",
+            "display_name": "Demo",
+            "local_path": r"E:\MyProjects\demo",
+        }
+        summary, ok = await pm._bootstrap_project_workspace(project)
+        # The repo was created even though the README was not; say so.
+        assert ok is False
+        assert summary == "directory: ok; readme: failed (disk full); git_init: ok"
+        assert "git_add_all" not in started
+    finally:
+        await db.close()
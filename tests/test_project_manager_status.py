@@ -0,0 +1,288 @@
+"""ProjectManager behavior against an in-memory store and a local /action server."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import json
+import sys
+import types
+
+import pytest
+
+
+def _gateway_imports():
+    repo_root = Path(__file__).parent.parent
+    gateway_root = str(repo_root / "openclaw-gateway")
+    if gateway_root not in sys.path:
+        sys.path.insert(0, gateway_root)
+
+    from db import schema, store
+    from orchestrator.project_manager import ProjectManager
+    return schema, store, ProjectManager
+
+
+class _DummyRouter:
+    async def chat(self, *args, **kwargs):
+        raise RuntimeError("not used")
+
+
+class _DummyScheduler:
+    gateway_url = "http://127.0.0.1:8766"
+    memory_manager = None
+
+    def is_running(self, project_id: str) -> bool:
+        return False
+
+    def cancel(self, project_id: str) -> bool:
+        return False
+
+
+def _pm(db, ProjectManager):
+    return ProjectManager(
+        db=db,
+        router=_DummyRouter(),
+        searcher=None,  # type: ignore[arg-type]
+        scheduler=_DummyScheduler(),  # type: ignore[arg-type]
+        project_base_dir="E:/MyProjects",
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_status_reports_progress_and_recent_events() -> None:
+    schema, store, ProjectManager = _gateway_imports()
+
+    db = await schema.init_db(":memory:")
+    try:
+        pm = _pm(db, ProjectManager)
+        project = await store.create_project(db, "demo", "Demo", "E:/MyProjects/demo")
+        _, task_ids = await store.create_active_plan(
+            db, project["id"], "v1", [], [],
+            [{"title": "a"}, {"title": "b"}, {"title": "c"}, {"title": "d"}],
+        )
+        await store.update_task(db, task_ids[0], status="completed")
+        await store.update_task(db, task_ids[2], status="in_progress")
+        await store.add_event(db, project["id"], "created", "Project created")
+
+        status = await pm.get_status(project["id"])
+
+        assert status["project"]["id"] == project["id"]
+        assert (status["progress"], status["percent"]) == ("1/4", 25)
+        assert status["current_task"] == "c"
+        assert [e["event_type"] for e in status["recent_events"]] == ["created"]
+        assert status["is_running"] is False
+        quick = await pm.get_status(project["id"], include_events=False)
+        assert (quick["progress"], quick["recent_events"]) == ("1/4", [])
+
+        assert await store.get_task_progress(db, "missing") == (0, 0, None)
+        with pytest.raises(ValueError):
+            await pm.get_status("missing")
+    finally:
+        await store.flush(db)
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_oracle_reuses_cached_assignments_for_similar_plans() -> None:
+    schema, store, ProjectManager = _gateway_imports()
+
+    class _Router:
+        def __init__(self) -> None:
+            self.calls: list[str] = []
+
+        async def chat(self, messages, **kwargs):
+            content = messages[0]["content"]
+            self.calls.append(content)
+            tasks = json.loads(content.split("Tasks:\n", 1)[1].split("\n\nAssign", 1)[0])
+            roles = {"Build the API": "backend", "Landing page": "frontend"}
+            return types.SimpleNamespace(text=json.dumps({"assignments": [
+                {"task_id": str(t["id"]), "role": roles.get(t["title"], "nope")}
+                for t in tasks
+            ] + [{"task_id": "made-up", "role": "frontend"}]}))
+
+    db = await schema.init_db(":memory:")
+    try:
+        pm = _pm(db, ProjectManager)
+        router = pm.router = _Router()
+        stack = {"backend": "FastAPI"}
+
+        async def _assign(project_id, plan_id, tech_stack):
+            tasks = await store.get_tasks(
+                db, project_id, plan_id, columns=("title", "description"),
+            )
+            rows = await pm._oracle_roles(project_id, tasks, tech_stack)
+            await store.update_project_and_task_roles(db, project_id, rows)
+            return tasks, rows
+
+        first = await store.create_project(db, "one", "One", "E:/MyProjects/one")
+        plan_one, _ = await store.create_active_plan(
+            db, first["id"], "v1", [], [], [{"title": "Build the API"}, {"title": "Landing page"}],
+        )
+        await _assign(first["id"], plan_one["id"], stack)
+
+        second = await store.create_project(db, "two", "Two", "E:/MyProjects/two")
+        plan_two, _ = await store.create_active_plan(
+            db, second["id"], "v1", [], [],
+            [{"title": "build API"}, {"title": "Landing Page"}, {"title": "Write docs"}],
+        )
+        await _assign(second["id"], plan_two["id"], stack)
+
+        assert len(router.calls) == 2
+        assert "Write docs" in router.calls[1] and "Landing" not in router.calls[1]
+        rows = await store.get_tasks(db, second["id"], columns=("assigned_agent_role",))
+        assert [r["assigned_agent_role"] for r in rows] == ["backend", "frontend", "backend"]
+
+        # A different tech stack is a different cache key.  Hallucinated
+        # task IDs never become (role, task_id) rows.
+        tasks, rows = await _assign(second["id"], plan_two["id"], {"backend": "Django"})
+        assert len(router.calls) == 3
+        assert sorted(task_id for _, task_id in rows) == sorted(t["id"] for t in tasks)
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_add_idea_returns_running_count() -> None:
+    schema, store, ProjectManager = _gateway_imports()
+
+    db = await schema.init_db(":memory:")
+    try:
+        pm = _pm(db, ProjectManager)
+        project = await store.create_project(db, "demo", "Demo", "E:/MyProjects/demo")
+        other = await store.create_project(db, "other", "Other", "E:/MyProjects/other")
+        await pm.add_idea(other["id"], "unrelated")
+
+        assert await pm.add_idea(project["id"], "first") == 1
+        assert await pm.add_idea(project["id"], "second") == 2
+        # Counts are per project.
+        assert await store.add_idea_and_count(db, other["id"], "more") == 2
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_lifecycle_commands_validate_project_status() -> None:
+    schema, store, ProjectManager = _gateway_imports()
+
+    db = await schema.init_db(":memory:")
+    try:
+        pm = _pm(db, ProjectManager)
+        project = await store.create_project(db, "demo", "Demo", "E:/MyProjects/demo")
+
+        with pytest.raises(ValueError, match="Project not found"):
+            await pm.approve_plan("missing")
+        with pytest.raises(ValueError, match="Cannot start: project is in 'ideation' status"):
+            await pm.start_execution(project["id"])
+
+        await pm.approve_plan(project["id"])
+        with pytest.raises(ValueError, match="Cannot approve: project is in 'approved' status"):
+            await pm.approve_plan(project["id"])
+        with pytest.raises(ValueError, match="'approved' status, not ideation"):
+            await pm.add_idea(project["id"], "late idea")
+
+        invalidated: list[dict] = []
+        pm.scheduler.memory_manager = types.SimpleNamespace(
+            invalidate=lambda **kwargs: invalidated.append(kwargs),
+        )
+        removed = await pm.remove_project(project["id"])
+        assert removed["id"] == project["id"]
+        assert invalidated == [{"project_id": project["id"]}]
+        assert await store.get_project(db, project["id"]) is None
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_agent_action_posts_json_over_the_shared_session() -> None:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    schema, _, ProjectManager = _gateway_imports()
+    seen: list[tuple[str, dict]] = []
+
+    async def _action(request: web.Request) -> web.Response:
+        seen.append((request.content_type, await request.json()))
+        return web.json_response(
+            {"status": "ok", "result": {"returncode": 0, "stdout": " done \n", "stderr": ""}},
+        )
+
+    app = web.Application()
+    app.router.add_post("/action", _action)
+    server = TestServer(app)
+    await server.start_server()
+    db = await schema.init_db(":memory:")
+    try:
+        pm = _pm(db, ProjectManager)
+        pm.scheduler.gateway_url = str(server.make_url("")).rstrip("/")
+
+        assert await pm._run_agent_action(
+            "git_init", {"working_dir": "/p"}, confirmed=True,
+        ) == (True, "done")
+        first_session = pm._http
+        assert (first_session.timeout.connect, first_session.timeout.sock_connect) == (None, 5)
+        assert await pm._run_agent_action(
+            "git_status", {"working_dir": "/p"}, confirmed=False,
+        ) == (True, "done")
+
+        assert pm._http is first_session
+        assert seen == [
+            ("application/json", {
+                "action": "git_init", "params": {"working_dir": "/p"}, "confirmed": True,
+            }),
+            ("application/json", {
+                "action": "git_status", "params": {"working_dir": "/p"}, "confirmed": False,
+            }),
+        ]
+    finally:
+        await pm.close()
+        await server.close()
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_generate_plan_stores_plan_roles_and_project_fields(monkeypatch) -> None:
+    schema, store, ProjectManager = _gateway_imports()
+
+    plan_json = json.dumps({
+        "summary": "A todo app",
+        "tech_stack": {"backend": "FastAPI"},
+        "milestones": [{"name": "M1", "tasks": [
+            {"title": "Build the API", "description": "REST"},
+            {"title": "Landing page"},
+        ]}],
+    })
+
+    class _Router:
+        async def chat(self, messages, **kwargs):
+            prompt = messages[0]["content"]
+            tasks = json.loads(prompt.split("Tasks:\n", 1)[1].split("\n\nAssign", 1)[0])
+            roles = {"Build the API": "backend", "Landing page": "frontend"}
+            return types.SimpleNamespace(text=json.dumps({"assignments": [
+                {"task_id": t["id"], "role": roles[t["title"]]} for t in tasks
+            ]}))
+
+    db = await schema.init_db(":memory:")
+    try:
+        pm = _pm(db, ProjectManager)
+        pm.router = _Router()
+
+        async def _planning(*, messages, system_prompt):
+            assert "- a todo app" in messages[0]["content"]
+            return plan_json, messages
+
+        monkeypatch.setattr(pm.planner_agent, "run_planning_conversation", _planning)
+        project = await store.create_project(db, "demo", "Demo", "E:/MyProjects/demo")
+        await store.add_idea(db, project["id"], "a todo app")
+
+        plan = await pm.generate_plan(project["id"])
+
+        assert plan["summary"] == "A todo app"
+        assert plan["plan_spec"]["project_id"] == project["id"]
+        stored = await store.get_project(db, project["id"])
+        assert stored["status"] == "planning"
+        assert json.loads(stored["tech_stack"]) == {"backend": "FastAPI"}
+        rows = await store.get_tasks(db, project["id"], columns=("title", "assigned_agent_role"))
+        assert [(r["title"], r["assigned_agent_role"]) for r in rows] == [
+            ("Build the API", "backend"), ("Landing page", "frontend"),
+        ]
+    finally:
+        await db.close()
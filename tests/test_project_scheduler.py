@@ -0,0 +1,69 @@
+"""Project Scheduler bookkeeping with a stub worker."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import asyncio
+import sys
+
+import pytest
+
+
+def _scheduler_module():
+    repo_root = Path(__file__).parent.parent
+    gateway_root = str(repo_root / "openclaw-gateway")
+    if gateway_root not in sys.path:
+        sys.path.insert(0, gateway_root)
+
+    from orchestrator import scheduler
+    return scheduler
+
+
+class _StubWorker:
+    def __init__(self, *, pause_event, cancel_event, **kwargs):
+        self.pause_event = pause_event
+        self.cancel_event = cancel_event
+
+    async def run(self) -> None:
+        await self.cancel_event.wait()
+
+
+async def _noop(*args, **kwargs):
+    return True
+
+
+@pytest.mark.asyncio
+async def test_scheduler_tracks_runs_until_the_worker_finishes(monkeypatch) -> None:
+    mod = _scheduler_module()
+    monkeypatch.setattr(mod, "Worker", _StubWorker)
+    scheduler = mod.Scheduler(
+        db=None, router=None, searcher=None,  # type: ignore[arg-type]
+        gateway_api_url="http://unused",
+        on_progress=_noop, request_approval=_noop, max_parallel=2,
+    )
+
+    await scheduler.submit("p1")
+    await scheduler.submit("p2")
+    assert scheduler.running_count == 2
+    with pytest.raises(RuntimeError, match="already running"):
+        await scheduler.submit("p1")
+    with pytest.raises(RuntimeError, match="Max parallel"):
+        await scheduler.submit("p3")
+
+    assert scheduler.pause("p1") is True
+    assert not scheduler._running["p1"].pause.is_set()
+    assert scheduler.resume("p1") is True
+    assert scheduler._running["p1"].pause.is_set()
+    assert scheduler.pause("missing") is False
+
+    assert scheduler.cancel("p1") is True
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert not scheduler.is_running("p1")
+    assert scheduler.is_running("p2")
+
+    assert scheduler.cancel_all() == 1
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert scheduler.running_count == 0
+    assert scheduler.cancel("p2") is False
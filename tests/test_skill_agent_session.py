@@ -0,0 +1,51 @@
+"""SkillContext.send_to_agent against a local /action server."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_send_to_agent_reuses_the_shared_session() -> None:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    repo_root = Path(__file__).parent.parent
+    gateway_root = str(repo_root / "openclaw-gateway")
+    if gateway_root not in sys.path:
+        sys.path.insert(0, gateway_root)
+
+    from skills import base
+
+    async def _action(request: web.Request) -> web.Response:
+        body = await request.json()
+        return web.json_response(
+            {"status": "ok", "result": {"returncode": 0, "stdout": body["action"], "stderr": ""}},
+        )
+
+    app = web.Application()
+    app.router.add_post("/action", _action)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        context = base.SkillContext(
+            project_id="p1",
+            project_path="/p",
+            gateway_api_url=str(server.make_url("")).rstrip("/"),
+        )
+        assert await context.send_to_agent("git_status", {}) == "git_status\n[exit code: 0]"
+        session = base.agent_session()
+        assert await context.send_to_agent("git_diff", {}, include_exit_code=False) == "git_diff"
+        assert base.agent_session() is session
+        # Only connection setup is bounded, not queueing for a pooled slot.
+        assert (session.timeout.connect, session.timeout.sock_connect) == (None, 5)
+
+        await base.close_agent_session()
+        assert session.closed
+        assert base.agent_session() is not session
+    finally:
+        await base.close_agent_session()
+        await server.close()
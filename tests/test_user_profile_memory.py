@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 import importlib.util
+import sys
 
 import pytest
 
@@ -13,6 +14,10 @@ def _load_module(path: Path, module_name: str):
     if spec is None or spec.loader is None:
         raise RuntimeError(f"Unable to load module from {path}")
     mod = importlib.util.module_from_spec(spec)
+    # Gateway modules import shared helpers (json_codec) from the gateway root.
+    gateway_root = str(path.parents[1])
+    if gateway_root not in sys.path:
+        sys.path.insert(0, gateway_root)
     spec.loader.exec_module(mod)
     return mod
 